@@ -1,5 +1,12 @@
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import numpy as np
 
+import cpso
+import pso
+
 class Bench () :
     """
     Class that benchmarks a PSO variant. Implements the following metrics -
@@ -32,68 +39,134 @@ class Bench () :
         """ Returns the objective function for single domain point """
         return lambda x : self.obj(x.reshape(1, -1))[0]
 
-    def eval (self, runs, succ_tol=1e-2, print_iters=False) :
-        """ Evaluates the optimizer and computes benchmark properties """
+    def run (self, seed=None, print_iters=False) :
+        """
+        Performs one run of the optimizer and returns its metrics. If a seed
+        is given, the global numpy generator (used by the optimizers and the
+        chaotic maps) is seeded with it first
+        """
 
-        # Running specs
-        rspec = {
-            'iters'         : [],
-            'minima'        : [],
-            'mean_fitness'  : [],
-            'no_conv'       : [],
-            'min_err'       : [],
-            'argmin_err'    : [],
-        }
+        if seed is not None : np.random.seed(seed)
 
-        min_conv_curve, max_conv_curve = None, None
-        min_iters, max_iters = np.inf, 0
+        mizer = self.pso_class(self.obj, self.llim, self.rlim, self.Np)
+        return self.result(mizer.optimize(print_iters=print_iters))
 
-        for i in range(runs) :
-            if not print_iters : print(f"Run {i+1}")
+    def runStacked (self, runs, seed=None, print_iters=False) :
+        """
+        Performs all the runs at once as the stacked swarms of pso.StackedPSO
+        and returns the list of their metrics. Only plain PSO can be stacked
+        """
 
-            mizer = self.pso_class(self.obj, self.llim, self.rlim, self.Np)
-            retpack = mizer.optimize(print_iters=print_iters)
+        if self.pso_class is not pso.PSO :
+            raise Exception('Stacked runs are only supported for pso.PSO, not {}'.format(self.pso_class.__name__))
 
-            opt = retpack['rets'][0]
-            iters = retpack['kwrets']['iters']
-            opt_val = self.objkey(opt)
+        if seed is not None : np.random.seed(seed)
 
-            rspec['iters'].append(iters)
-            rspec['minima'].append(opt_val)
-            rspec['mean_fitness'].append(
-                np.mean(self.obj(retpack['kwrets']['particles']))
-            )
-            rspec['no_conv'].append(retpack['kwrets']['no_conv'])
-            rspec['min_err'].append(opt_val - self.min)
-            rspec['argmin_err'].append(np.min(
-                np.linalg.norm(opt - self.argmins, axis=1)
-            ))
-
-            if iters < min_iters :
-                min_conv_curve = retpack['kwrets']['conv_curve']
-                min_iters = iters
-            if iters > max_iters :
-                max_conv_curve = retpack['kwrets']['conv_curve']
-                max_iters = iters
+        mizer = pso.StackedPSO(self.obj, self.llim, self.rlim, self.Np, runs)
+        return [self.result(retpack) for retpack in mizer.optimize(print_iters=print_iters)]
+
+    def result (self, retpack) :
+        """ Metrics of a run from what the optimizer returned """
+
+        opt = retpack['rets'][0]
+        opt_val = self.objkey(opt)
+
+        return {
+            'iters'         : retpack['kwrets']['iters'],
+            'minima'        : opt_val,
+            'mean_fitness'  : np.mean(self.obj(retpack['kwrets']['particles'])),
+            'no_conv'       : retpack['kwrets']['no_conv'],
+            'min_err'       : opt_val - self.min,
+            'argmin_err'    : np.min(np.linalg.norm(opt - self.argmins, axis=1)),
+            'conv_curve'    : retpack['kwrets']['conv_curve']
+        }
+
+    def eval (self, runs, succ_tol=1e-2, print_iters=False, stacked=False) :
+        """
+        Evaluates the optimizer and computes benchmark properties. With
+        stacked, all the runs are performed at once by runStacked()
+        """
+
+        # Running specs
+        rspec = {s : [] for s in Metrics.names}
+        metrics = Metrics(succ_tol)
+
+        results = self.runStacked(runs, print_iters=print_iters) if stacked else None
+        for i in range(runs) :
+            if results is not None :
+                result = results[i]
+            else :
+                if not print_iters : print(f"Run {i+1}")
+                result = self.run(print_iters=print_iters)
+
+            metrics.add(i, result)
+            for s in Metrics.names :
+                rspec[s].append(result[s])
 
         rspec = {
             s : np.array(arr)
             for s, arr in rspec.items()
         }
 
+        self.spec['rspec'] = rspec
+        self.spec['ospec'] = metrics.ospec()
+
+        return self.spec
+
+
+class Metrics () :
+    """
+    Aggregates the metrics of the runs of a benchmark incrementally, one run
+    at a time and in any order, keeping running means and variances (Welford)
+    """
+
+    names = ['iters', 'minima', 'mean_fitness', 'no_conv', 'min_err', 'argmin_err']
+
+    def __init__ (self, succ_tol=1e-2) :
+
+        self.succ_tol = succ_tol
+        self.runs = 0
+        self.succ = 0
+        self.mean = dict.fromkeys(Metrics.names, 0.0)
+        self.m2 = dict.fromkeys(Metrics.names, 0.0)
+
+        # (key, curve) of the runs with the fewest and the most iterations,
+        # the first run winning the ties as in a sequential evaluation
+        self.min_curve = None
+        self.max_curve = None
+
+    def add (self, run, result) :
+        """ Adds the metrics of a run (indexed from 0) """
+
+        self.runs += 1
+        for s in Metrics.names :
+            delta = result[s] - self.mean[s]
+            self.mean[s] += delta/self.runs
+            self.m2[s] += delta*(result[s] - self.mean[s])
+
+        self.succ += result['argmin_err'] < self.succ_tol
+
+        iters, curve = result['iters'], result['conv_curve']
+        if self.min_curve is None or (iters, run) < self.min_curve[0] :
+            self.min_curve = ((iters, run), curve)
+        if self.max_curve is None or (iters, -run) > self.max_curve[0] :
+            self.max_curve = ((iters, -run), curve)
+
+    def ospec (self) :
+        """ Overall specs of the runs added so far """
+
         ospec = {
-            'mean_' + s : np.mean(arr)
-            for s, arr in rspec.items()
+            'mean_' + s : self.mean[s]
+            for s in Metrics.names
         }
 
-        ospec['std_iters'] = np.std(rspec['iters'], ddof=1)
-        ospec['std_minima'] = np.std(rspec['minima'], ddof=1)
-        ospec['conv_curves'] = (min_conv_curve, max_conv_curve)
-        ospec['succ_ratio'] = np.sum(rspec['argmin_err'] < succ_tol)/runs
-        self.spec['rspec'] = rspec
-        self.spec['ospec'] = ospec
+        std = lambda s : np.sqrt(self.m2[s]/(self.runs - 1)) if self.runs > 1 else np.nan
+        ospec['std_iters'] = std('iters')
+        ospec['std_minima'] = std('minima')
+        ospec['conv_curves'] = (self.min_curve[1], self.max_curve[1]) if self.runs else (None, None)
+        ospec['succ_ratio'] = self.succ/self.runs if self.runs else np.nan
 
-        return self.spec
+        return ospec
 
 
 class Sphere (Bench) :
@@ -107,7 +180,7 @@ class Sphere (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for sphere benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Sphere"
         self.dims = dims
         self.llim, self.rlim = np.repeat(-1000, dims), np.repeat(1000, dims)
@@ -136,7 +209,7 @@ class Matyas (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for matyas benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Matyas"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-10, 2), np.repeat(10, 2)
@@ -164,7 +237,7 @@ class Bulkin (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor of bulkin benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Bulkin"
         self.dims = 2
         self.llim, self.rlim = np.array([-15, -3]), np.array([-5, 3])
@@ -195,7 +268,7 @@ class Schaffer2 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for schaffer2 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Schaffer-2"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-100, 2), np.repeat(100, 2)
@@ -226,7 +299,7 @@ class Schaffer4 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for schaffer4 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Schaffer-4"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-100, 2), np.repeat(100, 2)
@@ -261,7 +334,7 @@ class Schaffer6 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for schaffer4 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Schaffer-6"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-100, 2), np.repeat(100, 2)
@@ -291,7 +364,7 @@ class Griewank (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for greiwank benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Griewank"
         self.dims = dims
         self.llim, self.rlim = np.repeat(-600, dims), np.repeat(600, dims)
@@ -324,7 +397,7 @@ class Rastrigin (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for rastrigin benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Rastrigin"
         self.dims = dims
         self.llim, self.rlim = np.repeat(-5.12, dims), np.repeat(5.12, dims)
@@ -357,7 +430,7 @@ class RosenbrockND (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for rosenbrockND benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "RosenbrockND"
         self.dims = dims
         self.llim, self.rlim = np.repeat(-1000, dims), np.repeat(1000, dims)
@@ -385,7 +458,7 @@ class Rosenbrock2D (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for rosenbrock2D benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Rosenbrock2D"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-1000, 2), np.repeat(1000, 2)
@@ -413,7 +486,7 @@ class Alpine (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for alpine benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Alpine"
         self.dims = dims
         self.llim, self.rlim = np.repeat(0, dims), np.repeat(10, dims)
@@ -442,7 +515,7 @@ class Ackley (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for ackley benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Ackley"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-5, 2), np.repeat(5, 2)
@@ -472,7 +545,7 @@ class Beale (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for beale benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Beale"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-4.5, 2), np.repeat(4.5, 2)
@@ -503,7 +576,7 @@ class Goldstein (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for goldstein benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Goldstein"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-2, 2), np.repeat(2, 2)
@@ -532,7 +605,7 @@ class Booth (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for booth benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Booth"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-10, 2), np.repeat(10, 2)
@@ -560,7 +633,7 @@ class Eggholder (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for eggholder benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Eggholder"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-512, 2), np.repeat(512, 2)
@@ -595,7 +668,7 @@ class Easom (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for easom benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Easom"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-100, 2), np.repeat(100, 2)
@@ -628,7 +701,7 @@ class McCormick (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for mccormick benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "McCormick"
         self.dims = 2
         self.llim, self.rlim = np.array([-1.5, 3]), np.array([4, 4])
@@ -656,7 +729,7 @@ class Styblinski (Bench) :
     def __init__ (self, pso_class, dims, Np=25) :
         """ Constructor for styblinski benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Styblinski"
         self.dims = dims
         self.llim, self.rlim = np.repeat(-5, dims), np.repeat(5, dims)
@@ -683,7 +756,7 @@ class Holdertable (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for holdertable benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Holdertable"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-10, 2), np.repeat(10, 2)
@@ -718,7 +791,7 @@ class Crossintray (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for crossintray benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Crossintray"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-10, 2), np.repeat(10, 2)
@@ -754,7 +827,7 @@ class Threehumpcamel (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for threehumpcamel benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Threehumpcamel"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-5, 2), np.repeat(5, 2)
@@ -785,7 +858,7 @@ class Himmelblau (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for himmelblau benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Himmelblau"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-5, 2), np.repeat(5, 2)
@@ -819,7 +892,7 @@ class Levi (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for himmelblau benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Levi"
         self.dims = 2
         self.llim, self.rlim = np.repeat(-10, 2), np.repeat(10, 2)
@@ -849,7 +922,7 @@ class Anuwu (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for anuwu benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Anuwu"
         self.dims = 1
         self.llim, self.rlim = np.array([-20]), np.array([20])
@@ -859,7 +932,7 @@ class Anuwu (Bench) :
     @property
     def obj (self) :
         """ Objective function """
-        return lambda x : 0.025*np.square(x) + np.sin(x)
+        return lambda x : np.sum(0.025*np.square(x) + np.sin(x), axis=1)
 
     @property
     def objder (self) :
@@ -878,7 +951,7 @@ class Ada1 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for ada1 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Ada1"
         self.dims = 1
         self.llim, self.rlim = np.array([-20]), np.array([20])
@@ -888,7 +961,7 @@ class Ada1 (Bench) :
     @property
     def obj (self) :
         """ Objective function """
-        return lambda x : -(3*np.power(x,5) - np.power(x,10))
+        return lambda x : np.sum(-(3*np.power(x,5) - np.power(x,10)), axis=1)
 
     @property
     def objder (self) :
@@ -907,7 +980,7 @@ class Ada2 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for ada2 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Ada2"
         self.dims = 1
         self.llim, self.rlim = np.array([0]), np.array([10])
@@ -917,7 +990,7 @@ class Ada2 (Bench) :
     @property
     def obj (self) :
         """ Objective function """
-        return lambda x : np.power(x,3) - 3*np.power(x,2) + 7
+        return lambda x : np.sum(np.power(x,3) - 3*np.power(x,2) + 7, axis=1)
 
     @property
     def objder (self) :
@@ -936,7 +1009,7 @@ class Ada3 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for ada3 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Ada3"
         self.dims = 1
         self.llim, self.rlim = np.array([-1]), np.array([1])
@@ -946,7 +1019,7 @@ class Ada3 (Bench) :
     @property
     def obj (self) :
         """ Objective function """
-        return lambda x : (lambda x2 : -np.exp(np.cos(x2)) + x2)(np.square(x))
+        return lambda x : np.sum((lambda x2 : -np.exp(np.cos(x2)) + x2)(np.square(x)), axis=1)
 
     @property
     def objder (self) :
@@ -967,7 +1040,7 @@ class Ada4 (Bench) :
     def __init__ (self, pso_class, Np=25) :
         """ Constructor for ada4 benchmark function """
 
-        super().__init__(pso_class)
+        super().__init__(pso_class, Np)
         self.obj_str = "Ada4"
         self.dims = 1
         self.llim, self.rlim = np.array([0]), np.array([1])
@@ -977,7 +1050,7 @@ class Ada4 (Bench) :
     @property
     def obj (self) :
         """ Objective function """
-        return lambda x : np.power(x,15) - np.sin(x) + np.exp(np.power(x,6))
+        return lambda x : np.sum(np.power(x,15) - np.sin(x) + np.exp(np.power(x,6)), axis=1)
 
     @property
     def objder (self) :
@@ -1032,3 +1105,144 @@ test_benches = {
     'rosenbrockND'      : lambda p, dims=5      : RosenbrockND(p, dims),
     'alpine'            : lambda p, dims=5      : Alpine(p, dims),
 }
+
+# Every benchmark function, including the one-dimensional ones
+every_bench = dict(all_benches, **{
+    'anuwu'             : lambda p              : Anuwu(p),
+    'ada1'              : lambda p              : Ada1(p),
+    'ada2'              : lambda p              : Ada2(p),
+    'ada3'              : lambda p              : Ada3(p),
+    'ada4'              : lambda p              : Ada4(p),
+})
+
+all_optimizers = {
+    'pso'               : pso.PSO,
+    'empso'             : cpso.EMPSO,
+    'hecs_pso'          : cpso.HECS_PSO,
+    'pwlc_pso'          : cpso.PWLC_PSO,
+    'pwlc_empso'        : cpso.PWLC_EMPSO,
+}
+
+
+def benchRun (bench, seed, run) :
+    """ Performs a run of a benchmark in a worker process """
+
+    return run, bench.run(seed)
+
+def cellSeeds (seed, bench_name, optimizer_name, runs) :
+    """
+    Seeds of the runs of a (benchmark, optimizer) cell. They are spawned from
+    the names, so they do not depend on the rest of the grid
+    """
+
+    root = np.random.SeedSequence(seed, spawn_key=(
+        zlib.crc32(bench_name.encode()), zlib.crc32(optimizer_name.encode())
+    ))
+    return [child.generate_state(4) for child in root.spawn(runs)]
+
+def saveCell (file, results, seed, Np) :
+    """
+    Writes the results {run : result} of a cell as columns, the convergence
+    curves being concatenated with the offsets of every run. The root seed
+    and the swarm size are stored with them (-1 standing for a None seed)
+    """
+
+    runs = sorted(results)
+    curves = [results[r]['conv_curve'] for r in runs]
+
+    np.savez(file,
+             run=np.array(runs),
+             seed=np.array(-1 if seed is None else seed),
+             Np=np.array(Np),
+             conv_curve=np.concatenate(curves),
+             conv_offsets=np.cumsum([0] + [len(c) for c in curves]),
+             **{s : np.array([results[r][s] for r in runs]) for s in Metrics.names})
+
+def loadCell (file, seed, Np) :
+    """
+    Reads the results {run : result} of a cell written by saveCell(). They
+    are only returned if they were obtained with the same root seed and swarm
+    size, an empty dict being returned otherwise (e.g., for files written
+    before they were stored)
+    """
+
+    with np.load(file) as data :
+        if seed is None or 'seed' not in data or 'Np' not in data :
+            return {}
+        if not np.array_equal(data['seed'], np.array(seed)) or int(data['Np']) != Np :
+            return {}
+
+        offsets = data['conv_offsets']
+        return {
+            int(r) : dict(
+                {s : data[s][i] for s in Metrics.names},
+                conv_curve=data['conv_curve'][offsets[i]:offsets[i+1]]
+            )
+            for i, r in enumerate(data['run'])
+        }
+
+def sweep (path, runs, benches=every_bench, optimizers=all_optimizers, seed=0,
+           workers=None, Np=25, succ_tol=1e-2) :
+    """
+    Runs every optimizer on every benchmark function in a process pool and
+    returns the overall specs {(bench, optimizer) : ospec}
+        path        - Directory of the results. Every (bench, optimizer) cell
+                    is written to <bench>-<optimizer>.npz as soon as its runs
+                    are over, with the seed and Np. The cells already written
+                    with the same seed and Np are loaded instead of being run
+                    again, so an interrupted sweep can be resumed, and those
+                    with fewer runs are extended with the missing ones. The
+                    other cells are run again and overwritten
+        runs        - Number of runs per cell
+        benches     - {name : lambda pso_class : Bench} benchmark functions
+        optimizers  - {name : PSO class} optimizers
+        seed        - Root seed. Every run gets its own seed stream, so the
+                    results do not depend on the number of workers (nor on
+                    the number of runs). With None, the cells are never reused
+        workers     - Number of worker processes (number of CPUs by default)
+    """
+
+    os.makedirs(path, exist_ok=True)
+
+    metrics, results, specs = {}, {}, {}
+    with ProcessPoolExecutor(max_workers=workers) as executor :
+        futures = {}
+        for bench_name in benches :
+            for optimizer_name in optimizers :
+                cell = (bench_name, optimizer_name)
+                file = os.path.join(path, "{}-{}.npz".format(*cell))
+                metrics[cell] = Metrics(succ_tol)
+                results[cell] = {}
+
+                # The seed of a run only depends on its index, so the runs on
+                # disk are the first ones of the requested set
+                if os.path.exists(file) :
+                    for run, result in sorted(loadCell(file, seed, Np).items())[:runs] :
+                        results[cell][run] = result
+                        metrics[cell].add(run, result)
+
+                if len(results[cell]) == runs :
+                    del results[cell]
+                    specs[cell] = metrics[cell].ospec()
+                    continue
+
+                bench = benches[bench_name](optimizers[optimizer_name])
+                bench.Np = Np
+
+                for run, run_seed in enumerate(cellSeeds(seed, bench_name, optimizer_name, runs)) :
+                    if run not in results[cell] :
+                        futures[executor.submit(benchRun, bench, run_seed, run)] = (cell, file)
+
+        for future in as_completed(futures) :
+            cell, file = futures[future]
+            run, result = future.result()
+
+            results[cell][run] = result
+            metrics[cell].add(run, result)
+
+            if len(results[cell]) == runs :
+                saveCell(file, results.pop(cell), seed, Np)
+                specs[cell] = metrics[cell].ospec()
+                print("{} {} done".format(*cell))
+
+    return specs
@@ -132,10 +132,9 @@ class EMPSO (pso.PSO) :
             self.particles, self.velocity = pso.ipcd(self.particles, self.velocity, self.llim, self.rlim, alpha)
 
             # Update pbest, gbest
-            less = self.obj(self.particles) < self.obj(pbest)
-            pbest[less] = np.copy(self.particles[less])
-            gbest = min(pbest , key = self.objkey)
-            self.conv_curve.append(self.objkey(gbest))
+            gbest_ind = self.updateBests(pbest)
+            gbest = pbest[gbest_ind]
+            self.conv_curve.append(self.pbest_fit[gbest_ind])
 
             # Append to cache after updating particles, velocities, pbest and gbest
             self.appendCache (self.particles, self.velocity, momentum, pbest, gbest, r1, r2)
@@ -206,15 +205,18 @@ class EMPSO (pso.PSO) :
         pbcache,
         gbcache) = [part], [vel], [mom], [pb], [gb]
 
+        pbfit = self.obj(pb)
         for r1, r2 in zip(r1s, r2s) :
             mom = beta*mom + (1-beta)*vel
             vel = mom + c1*r1*(pb - part) + c2*r2*(gb - part)
             vel = pso.vclip(vel, self.vmax)
             part, vel = pso.ipcd(part, vel, self.llim, self.rlim, alpha)
 
-            less = self.obj(part) < self.obj(pb)
+            pfit = self.obj(part)
+            less = pfit < pbfit
             pb[less] = part[less]
-            gb = min(pb , key = lambda x : self.obj(x.reshape(1, -1))[0])
+            pbfit[less] = pfit[less]
+            gb = pb[np.argmin(pbfit)]
 
             pcache.append(part)
             vcache.append(vel)
@@ -232,13 +234,17 @@ class HECS_PSO (pso.PSO) :
     Link    - https://ieeexplore.ieee.org/document/1460442
     """
 
-    def __init__ (self, obj, llim, rlim, Np, stag_tol=1e-3, Nc=6, Gmax=500, rrat=0.2, vrat=0.1) :
+    def __init__ (self, obj, llim, rlim, Np, stag_tol=1e-3, Nc=6, Gmax=500, rrat=0.2, vrat=0.1, Gc=None) :
         """
         Constructor for the hybrid embedded chaotic search PSO optimizer -
             stag_tol        - Stagnation tolerance for kicking in chaotic search
             Nc              - Number of iterations to check for stagnation
             Gmax            - Maximum iterations in the chaotic search
             rrat            - Carrier wave radius in chaotic search
+            Gc              - Iterations of the chaotic search evaluated at a
+                            time. A particle stops searching at the first of
+                            them improving it (Gmax by default, i.e., the best
+                            of all the Gmax points is taken)
 
         Rest are defined in the base class
         """
@@ -247,6 +253,7 @@ class HECS_PSO (pso.PSO) :
         self.stag_tol = stag_tol
         self.Nc = Nc
         self.Gmax = Gmax
+        self.Gc = Gmax if Gc is None else Gc
         self.rrat = rrat
         self.cgen = None
 
@@ -259,7 +266,7 @@ class HECS_PSO (pso.PSO) :
 
         pbest, gbest = super()._optim_init()
         fitness_q = deque(maxlen=self.Nc)
-        fitness_q.append(self.obj(self.particles))
+        fitness_q.append(np.copy(self.pfit))
         return fitness_q, pbest, gbest
 
     def optimize (self, w=0.7, c1=1.7, c2=1.7, alpha=1.2,
@@ -269,9 +276,10 @@ class HECS_PSO (pso.PSO) :
 
         fitness_q, pbest, gbest = self._optim_init()
 
-        # Set the chaotic generator if not previously set
+        # Set the chaotic generator if not previously set. Every particle has
+        # its own logistic variables, iterated Gmax times for a chaotic search
         if self.cgen is None :
-            self.cgen = cg.Logistic((self.Gmax, self.D), gens=1)
+            self.cgen = cg.Logistic((self.Gmax, self.Np, self.D), gens=1)
 
         i = -1
         while True :
@@ -282,22 +290,12 @@ class HECS_PSO (pso.PSO) :
             if i == max_iters or (np.abs(self.particles - gbest) < tol).all() :
                 break
 
-            # Chaotic search
+            # Chaotic search around the particles whose fitness stagnates
             if i >= self.Nc :
                 fits_ps = np.array(fitness_q).transpose()
-                for j, fits_p in enumerate(fits_ps) :
-                    if ((fits_p - self.obj(gbest.reshape(1, -1)))/fits_p < self.stag_tol).all() :
-                        chaos_points = self.particles[j] + self.rrat*(self.rlim - self.llim)*(2*self.cgen.chaosPoints(1) - 1)
-                        obj_cp = np.where(np.logical_and(self.llim.reshape(1, -1) <= chaos_points,
-                                                        chaos_points <= self.rlim.reshape(1, -1)).all(axis=1),
-                                        self.obj(chaos_points),
-                                        np.inf)
-                        gbest_p = np.argmin(obj_cp).flatten()[0]
-
-                        # Update after chaotic search if feasible
-                        if obj_cp[gbest_p] != np.inf and obj_cp[gbest_p] < self.objkey(self.particles[j]) :
-                            self.velocity[j] = self.particles[j] - chaos_points[gbest_p]
-                            self.particles[j] = chaos_points[gbest_p]
+                stagnant = np.flatnonzero(((fits_ps - np.min(self.pbest_fit))/fits_ps < self.stag_tol).all(axis=1))
+                if len(stagnant) :
+                    self.chaoticSearch(stagnant)
 
             # Perform velocity clipping before running ipcd() to minimize any violations
             self.velocity = pso.vclip(self.velocity, self.vmax)
@@ -308,13 +306,12 @@ class HECS_PSO (pso.PSO) :
             ######################################################################
             self.particles, self.velocity = pso.ipcd(self.particles, self.velocity, self.llim, self.rlim, alpha)
 
-            less = self.obj(self.particles) < self.obj(pbest)
-            pbest[less] = np.copy(self.particles[less])
-            gbest = min(pbest, key = self.objkey)
-            self.conv_curve.append(self.objkey(gbest))
+            gbest_ind = self.updateBests(pbest)
+            gbest = pbest[gbest_ind]
+            self.conv_curve.append(self.pbest_fit[gbest_ind])
 
             # Appends fitness for tracking whether to enter chaotic search
-            fitness_q.append(self.obj(self.particles))
+            fitness_q.append(np.copy(self.pfit))
 
             # Velocity update
             r1, r2 = np.random.rand(self.Np, self.D), np.random.rand(self.Np, self.D)
@@ -324,6 +321,43 @@ class HECS_PSO (pso.PSO) :
         if print_iters : print("\n", end="")
         return self.optRet(gbest, grad, tol, i)
 
+    def chaoticSearch (self, stagnant) :
+        """
+        Embedded chaotic search around the stagnant particles (indices). The
+        carrier waves of all of them form one (k, Gmax, D) tensor, whose
+        feasible points are evaluated Gc iterations at a time with a single
+        objective call. A particle moves to the best point of the first
+        iterations improving its fitness, and stops searching
+        """
+
+        # (Gmax, Np, D) --> (k, Gmax, D)
+        waves = np.swapaxes(self.cgen.chaosPoints(1)[:,stagnant], 0, 1)
+        chaos_points = self.particles[stagnant][:,None] + self.rrat*(self.rlim - self.llim)*(2*waves - 1)
+        feasible = np.logical_and(self.llim <= chaos_points, chaos_points <= self.rlim).all(axis=2)
+
+        searching = np.arange(len(stagnant))
+        for start in range(0, self.Gmax, self.Gc) :
+            cps = chaos_points[searching, start:start+self.Gc]
+            feas = feasible[searching, start:start+self.Gc]
+
+            obj_cp = np.full(feas.shape, np.inf)
+            if feas.any() :
+                obj_cp[feas] = self.fitness(cps[feas])
+            gbest_p = np.argmin(obj_cp, axis=1)
+            best_fit = obj_cp[np.arange(len(searching)), gbest_p]
+
+            # Update after chaotic search if feasible and better
+            better = best_fit < self.pfit[stagnant[searching]]
+            j = stagnant[searching[better]]
+            points = cps[better, gbest_p[better]]
+            self.velocity[j] = self.particles[j] - points
+            self.particles[j] = points
+            self.pfit[j] = best_fit[better]
+
+            searching = searching[np.invert(better)]
+            if not len(searching) :
+                break
+
 
 class PWLC_PSO (pso.PSO) :
     """
@@ -385,26 +419,25 @@ class PWLC_PSO (pso.PSO) :
             self.particles, self.velocity = pso.ipcd(self.particles, self.velocity, self.llim, self.rlim, alpha)
 
             # Update pbest, gbest
-            less = self.obj(self.particles) < self.obj(pbest)
-            pbest[less] = np.copy(self.particles[less])
-            gbest_ind = np.argmin(self.obj(pbest)).flatten()[0]
+            gbest_ind = self.updateBests(pbest)
 
             # Chaotic search
             cp = pbest[gbest_ind] + self.rrat*(self.rlim - self.llim)*(2*self.cgen.chaosPoints(1) - 1)
             obj_cp = np.where(np.logical_and(self.llim.reshape(1,-1) <= cp, cp <= self.rlim.reshape(1,-1)).all(axis=1),
-                            self.obj(cp),
+                            self.fitness(cp),
                             np.inf)
             gbest_p = np.argmin(obj_cp).flatten()[0]
 
             # Update after chaotic search if feasible
-            if obj_cp[gbest_p] != np.inf and obj_cp[gbest_p] < self.objkey(pbest[gbest_ind]) :
+            if obj_cp[gbest_p] != np.inf and obj_cp[gbest_p] < self.pbest_fit[gbest_ind] :
                 new_vel = cp[gbest_p] - self.particles[gbest_ind]
                 self.velocity[gbest_ind] = np.random.rand(self.D)*self.vmax*new_vel/np.linalg.norm(new_vel)
                 pbest[gbest_ind] = self.particles[gbest_ind] = cp[gbest_p]
+                self.pbest_fit[gbest_ind] = self.pfit[gbest_ind] = obj_cp[gbest_p]
 
             # Copy gbest
             gbest = pbest[gbest_ind]
-            self.conv_curve.append(self.objkey(gbest))
+            self.conv_curve.append(self.pbest_fit[gbest_ind])
             self.rrat *= self.rho
 
             i += 1
@@ -478,27 +511,26 @@ class PWLC_EMPSO (pso.PSO) :
             self.particles, self.velocity = pso.ipcd(self.particles, self.velocity, self.llim, self.rlim, alpha)
 
             # Update pbest, gbest
-            less = self.obj(self.particles) < self.obj(pbest)
-            pbest[less] = np.copy(self.particles[less])
-            gbest_ind = np.argmin(self.obj(pbest)).flatten()[0]
+            gbest_ind = self.updateBests(pbest)
 
             # Chaotic search
             cp = pbest[gbest_ind] + self.rrat*(self.rlim - self.llim)*(2*self.cgen.chaosPoints(1) - 1)
             obj_cp = np.where(np.logical_and(self.llim.reshape(1,-1) <= cp, cp <= self.rlim.reshape(1,-1)).all(axis=1),
-                            self.obj(cp),
+                            self.fitness(cp),
                             np.inf)
             gbest_p = np.argmin(obj_cp).flatten()[0]
 
             # Update after chaotic search if feasible
-            if obj_cp[gbest_p] != np.inf and obj_cp[gbest_p] < self.objkey(pbest[gbest_ind]) :
+            if obj_cp[gbest_p] != np.inf and obj_cp[gbest_p] < self.pbest_fit[gbest_ind] :
                 new_vel = cp[gbest_p] - self.particles[gbest_ind]
                 self.velocity[gbest_ind] = np.random.rand(self.D)*self.vmax*new_vel/np.linalg.norm(new_vel)
                 momentum[gbest_ind] = 0
                 pbest[gbest_ind] = self.particles[gbest_ind] = cp[gbest_p]
+                self.pbest_fit[gbest_ind] = self.pfit[gbest_ind] = obj_cp[gbest_p]
 
             # Copy gbest
             gbest = pbest[gbest_ind]
-            self.conv_curve.append(self.objkey(gbest))
+            self.conv_curve.append(self.pbest_fit[gbest_ind])
             self.rrat *= self.rho
 
             i += 1
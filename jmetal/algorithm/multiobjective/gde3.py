@@ -41,6 +41,8 @@ class GDE3(EvolutionaryAlgorithm[FloatSolution, FloatSolution]):
         self.termination_criterion = termination_criterion
         self.observable.register(termination_criterion)
 
+        self.current_individual = 0
+
     def selection(self, population: List[FloatSolution]) -> List[FloatSolution]:
         mating_pool = []
 
@@ -83,6 +85,36 @@ class GDE3(EvolutionaryAlgorithm[FloatSolution, FloatSolution]):
             self.population_size, dominance_comparator=self.dominance_comparator
         ).execute(join_population)
 
+    def propose_solution(self) -> tuple:
+        """ Creates the trial vector of the current individual, and moves to the next one. The context is the
+        current individual (the target of the trial vector). """
+        index = self.current_individual % len(self.solutions)
+        self.current_individual = index + 1
+
+        self.selection_operator.set_index_to_exclude(index)
+        parents = self.selection_operator.execute(self.solutions)
+        self.crossover_operator.current_individual = self.solutions[index]
+
+        return self.crossover_operator.execute(parents)[0], self.solutions[index]
+
+    def accept_solution(self, solution: FloatSolution, target: FloatSolution) -> None:
+        """ GDE3 selection of an evaluated trial vector: it is discarded if its target dominates it, it replaces its
+        target if it dominates it, and it is added to the population otherwise. The population is then truncated by
+        ranking and crowding distance. """
+        result = self.dominance_comparator.compare(target, solution)
+        if result == -1:
+            return
+
+        population = [s for s in self.solutions if s is not target] if result == 1 else self.solutions
+        population = population + [solution]
+
+        if len(population) > self.population_size:
+            population = RankingAndCrowdingDistanceSelection(
+                self.population_size, dominance_comparator=self.dominance_comparator
+            ).execute(population)
+
+        self.solutions = population
+
     def create_initial_solutions(self) -> List[FloatSolution]:
         return [self.population_generator.new(self.problem) for _ in range(self.population_size)]
 
@@ -29,7 +29,9 @@ class HYPE(GeneticAlgorithm[S, R]):
                  termination_criterion: TerminationCriterion = store.default_termination_criteria,
                  population_generator: Generator = store.default_generator,
                  population_evaluator: Evaluator = store.default_evaluator,
-                 dominance_comparator: Comparator = store.default_comparator):
+                 dominance_comparator: Comparator = store.default_comparator,
+                 samples: int = 10000,
+                 seed: int = None):
         """ This is an implementation of the Hypervolume Estimation Algorithm for Multi-objective Optimization
         proposed in:
 
@@ -38,7 +40,8 @@ class HYPE(GeneticAlgorithm[S, R]):
         Zurich, November 2008.
 
         It uses the Exact Hypervolume-based indicator formulation, which once computed, guides both
-        the environmental selection and the binary tournament selection operator
+        the environmental selection and the binary tournament selection operator. With more than three objectives
+        the indicator is estimated by Monte Carlo sampling, using `samples` points and the given `seed`
 
         Please note that as per the publication above, the evaluator and replacement should not be changed
         anyhow. It also requires that Problem() has a reference_point with objective values defined, e.g.
@@ -52,7 +55,9 @@ class HYPE(GeneticAlgorithm[S, R]):
             comparator=SolutionAttributeComparator(key='fitness', lowest_is_best=False))
         self.ranking_fitness = RankingAndFitnessSelection(population_size,
                                                           dominance_comparator=dominance_comparator,
-                                                          reference_point=reference_point)
+                                                          reference_point=reference_point,
+                                                          samples=samples,
+                                                          seed=seed)
         self.reference_point = reference_point
         self.dominance_comparator = dominance_comparator
 
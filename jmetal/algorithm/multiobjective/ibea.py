@@ -6,7 +6,6 @@ from jmetal.algorithm.singleobjective.genetic_algorithm import GeneticAlgorithm
 from jmetal.config import store
 from jmetal.core.operator import Mutation, Crossover
 from jmetal.core.problem import Problem
-from jmetal.core.quality_indicator import EpsilonIndicator
 from jmetal.operator import BinaryTournamentSelection
 from jmetal.util.comparator import SolutionAttributeComparator
 from jmetal.util.evaluator import Evaluator
@@ -66,13 +65,11 @@ class IBEA(GeneticAlgorithm[S, R]):
         )
 
     def compute_fitness_values(self, population: List[S], kappa: float) -> List[S]:
-        for i in range(len(population)):
-            population[i].attributes['fitness'] = 0
+        contributions = _fitness_contributions(population, kappa)
+        fitness = -contributions.sum(axis=0)
 
-            for j in range(len(population)):
-                if j != i:
-                    population[i].attributes['fitness'] += -np.exp(
-                        -EpsilonIndicator([population[i].objectives]).compute([population[j].objectives]) / self.kappa)
+        for i in range(len(population)):
+            population[i].attributes['fitness'] = float(fitness[i])
         return population
 
     def create_initial_solutions(self) -> List[S]:
@@ -84,19 +81,23 @@ class IBEA(GeneticAlgorithm[S, R]):
     def replacement(self, population: List[S], offspring_population: List[S]) -> List[List[S]]:
         join_population = population + offspring_population
         join_population_size = len(join_population)
-        join_population = self.compute_fitness_values(join_population, self.kappa)
-
-        while join_population_size > self.population_size:
-            current_fitnesses = [individual.attributes['fitness'] for individual in join_population]
-            index_worst = current_fitnesses.index(min(current_fitnesses))
 
-            for i in range(join_population_size):
-                join_population[i].attributes['fitness'] += np.exp(
-                    - EpsilonIndicator([join_population[i].objectives]).compute([join_population[index_worst].objectives]) / self.kappa)
+        # The contributions are computed once; removing the worst individual takes its row of contributions out of
+        # the fitness sums, so the row is added to the (negative) fitness of the others
+        contributions = _fitness_contributions(join_population, self.kappa)
+        fitness = -contributions.sum(axis=0)
+        removed = np.zeros(join_population_size, dtype=bool)
 
-            join_population.pop(index_worst)
+        while join_population_size > self.population_size:
+            index_worst = int(np.argmin(np.where(removed, np.inf, fitness)))
+            fitness += contributions[index_worst]
+            removed[index_worst] = True
             join_population_size = join_population_size - 1
 
+        join_population = [join_population[i] for i in np.flatnonzero(~removed).tolist()]
+        for individual, value in zip(join_population, fitness[~removed].tolist()):
+            individual.attributes['fitness'] = value
+
         return join_population
 
     def get_result(self) -> R:
@@ -104,3 +105,29 @@ class IBEA(GeneticAlgorithm[S, R]):
 
     def get_name(self) -> str:
         return 'Epsilon-IBEA'
+
+
+def _fitness_contributions(population: List[S], kappa: float) -> np.ndarray:
+    """ Matrix of the terms exp(-I(x_i, x_j) / (c * kappa)) of the IBEA fitness, where I is the additive epsilon
+    indicator computed on the objectives normalized to [0, 1] and c is its maximum absolute value. The fitness of x_j
+    is minus the sum of its column; the diagonal is 0.
+    """
+    objectives = np.array([individual.objectives for individual in population], dtype=float)
+    lower_bound = objectives.min(axis=0)
+    objective_ranges = objectives.max(axis=0) - lower_bound
+    objective_ranges[objective_ranges == 0] = 1.0
+    objectives = (objectives - lower_bound) / objective_ranges
+
+    # I(x_i, x_j): smallest value to subtract from x_i so that it weakly dominates x_j
+    indicator_values = np.full((len(population), len(population)), -np.inf)
+    for k in range(objectives.shape[1]):
+        np.maximum(indicator_values, objectives[:, None, k] - objectives[None, :, k], out=indicator_values)
+
+    max_indicator_value = np.abs(indicator_values).max()
+    if max_indicator_value == 0:
+        max_indicator_value = 1.0
+
+    contributions = np.exp(-indicator_values / (max_indicator_value * kappa))
+    np.fill_diagonal(contributions, 0.0)
+
+    return contributions
@@ -133,6 +133,24 @@ class MOCell(GeneticAlgorithm[S, R]):
 
         return population
 
+    def propose_solution(self) -> tuple:
+        """ Breeds an offspring for the current cell and moves to the next one. The context is the cell and its
+        neighbors, used to accept the offspring once evaluated. """
+        parents = self.selection(self.solutions)
+        context = (self.current_individual, self.current_neighbors)
+        offspring = self.reproduction(parents)[0]
+
+        self.current_individual = (self.current_individual + 1) % self.population_size
+
+        return offspring, context
+
+    def accept_solution(self, solution: S, context) -> None:
+        next_individual = self.current_individual
+        self.current_individual, self.current_neighbors = context
+
+        self.solutions = self.replacement(self.solutions, [solution])
+        self.current_individual = next_individual
+
     def get_result(self) -> R:
         return self.archive.solution_list
 
@@ -1,6 +1,5 @@
 import random
 from copy import copy
-from math import sqrt
 from typing import TypeVar, List, Optional
 
 import numpy
@@ -15,6 +14,7 @@ from jmetal.util.archive import BoundedArchive, NonDominatedSolutionsArchive
 from jmetal.util.comparator import DominanceComparator, EpsilonDominanceComparator
 from jmetal.util.evaluator import Evaluator
 from jmetal.util.generator import Generator
+from jmetal.util.swarm import variables_matrix, set_variables, random_coefficients, acceleration, bounce_back
 from jmetal.util.termination_criterion import TerminationCriterion
 
 R = TypeVar('R')
@@ -96,9 +96,8 @@ class OMOPSO(ParticleSwarmOptimization):
         return self.termination_criterion.is_met
 
     def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            if self.leaders.add(particle):
-                self.epsilon_archive.add(copy(particle))
+        for particle in self.leaders.add_all(swarm):
+            self.epsilon_archive.add(copy(particle))
 
     def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
         for particle in swarm:
@@ -110,40 +109,28 @@ class OMOPSO(ParticleSwarmOptimization):
                 self.speed[i][j] = 0.0
 
     def update_velocity(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            best_particle = copy(swarm[i].attributes['local_best'])
-            best_global = self.select_global_best()
+        positions = variables_matrix(swarm)
+        local_best = variables_matrix([particle.attributes['local_best'] for particle in swarm])
+        global_best = variables_matrix([self.select_global_best() for _ in swarm])
 
-            r1 = round(random.uniform(self.r1_min, self.r1_max), 1)
-            r2 = round(random.uniform(self.r2_min, self.r2_max), 1)
-            c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-            c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-            w = round(random.uniform(self.weight_min, self.weight_max), 1)
+        r1 = random_coefficients(self.r1_min, self.r1_max, self.swarm_size)
+        r2 = random_coefficients(self.r2_min, self.r2_max, self.swarm_size)
+        c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+        c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+        w = random_coefficients(self.weight_min, self.weight_max, self.swarm_size)
 
-            for var in range(swarm[i].number_of_variables):
-                self.speed[i][var] = w * self.speed[i][var] \
-                                     + (c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var])) \
-                                     + (c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
+        self.speed = w * self.speed + acceleration(positions, local_best, global_best, c1, c2, r1, r2)
 
     def update_position(self, swarm: List[FloatSolution]) -> None:
-        for i in range(self.swarm_size):
-            particle = swarm[i]
+        positions = variables_matrix(swarm) + self.speed
+        bounce_back(positions, self.speed, numpy.asarray(self.problem.lower_bound),
+                    numpy.asarray(self.problem.upper_bound), self.change_velocity1, self.change_velocity2)
 
-            for j in range(particle.number_of_variables):
-                particle.variables[j] += self.speed[i][j]
-
-                if particle.variables[j] < self.problem.lower_bound[j]:
-                    particle.variables[j] = self.problem.lower_bound[j]
-                    self.speed[i][j] *= self.change_velocity1
-
-                if particle.variables[j] > self.problem.upper_bound[j]:
-                    particle.variables[j] = self.problem.upper_bound[j]
-                    self.speed[i][j] *= self.change_velocity2
+        set_variables(swarm, positions)
 
     def update_global_best(self, swarm: List[FloatSolution]) -> None:
-        for particle in swarm:
-            if self.leaders.add(copy(particle)):
-                self.epsilon_archive.add(copy(particle))
+        for particle in self.leaders.add_all([copy(particle) for particle in swarm]):
+            self.epsilon_archive.add(copy(particle))
 
     def update_particle_best(self, swarm: List[FloatSolution]) -> None:
         for i in range(self.swarm_size):
@@ -168,35 +155,14 @@ class OMOPSO(ParticleSwarmOptimization):
             particles = random.sample(leaders, 2)
 
             if self.leaders.comparator.compare(particles[0], particles[1]) < 1:
-                best_global = copy(particles[0])
+                best_global = particles[0]
             else:
-                best_global = copy(particles[1])
+                best_global = particles[1]
         else:
-            best_global = copy(self.leaders.solution_list[0])
+            best_global = self.leaders.solution_list[0]
 
         return best_global
 
-    def __velocity_constriction(self, value: float, delta_max: [], delta_min: [], variable_index: int) -> float:
-        result = value
-        if value > delta_max[variable_index]:
-            result = delta_max[variable_index]
-        if value < delta_min[variable_index]:
-            result = delta_min[variable_index]
-
-        return result
-
-    def __inertia_weight(self, wmax: float):
-        return wmax
-
-    def __constriction_coefficient(self, c1: float, c2: float) -> float:
-        rho = c1 + c2
-        if rho <= 4:
-            result = 1.0
-        else:
-            result = 2.0 / (2.0 - rho - sqrt(pow(rho, 2.0) - 4.0 * rho))
-
-        return result
-
     def init_progress(self) -> None:
         self.evaluations = self.swarm_size
         self.leaders.compute_density_estimator()
@@ -1,12 +1,8 @@
 import random
 import threading
 from copy import copy
-from math import sqrt
 from typing import TypeVar, List, Optional
 from typing import Union
-import cpso
-import benchmark as bench
-import chaotic_generate as cgen
 
 import numpy
 
@@ -16,9 +12,12 @@ from jmetal.core.operator import Mutation
 from jmetal.core.problem import FloatProblem, DynamicProblem
 from jmetal.core.solution import FloatSolution
 from jmetal.util.archive import BoundedArchive, ArchiveWithReferencePoint
+from jmetal.util.chaosGen import ChaoticRandomSource
 from jmetal.util.comparator import DominanceComparator
 from jmetal.util.evaluator import Evaluator
 from jmetal.util.generator import Generator
+from jmetal.util.swarm import variables_matrix, set_variables, random_coefficients, constriction_coefficient, \
+	momentum_constriction_coefficient, acceleration, constricted_velocity, momentum_velocity, bounce_back
 from jmetal.util.termination_criterion import TerminationCriterion
 
 R = TypeVar('R')
@@ -82,6 +81,9 @@ class SMPSO(ParticleSwarmOptimization):
 		self.delta_max, self.delta_min = numpy.empty(problem.number_of_variables), \
 										 numpy.empty(problem.number_of_variables)
 
+		# Moved particles not handed out yet to the asynchronous engine
+		self.proposals = []
+
 	def create_initial_solutions(self) -> List[FloatSolution]:
 		return [self.swarm_generator.new(self.problem) for _ in range(self.swarm_size)]
 
@@ -92,8 +94,7 @@ class SMPSO(ParticleSwarmOptimization):
 		return self.termination_criterion.is_met
 
 	def initialize_global_best(self, swarm: List[FloatSolution]) -> None:
-		for particle in swarm:
-			self.leaders.add(copy(particle))
+		self.leaders.add_all([copy(particle) for particle in swarm])
 
 	def initialize_particle_best(self, swarm: List[FloatSolution]) -> None:
 		for particle in swarm:
@@ -106,46 +107,38 @@ class SMPSO(ParticleSwarmOptimization):
 		self.delta_min = -1.0 * self.delta_max
 
 	def update_velocity(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			best_particle = copy(swarm[i].attributes['local_best'])
-			best_global = self.select_global_best()
-
-			r1 = round(random.uniform(self.r1_min, self.r1_max), 1)
-			r2 = round(random.uniform(self.r2_min, self.r2_max), 1)
-			c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-			c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-			wmax = self.max_weight
-			wmin = self.min_weight
-
-			for var in range(swarm[i].number_of_variables):
-				self.speed[i][var] = \
-					self.__velocity_constriction(
-						self.__constriction_coefficient(c1, c2) *
-						((self.__inertia_weight(wmax)
-						  * self.speed[i][var])
-						 + (c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var]))
-						 + (c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
-						 ),
-						self.delta_max, self.delta_min, var)
+		positions, local_best, global_best = self.get_swarm_variables(swarm)
+
+		r1 = random_coefficients(self.r1_min, self.r1_max, self.swarm_size)
+		r2 = random_coefficients(self.r2_min, self.r2_max, self.swarm_size)
+		c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+		c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+
+		self.speed = constricted_velocity(self.speed,
+										  acceleration(positions, local_best, global_best, c1, c2, r1, r2),
+										  self.__inertia_weight(self.max_weight),
+										  constriction_coefficient(c1, c2),
+										  self.delta_min, self.delta_max)
 
 	def update_position(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			particle = swarm[i]
+		positions = variables_matrix(swarm) + self.speed
+		bounce_back(positions, self.speed, numpy.asarray(self.problem.lower_bound),
+					numpy.asarray(self.problem.upper_bound), self.change_velocity1, self.change_velocity2)
 
-			for j in range(particle.number_of_variables):
-				particle.variables[j] += self.speed[i][j]
+		set_variables(swarm, positions)
 
-				if particle.variables[j] < self.problem.lower_bound[j]:
-					particle.variables[j] = self.problem.lower_bound[j]
-					self.speed[i][j] *= self.change_velocity1
+	def get_swarm_variables(self, swarm: List[FloatSolution]) -> tuple:
+		""" Returns the matrices with the variables of the particles, of their local best and of the global best selected
+		for each one of them.
+		"""
+		positions = variables_matrix(swarm)
+		local_best = variables_matrix([particle.attributes['local_best'] for particle in swarm])
+		global_best = variables_matrix([self.select_global_best() for _ in swarm])
 
-				if particle.variables[j] > self.problem.upper_bound[j]:
-					particle.variables[j] = self.problem.upper_bound[j]
-					self.speed[i][j] *= self.change_velocity2
+		return positions, local_best, global_best
 
 	def update_global_best(self, swarm: List[FloatSolution]) -> None:
-		for particle in swarm:
-			self.leaders.add(copy(particle))
+		self.leaders.add_all([copy(particle) for particle in swarm])
 
 	def update_particle_best(self, swarm: List[FloatSolution]) -> None:
 		for i in range(self.swarm_size):
@@ -160,6 +153,37 @@ class SMPSO(ParticleSwarmOptimization):
 			if (i % 6) == 0:
 				self.mutation_operator.execute(swarm[i])
 
+	def propose_solution(self) -> tuple:
+		""" Hands out the next moved particle to the asynchronous engine (see :py:mod:`jmetal.util.asynchronous`).
+		Copies of all the particles are moved together with the velocity and position updates of the algorithm once
+		the previous ones have been handed out, so the particles still being evaluated move from their last accepted
+		position.
+
+		:return: The moved particle and its index in the swarm.
+		"""
+		if not self.proposals:
+			swarm = [copy(particle) for particle in self.solutions]
+			self.update_velocity(swarm)
+			self.update_position(swarm)
+			self.perturbation(swarm)
+			self.proposals = list(enumerate(swarm))
+
+		index, particle = self.proposals.pop(0)
+
+		return particle, index
+
+	def accept_solution(self, solution: FloatSolution, index: int) -> None:
+		""" Replaces a particle by its evaluated move, updating the leaders and its local best. """
+		local_best = self.solutions[index].attributes['local_best']
+		solution.attributes['local_best'] = local_best
+
+		self.solutions[index] = solution
+		self.update_global_best([solution])
+		if self.dominance_comparator.compare(solution, local_best) != 1:
+			solution.attributes['local_best'] = copy(solution)
+
+		self.leaders.compute_density_estimator()
+
 	def select_global_best(self) -> FloatSolution:
 		leaders = self.leaders.solution_list
 
@@ -167,35 +191,17 @@ class SMPSO(ParticleSwarmOptimization):
 			particles = random.sample(leaders, 2)
 
 			if self.leaders.comparator.compare(particles[0], particles[1]) < 1:
-				best_global = copy(particles[0])
+				best_global = particles[0]
 			else:
-				best_global = copy(particles[1])
+				best_global = particles[1]
 		else:
-			best_global = copy(self.leaders.solution_list[0])
+			best_global = self.leaders.solution_list[0]
 
 		return best_global
 
-	def __velocity_constriction(self, value: float, delta_max: List, delta_min: List, variable_index: int) -> float:
-		result = value
-		if value > delta_max[variable_index]:
-			result = delta_max[variable_index]
-		if value < delta_min[variable_index]:
-			result = delta_min[variable_index]
-
-		return result
-
 	def __inertia_weight(self, wmax: float):
 		return wmax
 
-	def __constriction_coefficient(self, c1: float, c2: float) -> float:
-		rho = c1 + c2
-		if rho <= 4:
-			result = 1.0
-		else:
-			result = 2.0 / (2.0 - rho - sqrt(pow(rho, 2.0) - 4.0 * rho))
-
-		return result
-
 	def init_progress(self) -> None:
 		self.evaluations = self.swarm_size
 		self.leaders.compute_density_estimator()
@@ -316,6 +322,19 @@ class SMPSORP(SMPSO):
 			for leader in self.leaders:
 				leader.add(copy(particle))
 
+	def accept_solution(self, solution: FloatSolution, index: int) -> None:
+		""" Replaces a particle by its evaluated move, updating every archive of leaders and its local best. """
+		local_best = self.solutions[index].attributes['local_best']
+		solution.attributes['local_best'] = local_best
+
+		self.solutions[index] = solution
+		self.update_global_best([solution])
+		if self.dominance_comparator.compare(solution, local_best) != 1:
+			solution.attributes['local_best'] = copy(solution)
+
+		for leader in self.leaders:
+			leader.compute_density_estimator()
+
 	def select_global_best(self) -> FloatSolution:
 		selected = False
 		selected_swarm_index = 0
@@ -331,11 +350,11 @@ class SMPSORP(SMPSO):
 			particles = random.sample(leaders, 2)
 
 			if self.leaders[selected_swarm_index].comparator.compare(particles[0], particles[1]) < 1:
-				best_global = copy(particles[0])
+				best_global = particles[0]
 			else:
-				best_global = copy(particles[1])
+				best_global = particles[1]
 		else:
-			best_global = copy(self.leaders[selected_swarm_index].solution_list[0])
+			best_global = self.leaders[selected_swarm_index].solution_list[0]
 
 		return best_global
 
@@ -392,8 +411,13 @@ class Chaotic_EMPSO(SMPSO) :
 				 leaders: Optional[BoundedArchive],
 				 termination_criterion: TerminationCriterion = store.default_termination_criteria,
 				 swarm_generator: Generator = store.default_generator,
-				 swarm_evaluator: Evaluator = store.default_evaluator) :
+				 swarm_evaluator: Evaluator = store.default_evaluator,
+				 chaotic_map: str = 'tent') :
+		""" Chaotic EMPSO, whose coefficients r1 and r2 are drawn from a chaotic map.
 
+		:param chaotic_map: Name of the chaotic map in `chaosGen.cgen` ('tent', 'log', 'lorenz', 'henon', 'baker' or
+			'inverse').
+		"""
 		super(SMPSO, self).__init__(
 			problem=problem,
 			swarm_size=swarm_size)
@@ -403,6 +427,7 @@ class Chaotic_EMPSO(SMPSO) :
 		self.observable.register(termination_criterion)
 		self.mutation_operator = mutation
 		self.leaders = leaders
+		self.chaotic_source = ChaoticRandomSource(chaotic_map)
 
 		self.c1_min = 0.5
 		self.c1_max = 2.5
@@ -425,49 +450,19 @@ class Chaotic_EMPSO(SMPSO) :
 
 
 	def update_velocity(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			best_particle = copy(swarm[i].attributes['local_best'])
-			best_global = self.select_global_best()
-
-			# r1 = round(random.chaotic(self.r1_min, self.r1_max), 1)
-			# r2 = round(random.chaotic(self.r2_min, self.r2_max), 1)
-			r1 = cgen.generateChaos()
-			r2 = cgen.generateChaos()
-			
-			c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-			c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-			beta = round(random.uniform(self.beta_min, self.beta_max), 1)
-
-			for var in range(swarm[i].number_of_variables):
-				self.momentum[i][var] = beta*self.momentum[i][var] + (1-beta)*self.speed[i][var]
-				self.speed[i][var] = \
-					self.__velocity_constriction(
-						self.__constriction_coefficient(c1, c2, beta) *
-						(self.momentum[i][var] + \
-							(c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var])) + \
-							(c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
-						),
-						self.delta_max, self.delta_min, var)
-
-	def __velocity_constriction(self, value: float, delta_max: List, delta_min: List, variable_index: int) -> float:
-		result = value
-		if value > delta_max[variable_index]:
-			result = delta_max[variable_index]
-		if value < delta_min[variable_index]:
-			result = delta_min[variable_index]
-
-		return result
+		positions, local_best, global_best = self.get_swarm_variables(swarm)
 
-	def __constriction_coefficient(self, c1: float, c2: float, beta: float) -> float:
-		phi = c1 + c2
-		k = 4*(1 - beta)
-		delta = pow(phi, 2) - k*phi
+		# Chaotic r1 and r2 of every particle and variable
+		r1 = self.r1_min + (self.r1_max - self.r1_min) * self.chaotic_source.chaosPoints(positions.shape, 1)
+		r2 = self.r2_min + (self.r2_max - self.r2_min) * self.chaotic_source.chaosPoints(positions.shape, 2)
+		c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+		c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+		beta = random_coefficients(self.beta_min, self.beta_max, self.swarm_size)
 
-		if delta < 0 :
-			return 1
-		else :
-			eig = (abs(phi-2) + sqrt(delta))/2
-			return 1 if eig <= 1 else -1/eig
+		self.speed = momentum_velocity(self.speed, self.momentum,
+									   acceleration(positions, local_best, global_best, c1, c2, r1, r2),
+									   beta, momentum_constriction_coefficient(c1, c2, beta),
+									   self.delta_min, self.delta_max)
 
 def _change_reference_point(algorithm: SMPSORP):
 	""" Auxiliar function to read new reference points from the keyboard for the SMPSO/RP algorithm
@@ -529,46 +524,18 @@ class EMSMPSO(SMPSO) :
 
 
 	def update_velocity(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			best_particle = copy(swarm[i].attributes['local_best'])
-			best_global = self.select_global_best()
-
-			r1 = round(random.uniform(self.r1_min, self.r1_max), 1)
-			r2 = round(random.uniform(self.r2_min, self.r2_max), 1)
-			c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-			c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-			beta = round(random.uniform(self.beta_min, self.beta_max), 1)
-
-			for var in range(swarm[i].number_of_variables):
-				self.momentum[i][var] = beta*self.momentum[i][var] + (1-beta)*self.speed[i][var]
-				self.speed[i][var] = \
-					self.__velocity_constriction(
-						self.__constriction_coefficient(c1, c2, beta) *
-						(self.momentum[i][var] + \
-							(c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var])) + \
-							(c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
-						),
-						self.delta_max, self.delta_min, var)
-
-	def __velocity_constriction(self, value: float, delta_max: List, delta_min: List, variable_index: int) -> float:
-		result = value
-		if value > delta_max[variable_index]:
-			result = delta_max[variable_index]
-		if value < delta_min[variable_index]:
-			result = delta_min[variable_index]
-
-		return result
+		positions, local_best, global_best = self.get_swarm_variables(swarm)
 
-	def __constriction_coefficient(self, c1: float, c2: float, beta: float) -> float:
-		phi = c1 + c2
-		k = 4*(1 - beta)
-		delta = pow(phi, 2) - k*phi
+		r1 = random_coefficients(self.r1_min, self.r1_max, self.swarm_size)
+		r2 = random_coefficients(self.r2_min, self.r2_max, self.swarm_size)
+		c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+		c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+		beta = random_coefficients(self.beta_min, self.beta_max, self.swarm_size)
 
-		if delta < 0 :
-			return 1
-		else :
-			eig = (abs(phi-2) + sqrt(delta))/2
-			return 1 if eig <= 1 else -1/eig
+		self.speed = momentum_velocity(self.speed, self.momentum,
+									   acceleration(positions, local_best, global_best, c1, c2, r1, r2),
+									   beta, momentum_constriction_coefficient(c1, c2, beta),
+									   self.delta_min, self.delta_max)
 
 def _change_reference_point(algorithm: SMPSORP):
 	""" Auxiliar function to read new reference points from the keyboard for the SMPSO/RP algorithm
@@ -630,46 +597,18 @@ class FCPSO_Beta(SMPSO) :
 
 
 	def update_velocity(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			best_particle = copy(swarm[i].attributes['local_best'])
-			best_global = self.select_global_best()
-
-			r1 = round(random.uniform(self.r1_min, self.r1_max), 1)
-			r2 = round(random.uniform(self.r2_min, self.r2_max), 1)
-			c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-			c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-			beta = round(random.uniform(self.beta_min, self.beta_max), 1)
-
-			for var in range(swarm[i].number_of_variables):
-				self.momentum[i][var] = beta*self.momentum[i][var] + (1-beta)*self.speed[i][var]
-				self.speed[i][var] = \
-					self.__velocity_constriction(
-						self.__constriction_coefficient(c1, c2, beta) *
-						(self.momentum[i][var] + \
-							(c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var])) + \
-							(c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
-						),
-						self.delta_max, self.delta_min, var)
-
-	def __velocity_constriction(self, value: float, delta_max: List, delta_min: List, variable_index: int) -> float:
-		result = value
-		if value > delta_max[variable_index]:
-			result = delta_max[variable_index]
-		if value < delta_min[variable_index]:
-			result = delta_min[variable_index]
-
-		return result
+		positions, local_best, global_best = self.get_swarm_variables(swarm)
 
-	def __constriction_coefficient(self, c1: float, c2: float, beta: float) -> float:
-		phi = c1 + c2
-		k = 4*(1 - beta)
-		delta = pow(phi, 2) - k*phi
+		r1 = random_coefficients(self.r1_min, self.r1_max, self.swarm_size)
+		r2 = random_coefficients(self.r2_min, self.r2_max, self.swarm_size)
+		c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+		c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+		beta = random_coefficients(self.beta_min, self.beta_max, self.swarm_size)
 
-		if delta < 0 :
-			return 1
-		else :
-			eig = (abs(phi-2) + sqrt(delta))/2
-			return 1 if eig <= 1 else -1/eig
+		self.speed = momentum_velocity(self.speed, self.momentum,
+									   acceleration(positions, local_best, global_best, c1, c2, r1, r2),
+									   beta, momentum_constriction_coefficient(c1, c2, beta),
+									   self.delta_min, self.delta_max)
 
 def _change_reference_point(algorithm: SMPSORP):
 	""" Auxiliar function to read new reference points from the keyboard for the SMPSO/RP algorithm
@@ -730,47 +669,19 @@ class FCPSO_Omega(SMPSO) :
 
 
 	def update_velocity(self, swarm: List[FloatSolution]) -> None:
-		for i in range(self.swarm_size):
-			best_particle = copy(swarm[i].attributes['local_best'])
-			best_global = self.select_global_best()
-
-			r1 = round(random.uniform(self.r1_min, self.r1_max), 1)
-			r2 = round(random.uniform(self.r2_min, self.r2_max), 1)
-			c1 = round(random.uniform(self.c1_min, self.c1_max), 1)
-			c2 = round(random.uniform(self.c2_min, self.c2_max), 1)
-			omega = round(random.uniform(self.omega_min, self.omega_max), 1)
-			beta = 4/omega - 1
-
-			for var in range(swarm[i].number_of_variables):
-				self.momentum[i][var] = beta*self.momentum[i][var] + (1-beta)*self.speed[i][var]
-				self.speed[i][var] = \
-					self.__velocity_constriction(
-						self.__constriction_coefficient(c1, c2, beta) *
-						(self.momentum[i][var] + \
-							(c1 * r1 * (best_particle.variables[var] - swarm[i].variables[var])) + \
-							(c2 * r2 * (best_global.variables[var] - swarm[i].variables[var]))
-						),
-						self.delta_max, self.delta_min, var)
-
-	def __velocity_constriction(self, value: float, delta_max: List, delta_min: List, variable_index: int) -> float:
-		result = value
-		if value > delta_max[variable_index]:
-			result = delta_max[variable_index]
-		if value < delta_min[variable_index]:
-			result = delta_min[variable_index]
-
-		return result
-
-	def __constriction_coefficient(self, c1: float, c2: float, beta: float) -> float:
-		phi = c1 + c2
-		k = 4*(1 - beta)
-		delta = pow(phi, 2) - k*phi
-
-		if delta < 0 :
-			return 1
-		else :
-			eig = (abs(phi-2) + sqrt(delta))/2
-			return 1 if eig <= 1 else -1/eig
+		positions, local_best, global_best = self.get_swarm_variables(swarm)
+
+		r1 = random_coefficients(self.r1_min, self.r1_max, self.swarm_size)
+		r2 = random_coefficients(self.r2_min, self.r2_max, self.swarm_size)
+		c1 = random_coefficients(self.c1_min, self.c1_max, self.swarm_size)
+		c2 = random_coefficients(self.c2_min, self.c2_max, self.swarm_size)
+		omega = random_coefficients(self.omega_min, self.omega_max, self.swarm_size)
+		beta = 4/omega - 1
+
+		self.speed = momentum_velocity(self.speed, self.momentum,
+									   acceleration(positions, local_best, global_best, c1, c2, r1, r2),
+									   beta, momentum_constriction_coefficient(c1, c2, beta),
+									   self.delta_min, self.delta_max)
 
 def _change_reference_point(algorithm: SMPSORP):
 	""" Auxiliar function to read new reference points from the keyboard for the SMPSO/RP algorithm
@@ -101,6 +101,22 @@ class GeneticAlgorithm(EvolutionaryAlgorithm[S, R]):
 
         return population[:self.population_size]
 
+    def propose_solution(self) -> tuple:
+        """ Breeds a single offspring from parents selected in the current population (steady-state step of the
+        asynchronous engine, see :py:mod:`jmetal.util.asynchronous`).
+
+        :return: The offspring and the context needed to accept it once evaluated. """
+        parents = [self.selection_operator.execute(self.solutions)
+                   for _ in range(self.crossover_operator.get_number_of_parents())]
+        offspring = self.crossover_operator.execute(parents)[0]
+        self.mutation_operator.execute(offspring)
+
+        return offspring, None
+
+    def accept_solution(self, solution: S, context) -> None:
+        """ Steady-state replacement of an evaluated offspring returned by :meth:`propose_solution`. """
+        self.solutions = self.replacement(self.solutions, [solution])
+
     def get_result(self) -> R:
         return self.solutions[0]
 
@@ -0,0 +1,78 @@
+import unittest
+from math import exp
+
+import numpy as np
+
+from jmetal.algorithm.multiobjective.ibea import IBEA, _fitness_contributions
+from jmetal.core.solution import FloatSolution
+from jmetal.operator import PolynomialMutation, SBXCrossover
+from jmetal.problem import ZDT1
+
+
+def create_solutions(objectives: list) -> list:
+    solutions = []
+    for values in objectives:
+        solution = FloatSolution([0.0], [1.0], len(values))
+        solution.objectives = list(values)
+        solutions.append(solution)
+
+    return solutions
+
+
+class IBEATestCases(unittest.TestCase):
+
+    def setUp(self):
+        # A = (0, 1), B = (1, 0) and C = (1, 1): I(A, B) = I(B, A) = 1, I(A, C) = I(B, C) = 0, I(C, A) = I(C, B) = 1
+        self.front = [[0.0, 1.0], [1.0, 0.0], [1.0, 1.0]]
+        self.contributions = [[0.0, exp(-1), 1.0],
+                              [exp(-1), 0.0, 1.0],
+                              [exp(-1), exp(-1), 0.0]]
+
+    def create_ibea(self, population_size: int) -> IBEA:
+        return IBEA(problem=ZDT1(),
+                    population_size=population_size,
+                    offspring_population_size=population_size,
+                    mutation=PolynomialMutation(1.0 / 30),
+                    crossover=SBXCrossover(1.0),
+                    kappa=1.0)
+
+    def test_should_fitness_contributions_be_those_of_the_epsilon_indicator(self):
+        contributions = _fitness_contributions(create_solutions(self.front), 1.0)
+
+        self.assertTrue(np.allclose(self.contributions, contributions))
+
+    def test_should_fitness_contributions_normalize_the_objectives(self):
+        scaled_front = [[2.0 * f1 - 1.0, 10.0 * f2] for f1, f2 in self.front]
+
+        contributions = _fitness_contributions(create_solutions(scaled_front), 1.0)
+
+        self.assertTrue(np.allclose(self.contributions, contributions))
+
+    def test_should_fitness_contributions_be_scaled_by_kappa(self):
+        contributions = _fitness_contributions(create_solutions(self.front), 0.5)
+
+        self.assertTrue(np.allclose(np.where(np.eye(3) == 1, 0.0, np.power(self.contributions, 2)), contributions))
+
+    def test_should_replacement_remove_the_solution_with_the_worst_fitness(self):
+        solutions = create_solutions(self.front)
+
+        survivors = self.create_ibea(2).replacement(solutions[:2], solutions[2:])
+
+        self.assertEqual(2, len(survivors))
+        for solution, survivor in zip(solutions, survivors):
+            self.assertIs(solution, survivor)
+            self.assertAlmostEqual(-exp(-1), survivor.attributes['fitness'])
+
+    def test_should_replacement_break_ties_removing_the_first_solution(self):
+        solutions = create_solutions(self.front)
+
+        # After removing C, A and B have the same fitness, -exp(-1)
+        survivors = self.create_ibea(1).replacement(solutions[:2], solutions[2:])
+
+        self.assertEqual(1, len(survivors))
+        self.assertIs(solutions[1], survivors[0])
+        self.assertAlmostEqual(0.0, survivors[0].attributes['fitness'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import random
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from jmetal.algorithm.multiobjective.omopso import OMOPSO
+from jmetal.algorithm.multiobjective.smpso import SMPSO, Chaotic_EMPSO
+from jmetal.operator import PolynomialMutation, UniformMutation
+from jmetal.operator.mutation import NonUniformMutation
+from jmetal.problem import ZDT1
+from jmetal.util.archive import CrowdingDistanceArchive
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+
+class SeededRunsTestCases(unittest.TestCase):
+
+    def run_with_seed(self, create_algorithm, numpy_seed: int) -> list:
+        random.seed(1)
+        np.random.seed(numpy_seed)
+        algorithm = create_algorithm()
+        algorithm.run()
+
+        return [solution.objectives for solution in algorithm.get_result()]
+
+    def test_should_two_smpso_runs_with_the_same_seed_give_the_same_front(self):
+        def create_algorithm():
+            problem = ZDT1(number_of_variables=5)
+            return SMPSO(problem=problem,
+                         swarm_size=10,
+                         mutation=PolynomialMutation(1.0 / 5, 20),
+                         leaders=CrowdingDistanceArchive(10),
+                         termination_criterion=StoppingByEvaluations(200))
+
+        self.assertEqual(self.run_with_seed(create_algorithm, 1), self.run_with_seed(create_algorithm, 2))
+
+    def test_should_two_omopso_runs_with_the_same_seed_give_the_same_front(self):
+        def create_algorithm():
+            problem = ZDT1(number_of_variables=5)
+            return OMOPSO(problem=problem,
+                          swarm_size=10,
+                          epsilon=0.0075,
+                          uniform_mutation=UniformMutation(1.0 / 5, 0.5),
+                          non_uniform_mutation=NonUniformMutation(1.0 / 5, 0.5, max_iterations=20),
+                          leaders=CrowdingDistanceArchive(10),
+                          termination_criterion=StoppingByEvaluations(200))
+
+        self.assertEqual(self.run_with_seed(create_algorithm, 1), self.run_with_seed(create_algorithm, 2))
+
+
+class ChaoticEMPSOTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = ZDT1(number_of_variables=5)
+        self.algorithm = Chaotic_EMPSO(problem=self.problem,
+                                       swarm_size=10,
+                                       mutation=PolynomialMutation(1.0 / 5, 20),
+                                       leaders=CrowdingDistanceArchive(10),
+                                       termination_criterion=StoppingByEvaluations(100),
+                                       chaotic_map='log')
+
+    def test_should_draw_r1_and_r2_from_the_two_chaotic_generators(self):
+        source = self.algorithm.chaotic_source
+
+        with mock.patch.object(source, 'chaosPoints', wraps=source.chaosPoints) as chaos_points:
+            self.algorithm.run()
+
+        self.assertEqual(100, self.algorithm.evaluations)
+        self.assertEqual(18, chaos_points.call_count)
+        self.assertEqual([((10, 5), 1), ((10, 5), 2)] * 9, [call.args for call in chaos_points.call_args_list])
+
+    def test_should_raise_an_exception_if_the_chaotic_map_is_unknown(self):
+        with self.assertRaises(Exception):
+            Chaotic_EMPSO(problem=self.problem,
+                          swarm_size=10,
+                          mutation=PolynomialMutation(1.0 / 5, 20),
+                          leaders=CrowdingDistanceArchive(10),
+                          chaotic_map='unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
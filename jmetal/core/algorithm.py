@@ -112,6 +112,7 @@ class EvolutionaryAlgorithm(Algorithm[S, R], ABC):
         self.problem = problem
         self.population_size = population_size
         self.offspring_population_size = offspring_population_size
+        self.iters = 0
 
     @abstractmethod
     def selection(self, population: List[S]) -> List[S]:
@@ -0,0 +1,341 @@
+from collections.abc import MutableMapping, Sequence
+from typing import List, Union, Iterable
+
+import numpy as np
+
+from jmetal.core.solution import FloatSolution
+
+"""
+.. module:: population
+   :platform: Unix, Windows
+   :synopsis: Array-backed population of float solutions.
+"""
+
+DEFAULT_COLUMNS = {
+    'dominance_ranking': np.int64,
+    'crowding_distance': np.float64,
+}
+
+
+class Population(Sequence):
+    """ Class representing a population of float solutions stored in contiguous NumPy matrices.
+
+    Decision variables, objectives and constraints are kept as (N, n), (N, m) and (N, k) arrays. Solution attributes
+    listed in :attr:`columns` (e.g., ranking and crowding distance) are stored as typed columns; any other attribute
+    falls back to a per-row dictionary. Indexing the population with an integer returns a :class:`FloatSolutionView`,
+    a lightweight row view satisfying the :class:`FloatSolution` interface that reads and writes the matrices in place.
+
+    Example:
+
+    >>> population = problem.create_population(100)
+    >>> population = evaluator.evaluate(population, problem)
+    >>> population.objectives.min(axis=0)
+    """
+
+    def __init__(self, lower_bound: List[float], upper_bound: List[float], number_of_objectives: int,
+                 number_of_constraints: int = 0, size: int = 0, columns: dict = None):
+        self.lower_bound = lower_bound
+        self.upper_bound = upper_bound
+        self.number_of_variables = len(lower_bound)
+        self.number_of_objectives = number_of_objectives
+        self.number_of_constraints = number_of_constraints
+
+        self.variables = np.zeros((size, self.number_of_variables), dtype=float)
+        self.objectives = np.zeros((size, number_of_objectives), dtype=float)
+        self.constraints = np.zeros((size, number_of_constraints), dtype=float)
+
+        self.columns = {}
+        self._present = {}
+        for name, dtype in (DEFAULT_COLUMNS if columns is None else columns).items():
+            self.add_column(name, dtype)
+
+        self._extra_attributes = [{} for _ in range(size)]
+
+    @classmethod
+    def from_solutions(cls, solutions: Iterable[FloatSolution], columns: dict = None) -> 'Population':
+        """ Builds a population by copying the values of a list of float solutions. """
+        solutions = list(solutions)
+        if len(solutions) == 0:
+            raise Exception('The solution list is empty')
+
+        first = solutions[0]
+        population = cls(first.lower_bound, first.upper_bound, first.number_of_objectives,
+                         first.number_of_constraints, len(solutions), columns)
+        for index, solution in enumerate(solutions):
+            population[index] = solution
+
+        return population
+
+    def add_column(self, name: str, dtype=np.float64) -> None:
+        """ Registers a typed attribute column. Values already stored in the per-row dictionaries are moved. """
+        if name in self.columns:
+            return
+
+        self.columns[name] = np.zeros(len(self), dtype=dtype)
+        self._present[name] = np.zeros(len(self), dtype=bool)
+
+        for index, extra in enumerate(getattr(self, '_extra_attributes', [])):
+            if name in extra:
+                self.columns[name][index] = extra.pop(name)
+                self._present[name][index] = True
+
+    def get_column(self, name: str) -> np.ndarray:
+        """ Returns the column of an attribute; rows where the attribute is unset contain NaN. """
+        values = self.columns[name].astype(float)
+        values[~self._present[name]] = np.nan
+
+        return values
+
+    def set_column(self, name: str, values, indices=None) -> None:
+        """ Sets an attribute for every row (or for the rows in `indices`) in a single call. """
+        if name not in self.columns:
+            self.add_column(name, np.asarray(values).dtype)
+
+        if indices is None:
+            indices = slice(None)
+
+        self.columns[name][indices] = values
+        self._present[name][indices] = True
+
+    def take(self, indices) -> 'Population':
+        """ Returns a new population holding a copy of the rows in `indices` (in that order). """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        population = Population(self.lower_bound, self.upper_bound, self.number_of_objectives,
+                                self.number_of_constraints, 0, {})
+
+        population.variables = self.variables[indices]
+        population.objectives = self.objectives[indices]
+        population.constraints = self.constraints[indices]
+        for name in self.columns:
+            population.columns[name] = self.columns[name][indices]
+            population._present[name] = self._present[name][indices]
+        population._extra_attributes = [self._extra_attributes[i].copy() for i in indices]
+
+        return population
+
+    def copy(self) -> 'Population':
+        return self.take(np.arange(len(self)))
+
+    def concatenate(self, other: Union['Population', List[FloatSolution]]) -> 'Population':
+        """ Returns a new population with the rows of this population followed by the rows of `other`. """
+        if not isinstance(other, Population):
+            if len(other) == 0:
+                return self.copy()
+            other = Population.from_solutions(other, {name: column.dtype for name, column in self.columns.items()})
+
+        population = Population(self.lower_bound, self.upper_bound, self.number_of_objectives,
+                                self.number_of_constraints, 0, {})
+        population.variables = np.concatenate((self.variables, other.variables))
+        population.objectives = np.concatenate((self.objectives, other.objectives))
+        population.constraints = np.concatenate((self.constraints, other.constraints))
+
+        for name in set(self.columns) | set(other.columns):
+            dtype = self.columns[name].dtype if name in self.columns else other.columns[name].dtype
+            population.columns[name] = np.concatenate((self._column_or_empty(name, dtype),
+                                                       other._column_or_empty(name, dtype)))
+            population._present[name] = np.concatenate((self._present.get(name, np.zeros(len(self), dtype=bool)),
+                                                         other._present.get(name, np.zeros(len(other), dtype=bool))))
+        population._extra_attributes = [extra.copy() for extra in self._extra_attributes + other._extra_attributes]
+
+        return population
+
+    def to_solutions(self) -> List[FloatSolution]:
+        """ Returns detached :class:`FloatSolution` copies of all the rows. """
+        return [self[index].__copy__() for index in range(len(self))]
+
+    def _column_or_empty(self, name: str, dtype) -> np.ndarray:
+        return self.columns[name] if name in self.columns else np.zeros(len(self), dtype=dtype)
+
+    def __len__(self) -> int:
+        return self.variables.shape[0]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.take(np.arange(len(self))[index])
+        elif isinstance(index, (list, np.ndarray)):
+            return self.take(index)
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Population index out of range: {}'.format(index))
+
+        return FloatSolutionView(self, index)
+
+    def __setitem__(self, index: int, solution: FloatSolution) -> None:
+        """ Copies the variables, objectives, constraints and attributes of a solution into row `index`. """
+        # The solution may be a view of this row, whose attributes are cleared below
+        solution_attributes = dict(solution.attributes)
+
+        self.variables[index] = solution.variables
+        self.objectives[index] = solution.objectives
+        if self.number_of_constraints > 0:
+            self.constraints[index] = solution.constraints
+
+        for name in self.columns:
+            self._present[name][index] = False
+        self._extra_attributes[index] = {}
+
+        attributes = self[index].attributes
+        for key, value in solution_attributes.items():
+            attributes[key] = value
+
+    def __add__(self, other: Union['Population', List[FloatSolution]]) -> 'Population':
+        return self.concatenate(other)
+
+    def __radd__(self, other: List[FloatSolution]) -> 'Population':
+        if len(other) == 0:
+            return self.copy()
+
+        return Population.from_solutions(other, {name: column.dtype for name, column in self.columns.items()}) \
+            .concatenate(self)
+
+    def __str__(self) -> str:
+        return 'Population(size={},variables={},objectives={},constraints={})'.format(
+            len(self), self.number_of_variables, self.number_of_objectives, self.number_of_constraints)
+
+
+class FloatSolutionView(FloatSolution):
+    """ Row view of a :class:`Population`. Reading or writing its variables, objectives, constraints and attributes
+    reads or writes the underlying matrices; copying it returns a detached :class:`FloatSolution`. """
+
+    __slots__ = ('population', 'index')
+
+    def __init__(self, population: Population, index: int):
+        self.population = population
+        self.index = index
+
+    @property
+    def lower_bound(self):
+        return self.population.lower_bound
+
+    @property
+    def upper_bound(self):
+        return self.population.upper_bound
+
+    @property
+    def number_of_variables(self) -> int:
+        return self.population.number_of_variables
+
+    @property
+    def number_of_objectives(self) -> int:
+        return self.population.number_of_objectives
+
+    @property
+    def number_of_constraints(self) -> int:
+        return self.population.number_of_constraints
+
+    @property
+    def variables(self) -> np.ndarray:
+        return self.population.variables[self.index]
+
+    @variables.setter
+    def variables(self, values) -> None:
+        self.population.variables[self.index] = values
+
+    @property
+    def objectives(self) -> np.ndarray:
+        return self.population.objectives[self.index]
+
+    @objectives.setter
+    def objectives(self, values) -> None:
+        self.population.objectives[self.index] = values
+
+    @property
+    def constraints(self) -> np.ndarray:
+        return self.population.constraints[self.index]
+
+    @constraints.setter
+    def constraints(self, values) -> None:
+        self.population.constraints[self.index] = values
+
+    @property
+    def attributes(self) -> '_RowAttributes':
+        return _RowAttributes(self.population, self.index)
+
+    @attributes.setter
+    def attributes(self, values: dict) -> None:
+        attributes = _RowAttributes(self.population, self.index)
+        attributes.clear()
+        attributes.update(values)
+
+    def __copy__(self) -> FloatSolution:
+        new_solution = FloatSolution(
+            self.lower_bound,
+            self.upper_bound,
+            self.number_of_objectives,
+            self.number_of_constraints)
+        new_solution.variables = self.variables.tolist()
+        new_solution.objectives = self.objectives.tolist()
+        new_solution.constraints = self.constraints.tolist()
+
+        new_solution.attributes = self.attributes.copy()
+
+        return new_solution
+
+    def __deepcopy__(self, memo) -> FloatSolution:
+        return self.__copy__()
+
+    def __reduce_ex__(self, protocol):
+        # Views are pickled as detached solutions so that the whole population is never serialized
+        return _detached, (self.__copy__(),)
+
+    def __eq__(self, solution) -> bool:
+        if isinstance(solution, FloatSolution):
+            return np.array_equal(self.variables, solution.variables)
+        return False
+
+    def __hash__(self):
+        # Consistent with __eq__: equal views (or views equal to solutions) have the same variables
+        return hash(tuple(self.variables.tolist()))
+
+
+def _detached(solution: FloatSolution) -> FloatSolution:
+    return solution
+
+
+class _RowAttributes(MutableMapping):
+    """ Dictionary-like access to the attributes of a population row. """
+
+    __slots__ = ('population', 'index')
+
+    def __init__(self, population: Population, index: int):
+        self.population = population
+        self.index = index
+
+    def __getitem__(self, key):
+        population = self.population
+        if key in population.columns:
+            if population._present[key][self.index]:
+                return population.columns[key][self.index].item()
+            raise KeyError(key)
+
+        return population._extra_attributes[self.index][key]
+
+    def __setitem__(self, key, value) -> None:
+        population = self.population
+        if key in population.columns:
+            population.columns[key][self.index] = value
+            population._present[key][self.index] = True
+        else:
+            population._extra_attributes[self.index][key] = value
+
+    def __delitem__(self, key) -> None:
+        population = self.population
+        if key in population.columns and population._present[key][self.index]:
+            population._present[key][self.index] = False
+        else:
+            del population._extra_attributes[self.index][key]
+
+    def __iter__(self):
+        population = self.population
+        for key in population.columns:
+            if population._present[key][self.index]:
+                yield key
+        yield from population._extra_attributes[self.index]
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def copy(self) -> dict:
+        return dict(self)
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar, List
 
 from jmetal.core.observer import Observer
+from jmetal.core.population import Population
 from jmetal.core.solution import BinarySolution, FloatSolution, IntegerSolution, PermutationSolution
 
 LOGGER = logging.getLogger('jmetal')
@@ -12,7 +13,12 @@ S = TypeVar('S')
 
 
 class Problem(Generic[S], ABC):
-	""" Class representing problems. """
+	""" Class representing problems.
+
+	Problems may optionally provide a vectorized method `evaluate_batch(X: ndarray) -> (F, G)` receiving an (N, n)
+	matrix of decision variables and returning the (N, m) matrix of objective values and the (N, k) matrix of
+	constraint values (or None if the problem is unconstrained). Evaluators use it, when available, to evaluate a whole
+	population with a single call (see :meth:`supports_batch_evaluation`). """
 
 	MINIMIZE = -1
 	MAXIMIZE = 1
@@ -46,6 +52,30 @@ class Problem(Generic[S], ABC):
 	def get_name(self) -> str:
 		pass
 
+	def supports_batch_evaluation(self) -> bool:
+		""" Checks whether the problem provides an `evaluate_batch` method consistent with its `evaluate` and
+		`evaluate_constraints` methods, i.e., defined in the same class as each of them or in a subclass of it. The
+		constraints may also be computed by an `evaluate_constraints_batch` method, which is then the one checked against
+		`evaluate_constraints`. Subclasses overriding only `evaluate` or `evaluate_constraints` thus fall back to the
+		solution-by-solution evaluation.
+
+		:return: True if the problem can be evaluated in batch. """
+		mro = type(self).__mro__
+
+		def owner(method: str):
+			return next((cls for cls in mro if method in cls.__dict__), None)
+
+		batch_owner = owner('evaluate_batch')
+		if batch_owner is None or batch_owner.__dict__['evaluate_batch'] is None:
+			return False
+
+		for method, batch_method in (('evaluate', 'evaluate_batch'), ('evaluate_constraints', 'evaluate_constraints_batch')):
+			method_owner = owner(method)
+			if method_owner is not None and not issubclass(owner(batch_method) or batch_owner, method_owner):
+				return False
+
+		return True
+
 
 class DynamicProblem(Problem[S], Observer, ABC):
 
@@ -93,6 +123,24 @@ class FloatProblem(Problem[FloatSolution], ABC):
 
 		return new_solution
 
+	def create_population(self, size: int) -> Population:
+		""" Creates a random population of `size` solutions stored in contiguous arrays (see
+		:class:`jmetal.core.population.Population`). The variables are drawn with the :mod:`random` module in the same
+		order as :meth:`create_solution`, so that the population is that of `size` calls to it with the same seed.
+
+		:return: Population. """
+		population = Population(
+			self.lower_bound,
+			self.upper_bound,
+			self.number_of_objectives,
+			self.number_of_constraints,
+			size)
+		for variables in population.variables:
+			variables[:] = [random.uniform(self.lower_bound[i] * 1.0, self.upper_bound[i] * 1.0) for i in
+							range(self.number_of_variables)]
+
+		return population
+
 
 class IntegerProblem(Problem[IntegerSolution], ABC):
 	""" Class representing integer problems. """
@@ -0,0 +1,187 @@
+import copy
+import pickle
+import random
+import unittest
+
+import numpy as np
+
+from jmetal.core.population import Population, FloatSolutionView
+from jmetal.core.problem import FloatProblem
+from jmetal.core.solution import FloatSolution
+from jmetal.util.evaluator import SequentialEvaluator
+
+
+class DummyFloatProblem(FloatProblem):
+
+    def __init__(self):
+        super(DummyFloatProblem, self).__init__()
+        self.number_of_variables = 3
+        self.number_of_objectives = 2
+        self.number_of_constraints = 1
+
+        self.lower_bound = [-1.0, -2.0, -3.0]
+        self.upper_bound = [1.0, 2.0, 3.0]
+
+    def evaluate(self, solution: FloatSolution) -> FloatSolution:
+        solution.objectives[0] = sum(solution.variables)
+        solution.objectives[1] = solution.variables[0] * 2.0
+        solution.constraints[0] = -1.0
+
+        return solution
+
+    def get_name(self) -> str:
+        return 'Dummy'
+
+
+class PopulationTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = DummyFloatProblem()
+
+    def test_should_create_population_allocate_the_matrices(self):
+        population = self.problem.create_population(10)
+
+        self.assertEqual(10, len(population))
+        self.assertEqual((10, 3), population.variables.shape)
+        self.assertEqual((10, 2), population.objectives.shape)
+        self.assertEqual((10, 1), population.constraints.shape)
+
+    def test_should_create_population_respect_the_bounds(self):
+        population = self.problem.create_population(100)
+
+        self.assertTrue((population.variables >= np.array(self.problem.lower_bound)).all())
+        self.assertTrue((population.variables <= np.array(self.problem.upper_bound)).all())
+
+    def test_should_create_population_draw_the_variables_of_create_solution_with_the_same_seed(self):
+        random.seed(1)
+        np.random.seed(1)
+        solutions = [self.problem.create_solution() for _ in range(5)]
+        random.seed(1)
+        np.random.seed(2)
+        population = self.problem.create_population(5)
+
+        self.assertEqual([solution.variables for solution in solutions], population.variables.tolist())
+
+    def test_should_row_views_satisfy_the_solution_interface(self):
+        population = self.problem.create_population(2)
+        solution = population[1]
+
+        self.assertIsInstance(solution, FloatSolutionView)
+        self.assertIsInstance(solution, FloatSolution)
+        self.assertEqual(3, solution.number_of_variables)
+        self.assertEqual(2, solution.number_of_objectives)
+        self.assertEqual(1, solution.number_of_constraints)
+
+    def test_should_row_views_write_into_the_matrices(self):
+        population = self.problem.create_population(2)
+
+        population[0].variables[1] = 0.5
+        population[1].objectives = [3.0, 4.0]
+
+        self.assertEqual(0.5, population.variables[0, 1])
+        self.assertEqual([3.0, 4.0], population.objectives[1].tolist())
+
+    def test_should_typed_attributes_be_stored_in_columns(self):
+        population = self.problem.create_population(3)
+
+        population[0].attributes['dominance_ranking'] = 2
+        population[1].attributes['crowding_distance'] = float('inf')
+        population[2].attributes['local_best'] = 'any'
+
+        self.assertEqual(2, population.columns['dominance_ranking'][0])
+        self.assertEqual(float('inf'), population.columns['crowding_distance'][1])
+        self.assertIsNone(population[1].attributes.get('dominance_ranking'))
+        self.assertEqual('any', population[2].attributes['local_best'])
+
+    def test_should_set_column_set_the_attribute_of_every_row(self):
+        population = self.problem.create_population(3)
+
+        population.set_column('fitness', np.array([1.0, 2.0, 3.0]))
+
+        self.assertEqual(2.0, population[1].attributes['fitness'])
+
+    def test_should_equal_views_have_the_same_hash(self):
+        population = self.problem.create_population(3)
+        population.variables[2] = population.variables[0]
+
+        self.assertEqual(population[0], population[2])
+        self.assertEqual(hash(population[0]), hash(population[2]))
+        self.assertEqual(2, len({population[0], population[1], population[2]}))
+
+    def test_should_assigning_a_row_to_itself_keep_its_attributes(self):
+        population = self.problem.create_population(2)
+        population.add_column('fitness')
+        population[0].attributes['fitness'] = 1.5
+        population[0].attributes['label'] = 'a'
+
+        population[0] = population[0]
+
+        self.assertEqual(1.5, population[0].attributes['fitness'])
+        self.assertEqual('a', population[0].attributes['label'])
+
+    def test_should_copy_of_a_view_return_a_detached_solution(self):
+        population = self.problem.create_population(1)
+        population[0].attributes['dominance_ranking'] = 1
+
+        new_solution = copy.copy(population[0])
+        new_solution.variables[0] = 10.0
+
+        self.assertIs(FloatSolution, type(new_solution))
+        self.assertEqual(1, new_solution.attributes['dominance_ranking'])
+        self.assertNotEqual(10.0, population.variables[0, 0])
+        self.assertIs(FloatSolution, type(copy.deepcopy(population[0])))
+
+    def test_should_pickle_a_view_as_a_detached_solution(self):
+        population = self.problem.create_population(1)
+
+        solution = pickle.loads(pickle.dumps(population[0]))
+
+        self.assertIs(FloatSolution, type(solution))
+        self.assertEqual(population.variables[0].tolist(), solution.variables)
+
+    def test_should_from_solutions_copy_the_values(self):
+        solutions = [self.problem.create_solution() for _ in range(4)]
+        solutions[2].attributes['crowding_distance'] = 0.5
+
+        population = Population.from_solutions(solutions)
+
+        self.assertEqual(solutions[3].variables, population.variables[3].tolist())
+        self.assertEqual(0.5, population[2].attributes['crowding_distance'])
+
+    def test_should_concatenate_join_two_populations(self):
+        population = self.problem.create_population(2)
+        offspring = self.problem.create_population(3)
+        offspring[0].attributes['dominance_ranking'] = 0
+
+        join_population = population + offspring
+
+        self.assertEqual(5, len(join_population))
+        self.assertEqual(offspring.variables.tolist(), join_population.variables[2:].tolist())
+        self.assertEqual(0, join_population[2].attributes['dominance_ranking'])
+
+    def test_should_add_a_list_to_a_population(self):
+        population = self.problem.create_population(2)
+        solutions = [self.problem.create_solution()]
+
+        self.assertEqual(3, len(population + solutions))
+        self.assertEqual(3, len(solutions + population))
+
+    def test_should_take_return_the_selected_rows(self):
+        population = self.problem.create_population(5)
+
+        selected = population.take([4, 0])
+
+        self.assertEqual([population.variables[4].tolist(), population.variables[0].tolist()],
+                         selected.variables.tolist())
+
+    def test_should_sequential_evaluator_evaluate_a_population(self):
+        population = self.problem.create_population(4)
+
+        SequentialEvaluator().evaluate(population, self.problem)
+
+        self.assertEqual(population.variables.sum(axis=1).tolist(), population.objectives[:, 0].tolist())
+        self.assertEqual([-1.0] * 4, population.constraints[:, 0].tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -212,60 +212,45 @@ class RankingAndCrowdingDistanceSelection(Selection[List[S], List[S]]):
 
 
 class RankingAndFitnessSelection(Selection[List[S], List[S]]):
+    """ Environmental selection of HypE: the solutions are ranked and the last front is truncated by removing, one by
+    one, the solution with the lowest hypervolume-based fitness.
+
+    The fitness is computed exactly with up to `exact_objectives` objectives. With more objectives it is estimated by
+    sampling `samples` points of the box bounded by the reference point, as proposed in:
+
+    * J. Bader and E. Zitzler. HypE: An Algorithm for Fast Hypervolume-Based Many-Objective Optimization. Evolutionary
+      Computation, 19(1):45-76, 2011.
+    """
 
     def __init__(self,
                  max_population_size: int, reference_point: S,
-                 dominance_comparator: Comparator = DominanceComparator()):
+                 dominance_comparator: Comparator = DominanceComparator(),
+                 samples: int = 10000,
+                 seed: int = None,
+                 exact_objectives: int = 3):
         super(RankingAndFitnessSelection, self).__init__()
         self.max_population_size = max_population_size
         self.dominance_comparator = dominance_comparator
         self.reference_point = reference_point
-
-    def hypesub(self, l, A, actDim, bounds, pvec, alpha, k):
-        h = [0 for _ in range(l)]
-        Adim = [a[actDim - 1] for a in A]
-        indices_sort = sorted(range(len(Adim)), key=Adim.__getitem__)
-        S = [A[j] for j in indices_sort]
-        pvec = [pvec[j] for j in indices_sort]
-
-        for i in range(1, len(S) + 1):
-            if i < len(S):
-                extrusion = S[i][actDim - 1] - S[i - 1][actDim - 1]
-            else:
-                extrusion = bounds[actDim - 1] - S[i - 1][actDim - 1]
-
-            if actDim == 1:
-                if i > k:
-                    break
-                if all(alpha) >= 0:
-                    for p in pvec[0:i]:
-                        h[p] = h[p] + extrusion * alpha[i - 1]
-            else:
-                if extrusion > 0:
-                    h = [h[j] + extrusion * self.hypesub(l, S[0:i], actDim - 1, bounds, pvec[0:i], alpha, k)[j] for j in
-                         range(l)]
-
-        return h
+        self.samples = samples
+        self.exact_objectives = exact_objectives
+        self.random = np.random.default_rng(seed)
 
     def compute_hypervol_fitness_values(self, population: List[S], reference_point: S, k: int):
-        points = [ind.objectives for ind in population]
-        bounds = reference_point.objectives
-        population_size = len(points)
+        points = np.array([ind.objectives for ind in population], dtype=float)
+        bounds = np.asarray(reference_point.objectives, dtype=float)
 
         if k < 0:
-            k = population_size
-
-        actDim = len(bounds)
-        pvec = range(population_size)
-        alpha = []
+            k = len(population)
 
-        for i in range(1, k + 1):
-            alpha.append(np.prod([float(k - j) / (population_size - j) for j in range(1, i)]) / i)
-
-        f = self.hypesub(population_size, points, actDim, bounds, pvec, alpha, k)
+        if len(bounds) <= self.exact_objectives:
+            fitness = _hype_exact_fitness(points, bounds, _hype_alpha(len(population), k))
+        else:
+            dominance, volume = self.__sample_dominance(points, bounds)
+            fitness = _hype_sampled_fitness(dominance, volume, _hype_alpha(len(population), k))
 
         for i in range(len(population)):
-            population[i].attributes['fitness'] = f[i]
+            population[i].attributes['fitness'] = float(fitness[i])
 
         return population
 
@@ -289,18 +274,149 @@ class RankingAndFitnessSelection(Selection[List[S], List[S]]):
             else:
                 subfront = ranking.get_subfront(ranking_index)
                 parameter_K = len(subfront) - (self.max_population_size - len(new_solution_list))
-                while parameter_K > 0:
-                    subfront = self.compute_hypervol_fitness_values(subfront, self.reference_point, parameter_K)
-                    subfront = sorted(subfront, key=lambda x: x.attributes['fitness'], reverse=True)
-                    subfront = subfront[:-1]
-                    parameter_K = parameter_K - 1
+                if len(self.reference_point.objectives) <= self.exact_objectives:
+                    while parameter_K > 0:
+                        subfront = self.compute_hypervol_fitness_values(subfront, self.reference_point, parameter_K)
+                        subfront = sorted(subfront, key=lambda x: x.attributes['fitness'], reverse=True)
+                        subfront = subfront[:-1]
+                        parameter_K = parameter_K - 1
+                else:
+                    subfront = self.__sampled_truncation(subfront, parameter_K)
                 new_solution_list = new_solution_list + subfront
         return new_solution_list
 
+    def __sampled_truncation(self, subfront: List[S], parameter_K: int) -> List[S]:
+        """ Removes `parameter_K` solutions, estimating the fitness at every step with the same samples, so that the
+        dominance of the samples is only computed once. """
+        points = np.array([solution.objectives for solution in subfront], dtype=float)
+        dominance, volume = self.__sample_dominance(points, np.asarray(self.reference_point.objectives, dtype=float))
+        dominance = dominance.astype(float)
+        counts = dominance.sum(axis=1).astype(np.int64)
+        columns = {id(solution): column for column, solution in enumerate(subfront)}
+
+        while parameter_K > 0:
+            fitness = _hype_sampled_fitness(dominance, volume, _hype_alpha(len(subfront), parameter_K), counts)
+            for solution in subfront:
+                solution.attributes['fitness'] = float(fitness[columns[id(solution)]])
+
+            subfront = sorted(subfront, key=lambda x: x.attributes['fitness'], reverse=True)
+            counts -= dominance[:, columns[id(subfront[-1])]].astype(np.int64)
+            subfront = subfront[:-1]
+            parameter_K = parameter_K - 1
+
+        return subfront
+
+    def __sample_dominance(self, points: np.ndarray, bounds: np.ndarray) -> tuple:
+        """ Samples the box between the ideal point of the population and the reference point.
+
+        :return: Matrix telling which points dominate each sample, and volume represented by each sample.
+        """
+        lower_bound = np.minimum(points.min(axis=0), bounds)
+        samples = self.random.uniform(lower_bound, bounds, (self.samples, len(bounds)))
+
+        dominance = np.empty((self.samples, len(points)), dtype=bool)
+        batch_size = max(1, 2 ** 22 // max(1, points.size))
+        for start in range(0, self.samples, batch_size):
+            batch = samples[start:start + batch_size]
+            dominance[start:start + batch_size] = np.all(points[None, :, :] <= batch[:, None, :], axis=2)
+
+        return dominance, float(np.prod(bounds - lower_bound)) / self.samples
+
     def get_name(self) -> str:
         return 'Ranking and fitness selection'
 
 
+def _hype_alpha(population_size: int, k: int) -> np.ndarray:
+    """ Weight of a region dominated by i solutions (i = 1, ..., k) in the HypE fitness. """
+    i = np.arange(1, k + 1)
+    ratios = (k - i[:-1]) / (population_size - i[:-1])
+
+    return np.concatenate(([1.0], np.cumprod(ratios))) / i
+
+
+def _hype_sampled_fitness(dominance: np.ndarray, volume: float, alpha: np.ndarray,
+                          counts: np.ndarray = None) -> np.ndarray:
+    """ Every sample dominated by i <= k solutions adds alpha_i to the fitness of each of them. If given, `counts` holds
+    the number of dominating solutions of every sample, as some columns of `dominance` may belong to removed ones. """
+    if counts is None:
+        counts = np.count_nonzero(dominance, axis=1)
+    weights = np.concatenate(([0.0], alpha, np.zeros(max(0, dominance.shape[1] + 1 - len(alpha)))))[counts]
+
+    return volume * (weights @ dominance)
+
+
+def _hype_exact_fitness(points: np.ndarray, bounds: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """ Exact HypE fitness for up to three objectives. The space is swept along the last objective: every slab is
+    dominated by the solutions with a lower value, whose fitness in the remaining objectives is weighted by the slab
+    width. """
+    population_size, number_of_objectives = points.shape
+    fitness = np.zeros(population_size)
+    if population_size == 0:
+        return fitness
+
+    if number_of_objectives == 1:
+        return _hype_one_objective_fitness(points[:, 0], bounds[0], alpha)
+    if number_of_objectives == 2:
+        return _hype_two_objective_fitness(points, bounds, alpha)
+
+    order = np.argsort(points[:, -1], kind='stable')
+    widths = np.maximum(np.diff(np.append(points[order, -1], bounds[-1])), 0.0)
+    for i in np.flatnonzero(widths > 0).tolist():
+        members = order[:i + 1]
+        fitness[members] += widths[i] * _hype_exact_fitness(points[members, :-1], bounds[:-1], alpha)
+
+    return fitness
+
+
+def _hype_one_objective_fitness(values: np.ndarray, bound: float, alpha: np.ndarray) -> np.ndarray:
+    """ The segment after the i-th lowest value is dominated by i solutions, and its weighted width is added to the
+    fitness of all of them. """
+    order = np.argsort(values, kind='stable')
+    widths = np.diff(np.append(values[order], bound))
+    weights = np.zeros(len(values))
+    weights[:len(alpha)] = alpha[:len(weights)]
+
+    fitness = np.empty(len(values))
+    fitness[order] = np.cumsum((widths * weights)[::-1])[::-1]
+
+    return fitness
+
+
+def _hype_two_objective_fitness(points: np.ndarray, bounds: np.ndarray, alpha: np.ndarray) -> np.ndarray:
+    """ Two-objective case of :func:`_hype_exact_fitness`, with the one-objective fitness of every slab computed at once
+    on a (slabs x solutions) matrix whose columns are sorted by the first objective. """
+    population_size = len(points)
+    y_order = np.argsort(points[:, 1], kind='stable')
+    slab_widths = np.maximum(np.diff(np.append(points[y_order, 1], bounds[1])), 0.0)
+
+    x_order = np.argsort(points[:, 0], kind='stable')
+    x = points[x_order, 0]
+    y_ranks = np.empty(population_size, dtype=np.int64)
+    y_ranks[y_order] = np.arange(population_size)
+
+    # members[i, c]: the solution in column c (by first objective) is among the i + 1 lowest in the second one
+    members = y_ranks[x_order][None, :] <= np.arange(population_size)[:, None]
+
+    # Width of the segment following every member, up to the next member or the bound
+    next_x = np.where(members, x[None, :], np.inf)
+    next_x = np.minimum.accumulate(next_x[:, ::-1], axis=1)[:, ::-1]
+    next_x = np.concatenate((next_x[:, 1:], np.full((population_size, 1), np.inf)), axis=1)
+    next_x[np.isinf(next_x)] = bounds[0]
+    widths = np.where(members, next_x - x[None, :], 0.0)
+
+    # The segment following the member of rank q is dominated by q + 1 solutions
+    weights = np.zeros(population_size)
+    weights[:len(alpha)] = alpha[:len(weights)]
+    ranks = np.cumsum(members, axis=1) - 1
+    segment_values = np.where(members, widths * weights[ranks], 0.0)
+    member_values = np.cumsum(segment_values[:, ::-1], axis=1)[:, ::-1]
+
+    fitness = np.empty(population_size)
+    fitness[x_order] = slab_widths @ np.where(members, member_values, 0.0)
+
+    return fitness
+
+
 class BinaryTournament2Selection(Selection[List[S], S]):
 
     def __init__(self, comparator_list: List[Comparator]):
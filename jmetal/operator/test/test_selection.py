@@ -1,11 +1,12 @@
 import unittest
 
+import numpy as np
 from hamcrest import assert_that, any_of
 
 from jmetal.core.solution import Solution
 from jmetal.operator.selection import BinaryTournamentSelection, BestSolutionSelection, RandomSolutionSelection, \
     NaryRandomSolutionSelection, RankingAndCrowdingDistanceSelection, BinaryTournament2Selection, \
-    DifferentialEvolutionSelection
+    DifferentialEvolutionSelection, RankingAndFitnessSelection
 from jmetal.util.comparator import SolutionAttributeComparator, EqualSolutionsComparator
 
 
@@ -334,6 +335,62 @@ class DominanceRankingTestCases(unittest.TestCase):
         self.assertEqual(solution2, list_of_crowding_and_rankings[4])
 
 
+class RankingAndFitnessSelectionTestCases(unittest.TestCase):
+
+    def create_solutions(self, points):
+        solutions = []
+        for point in points:
+            solution = Solution(2, len(point))
+            solution.objectives = list(point)
+            solutions.append(solution)
+
+        return solutions
+
+    def test_should_compute_the_exact_hype_fitness(self):
+        """
+         3 .   .   .
+         2 1   .   .      Point 1 and point 2 dominate an area of 1 each one on their own, and they share an area
+         1     2   .      of 1 which is split between them (alpha_2 = 1/2 when k = 2)
+         0 1   2   3
+        """
+        reference_point = Solution(2, 2)
+        reference_point.objectives = [3.0, 3.0]
+        solution_list = self.create_solutions([[1.0, 2.0], [2.0, 1.0]])
+
+        RankingAndFitnessSelection(1, reference_point).compute_hypervol_fitness_values(solution_list,
+                                                                                        reference_point, 2)
+
+        self.assertEqual(1.5, solution_list[0].attributes['fitness'])
+        self.assertEqual(1.5, solution_list[1].attributes['fitness'])
+
+    def test_should_the_sampled_hype_fitness_be_close_to_the_exact_one(self):
+        points = np.random.default_rng(0).random((20, 3))
+        reference_point = Solution(2, 3)
+        reference_point.objectives = [1.0, 1.0, 1.0]
+        exact_list = self.create_solutions(points)
+        sampled_list = self.create_solutions(points)
+
+        RankingAndFitnessSelection(10, reference_point).compute_hypervol_fitness_values(exact_list, reference_point, 5)
+        RankingAndFitnessSelection(10, reference_point, samples=200000, seed=1, exact_objectives=2) \
+            .compute_hypervol_fitness_values(sampled_list, reference_point, 5)
+
+        exact_fitness = [solution.attributes['fitness'] for solution in exact_list]
+        sampled_fitness = [solution.attributes['fitness'] for solution in sampled_list]
+        self.assertTrue(np.allclose(exact_fitness, sampled_fitness, atol=0.005))
+
+    def test_should_execute_truncate_a_many_objective_front(self):
+        points = np.random.default_rng(1).random((30, 6))
+        points /= np.linalg.norm(points, axis=1, keepdims=True)
+        reference_point = Solution(2, 6)
+        reference_point.objectives = [1.1] * 6
+
+        selection = RankingAndFitnessSelection(20, reference_point, samples=2000, seed=1)
+        result_list = selection.execute(self.create_solutions(points))
+
+        self.assertEqual(20, len(result_list))
+        self.assertEqual(20, len(set(id(solution) for solution in result_list)))
+
+
 class BinaryTournament2TestCases(unittest.TestCase):
 
     def test_should_constructor_create_a_non_null_object(self):
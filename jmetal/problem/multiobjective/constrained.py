@@ -1,5 +1,7 @@
 from math import pi, cos, atan
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -45,6 +47,17 @@ class Srinivas(FloatProblem):
         solution.constraints[0] = 1.0 - (x1 * x1 + x2 * x2) / 225.0
         solution.constraints[1] = (3.0 * x2 - x1) / 10.0 - 1.0
 
+    def evaluate_batch(self, x: np.ndarray):
+        x1 = x[:, 0]
+        x2 = x[:, 1]
+
+        f = np.column_stack((2.0 + (x1 - 2.0) * (x1 - 2.0) + (x2 - 1.0) * (x2 - 1.0),
+                             9.0 * x1 - (x2 - 1.0) * (x2 - 1.0)))
+        g = np.column_stack((1.0 - (x1 * x1 + x2 * x2) / 225.0,
+                             (3.0 * x2 - x1) / 10.0 - 1.0))
+
+        return f, g
+
     def get_name(self):
         return 'Srinivas'
 
@@ -87,6 +100,15 @@ class Tanaka(FloatProblem):
         #set_overall_constraint_violation_degree(solution)
 
 
+    def evaluate_batch(self, x: np.ndarray):
+        x1 = x[:, 0]
+        x2 = x[:, 1]
+
+        g = np.column_stack((x1 * x1 + x2 * x2 - 1.0 - 0.1 * np.cos(16.0 * np.arctan(x1 / x2)),
+                             -2.0 * ((x1 - 0.5) * (x1 - 0.5) + (x2 - 0.5) * (x2 - 0.5) - 0.5)))
+
+        return x[:, :2].copy(), g
+
     def get_name(self):
         return 'Tanaka'
 
@@ -137,6 +159,22 @@ class Osyczka2(FloatProblem):
 
         solution.constraints = constraints
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((-(25.0 * (x[:, 0] - 2.0) ** 2 +
+                               (x[:, 1] - 2.0) ** 2 +
+                               (x[:, 2] - 1.0) ** 2 +
+                               (x[:, 3] - 4.0) ** 2 +
+                               (x[:, 4] - 1.0) ** 2),
+                             (x ** 2).sum(axis=1)))
+        g = np.column_stack(((x[:, 0] + x[:, 1]) / 2.0 - 1.0,
+                             (6.0 - x[:, 0] - x[:, 1]) / 6.0,
+                             (2.0 - x[:, 1] + x[:, 0]) / 2.0,
+                             (2.0 - x[:, 0] + 3.0 * x[:, 1]) / 2.0,
+                             (4.0 - (x[:, 2] - 3.0) * (x[:, 2] - 3.0) - x[:, 3]) / 4.0,
+                             ((x[:, 4] - 3.0) * (x[:, 4] - 3.0) + x[:, 5] - 4.0) / 4.0))
+
+        return f, g
+
     def get_name(self):
         return 'Osyczka2'
 
@@ -175,5 +213,15 @@ class Binh2(FloatProblem):
         constraints[0] = -1.0 * (x[0] - 5) * (x[0] - 5) - x[1] * x[1] + 25.0
         constraints[1] = (x[0] - 8) * (x[0] - 8) + (x[1] + 3) * (x[1] + 3) - 7.7
 
+        solution.constraints = constraints
+
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((4.0 * x[:, 0] * x[:, 0] + 4 * x[:, 1] * x[:, 1],
+                             (x[:, 0] - 5.0) * (x[:, 0] - 5.0) + (x[:, 1] - 5.0) * (x[:, 1] - 5.0)))
+        g = np.column_stack((-1.0 * (x[:, 0] - 5) * (x[:, 0] - 5) - x[:, 1] * x[:, 1] + 25.0,
+                             (x[:, 0] - 8) * (x[:, 0] - 8) + (x[:, 1] + 3) * (x[:, 1] + 3) - 7.7))
+
+        return f, g
+
     def get_name(self):
         return 'Binh2'
@@ -1,5 +1,7 @@
 from math import pi, cos, sin
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -12,6 +14,19 @@ from jmetal.core.solution import FloatSolution
 """
 
 
+def _front_shape(radius: np.ndarray, factors: np.ndarray, last_factors: np.ndarray) -> np.ndarray:
+    """ Vectorized DTLZ shape function: f_i = radius * prod(factors[:, :m-1-i]) * last_factors[:, m-1-i], the last
+    factor being omitted for the first objective. Both factor matrices have shape (N, m - 1). """
+    number_of_objectives = factors.shape[1] + 1
+    products = np.column_stack((np.ones(factors.shape[0]), np.cumprod(factors, axis=1)))
+
+    indices = number_of_objectives - 1 - np.arange(number_of_objectives)
+    f = radius[:, None] * products[:, indices]
+    f[:, 1:] *= last_factors[:, indices[1:]]
+
+    return f
+
+
 class DTLZ1(FloatProblem):
     """ Problem DTLZ1. Continuous problem having a flat Pareto front
 
@@ -51,6 +66,16 @@ class DTLZ1(FloatProblem):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        y = x[:, self.number_of_variables - k:] - 0.5
+        g = 100 * (k + (y * y - np.cos(20.0 * pi * y)).sum(axis=1))
+
+        position = x[:, :self.number_of_objectives - 1]
+
+        return _front_shape((1.0 + g) * 0.5, position, 1 - position), None
+
     def get_name(self):
         return 'DTLZ1'
 
@@ -82,6 +107,15 @@ class DTLZ2(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = ((x[:, self.number_of_variables - k:] - 0.5) ** 2).sum(axis=1)
+
+        angles = x[:, :self.number_of_objectives - 1] * 0.5 * pi
+
+        return _front_shape(1.0 + g, np.cos(angles), np.sin(angles)), None
+
     def get_name(self):
         return 'DTLZ2'
 
@@ -117,6 +151,16 @@ class DTLZ3(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        y = x[:, self.number_of_variables - k:] - 0.5
+        g = 100.0 * (k + (y ** 2 - np.cos(20.0 * pi * y)).sum(axis=1))
+
+        angles = x[:, :self.number_of_objectives - 1] * 0.5 * pi
+
+        return _front_shape(1.0 + g, np.cos(angles), np.sin(angles)), None
+
     def get_name(self):
         return 'DTLZ3'
 
@@ -151,6 +195,16 @@ class DTLZ4(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        alpha = 100.0
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = ((x[:, self.number_of_variables - k:] - 0.5) ** 2).sum(axis=1)
+
+        angles = x[:, :self.number_of_objectives - 1] ** alpha * pi / 2.0
+
+        return _front_shape(1.0 + g, np.cos(angles), np.sin(angles)), None
+
     def get_name(self):
         return 'DTLZ4'
 
@@ -190,6 +244,18 @@ class DTLZ5(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = ((x[:, self.number_of_variables - k:] - 0.5) ** 2).sum(axis=1)
+        t = pi / (4.0 * (1.0 + g))
+
+        theta = np.empty((x.shape[0], self.number_of_objectives - 1))
+        theta[:, 0] = x[:, 0] * pi / 2.0
+        theta[:, 1:] = t[:, None] * (1.0 + 2.0 * g[:, None] * x[:, 1:self.number_of_objectives - 1])
+
+        return _front_shape(1.0 + g, np.cos(theta), np.sin(theta)), None
+
     def get_name(self):
         return 'DTLZ5'
 
@@ -229,6 +295,18 @@ class DTLZ6(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = (x[:, self.number_of_variables - k:] ** 0.1).sum(axis=1)
+        t = pi / (4.0 * (1.0 + g))
+
+        theta = np.empty((x.shape[0], self.number_of_objectives - 1))
+        theta[:, 0] = x[:, 0] * pi / 2.0
+        theta[:, 1:] = t[:, None] * (1.0 + 2.0 * g[:, None] * x[:, 1:self.number_of_objectives - 1])
+
+        return _front_shape(1.0 + g, np.cos(theta), np.sin(theta)), None
+
     def get_name(self):
         return 'DTLZ6'
 
@@ -258,5 +336,16 @@ class DTLZ7(DTLZ1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        k = self.number_of_variables - self.number_of_objectives + 1
+
+        g = 1.0 + (9.0 * x[:, self.number_of_variables - k:].sum(axis=1)) / k
+
+        position = x[:, :self.number_of_objectives - 1]
+        h = self.number_of_objectives - \
+            ((position / (1.0 + g[:, None])) * (1 + np.sin(3.0 * pi * position))).sum(axis=1)
+
+        return np.column_stack((position, (1.0 + g) * h)), None
+
     def get_name(self):
         return 'DTLZ7'
@@ -79,6 +79,13 @@ class FDA1(FDA):
     def __eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, x: numpy.ndarray):
+        gT = sin(0.5 * pi * self.time)
+        g = 1.0 + ((x[:, 1:] - gT) ** 2).sum(axis=1)
+        h = 1.0 - numpy.sqrt(x[:, 0] / g)
+
+        return numpy.column_stack((x[:, 0], h * g)), None
+
     def get_name(self):
         return 'FDA1'
 
@@ -124,6 +131,13 @@ class FDA2(FDA):
         ht = 0.2 + 4.8 * pow(self.time, 2.0)
         return 1.0 - pow(f / g, ht)
 
+    def evaluate_batch(self, x: numpy.ndarray):
+        g = 1.0 + (x[:, 1:] ** 2).sum(axis=1)
+        ht = 0.2 + 4.8 * pow(self.time, 2.0)
+        h = 1.0 - (x[:, 0] / g) ** ht
+
+        return numpy.column_stack((x[:, 0], h * g)), None
+
     def get_name(self):
         return 'FDA2'
 
@@ -181,6 +195,16 @@ class FDA3(FDA):
         h = 1.0 - sqrt(f / g)
         return h
 
+    def evaluate_batch(self, x: numpy.ndarray):
+        gt = abs(sin(0.5 * pi * self.time))
+        g = ((x[:, self.limitInfII:] - gt) ** 2).sum(axis=1) + 1.0 + gt
+        h = 1.0 - numpy.sqrt(x[:, 0] / g)
+
+        ft = pow(10, 2.0 * sin(0.5 * pi * self.time))
+        f = (x[:, self.limitInfI:self.limitSupI] ** ft).sum(axis=1)
+
+        return numpy.column_stack((f, g * h)), None
+
     def get_name(self):
         return 'FDA3'
 
@@ -240,6 +264,16 @@ class FDA4(FDA):
 
         return fm
 
+    def evaluate_batch(self, x: numpy.ndarray):
+        gt = abs(sin(0.5 * pi * self.time))
+        g = 1.0 + ((x[:, self.M - 1:] - gt) ** 2).sum(axis=1)
+
+        f1 = g * numpy.cos(x[:, :self.M - 1] * pi / 2.0).prod(axis=1)
+        fk = g * numpy.cos(x[:, :self.M - 2] * pi / 2.0).prod(axis=1) * numpy.sin((x[:, self.M - 2] * pi) / 2.0)
+        fm = g * numpy.sin((x[:, 0] * pi) / 2.0)
+
+        return numpy.column_stack((f1, fk, fm)), None
+
     def get_name(self):
         return 'FDA4'
 
@@ -303,5 +337,17 @@ class FDA5(FDA):
 
         return fm * mult
 
+    def evaluate_batch(self, x: numpy.ndarray):
+        gt = abs(sin(0.5 * pi * self.time))
+        g = 1.0 + ((x[:, self.M - 1:] - gt) ** 2).sum(axis=1)
+        ft = 1.0 + 100.0 * pow(sin(0.5 * pi * self.time), 4.0)
+
+        y = x[:, :self.M - 1] ** ft
+        f1 = g * numpy.cos(y * pi / 2.0).prod(axis=1)
+        fk = g * numpy.cos(y[:, :self.M - 2] * pi / 2.0).prod(axis=1) * numpy.sin(y[:, self.M - 2] * pi / 2.0)
+        fm = g * numpy.sin(y[:, 0] * pi / 2.0)
+
+        return numpy.column_stack((f1, fk, fm)), None
+
     def get_name(self):
         return 'FDA5'
@@ -1,9 +1,27 @@
 from math import sin, pi, cos, sqrt
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
 
+def _rotated_ellipses(f1: np.ndarray, f2: np.ndarray, a_array: list, b_array: list, x_offset: list, y_offset: list,
+                      r: float = 0.1, theta: float = -0.25 * pi) -> np.ndarray:
+    """ Vectorized elliptic constraints of the LIR-CMOP problems: returns one column per ellipse. """
+    f1 = f1[:, None] - np.asarray(x_offset)
+    f2 = f2[:, None] - np.asarray(y_offset)
+
+    return ((f1 * cos(theta) - f2 * sin(theta)) / np.asarray(a_array)) ** 2 + \
+           ((f1 * sin(theta) + f2 * cos(theta)) / np.asarray(b_array)) ** 2 - r
+
+
+def _rotated_sinusoid(f0: np.ndarray, f1: np.ndarray, offset: float, n: float = 4.0,
+                      theta: float = -0.25 * pi) -> np.ndarray:
+    """ Vectorized sinusoidal constraint of problems LIR-CMOP9 to LIR-CMOP12. """
+    return f0 * sin(theta) + f1 * cos(theta) - np.sin(n * pi * (f0 * cos(theta) - f1 * sin(theta))) - offset
+
+
 class LIRCMOP1(FloatProblem):
     """ Class representing problem LIR-CMOP1, defined in:
 
@@ -61,6 +79,26 @@ class LIRCMOP1(FloatProblem):
 
         return result
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((x[:, 0] + self.g1_batch(x), 1 - x[:, 0] * x[:, 0] + self.g2_batch(x)))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        a = 0.51
+        b = 0.5
+
+        g1 = self.g1_batch(x)
+        g2 = self.g2_batch(x)
+
+        return np.column_stack(((a - g1) * (g1 - b), (a - g2) * (g2 - b)))
+
+    def g1_batch(self, x: np.ndarray) -> np.ndarray:
+        return ((x[:, 2:self.number_of_variables:2] - np.sin(0.5 * pi * x[:, :1])) ** 2.0).sum(axis=1)
+
+    def g2_batch(self, x: np.ndarray) -> np.ndarray:
+        return ((x[:, 1:self.number_of_variables:2] - np.cos(0.5 * pi * x[:, :1])) ** 2.0).sum(axis=1)
+
     def get_name(self):
         return 'LIR-CMOP1'
 
@@ -85,6 +123,11 @@ class LIRCMOP2(LIRCMOP1):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((x[:, 0] + self.g1_batch(x), 1 - np.sqrt(x[:, 0]) + self.g2_batch(x)))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
     def get_name(self):
         return 'LIR-CMOP2'
 
@@ -98,6 +141,7 @@ class LIRCMOP3(LIRCMOP1):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP3, self).__init__(number_of_variables)
+        self.number_of_constraints = 3
 
     def evaluate_constraints(self, solution: FloatSolution) -> FloatSolution:
         x = solution.variables
@@ -115,6 +159,12 @@ class LIRCMOP3(LIRCMOP1):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        c = 20.0
+
+        return np.column_stack((super(LIRCMOP3, self).evaluate_constraints_batch(x, f),
+                                np.sin(c * pi * x[:, 0]) - 0.5))
+
     def get_name(self):
         return 'LIR-CMOP3'
 
@@ -128,6 +178,7 @@ class LIRCMOP4(LIRCMOP2):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP4, self).__init__(number_of_variables)
+        self.number_of_constraints = 3
 
     def evaluate_constraints(self, solution: FloatSolution) -> FloatSolution:
         x = solution.variables
@@ -145,6 +196,12 @@ class LIRCMOP4(LIRCMOP2):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        c = 20.0
+
+        return np.column_stack((super(LIRCMOP4, self).evaluate_constraints_batch(x, f),
+                                np.sin(c * pi * x[:, 0]) - 0.5))
+
     def get_name(self):
         return 'LIR-CMOP4'
 
@@ -215,6 +272,25 @@ class LIRCMOP5(FloatProblem):
 
         return result
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((x[:, 0] + 10 * self.g1_batch(x) + 0.7057,
+                             1 - np.sqrt(x[:, 0]) + 10 * self.g2_batch(x) + 7057))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return _rotated_ellipses(f[:, 0], f[:, 1], [2.0, 2.0], [4.0, 8.0], [1.6, 2.5], [1.6, 2.5])
+
+    def g1_batch(self, x: np.ndarray) -> np.ndarray:
+        i = np.arange(2, self.number_of_variables, 2)
+
+        return ((x[:, i] - np.sin(0.5 * i / x.shape[1] * pi * x[:, :1])) ** 2.0).sum(axis=1)
+
+    def g2_batch(self, x: np.ndarray) -> np.ndarray:
+        i = np.arange(1, self.number_of_variables, 2)
+
+        return ((x[:, i] - np.cos(0.5 * i / x.shape[1] * pi * x[:, :1])) ** 2.0).sum(axis=1)
+
     def get_name(self):
         return 'LIR-CMOP5'
 
@@ -262,6 +338,15 @@ class LIRCMOP6(LIRCMOP5):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((x[:, 0] + 10 * self.g1_batch(x) + 0.7057,
+                             1 - x[:, 0] * x[:, 0] + 10 * self.g2_batch(x) + 7057))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return _rotated_ellipses(f[:, 0], f[:, 1], [2.0, 2.0], [8.0, 8.0], [1.8, 2.8], [1.8, 2.8])
+
     def get_name(self):
         return 'LIR-CMOP6'
 
@@ -275,6 +360,7 @@ class LIRCMOP7(LIRCMOP5):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP7, self).__init__(number_of_variables)
+        self.number_of_constraints = 3
 
     def evaluate_constraints(self, solution: FloatSolution) -> FloatSolution:
         constraints = [0.0 for _ in range(self.number_of_constraints)]
@@ -299,6 +385,10 @@ class LIRCMOP7(LIRCMOP5):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return _rotated_ellipses(f[:, 0], f[:, 1], [2.0, 2.5, 2.5], [6.0, 12.0, 10.0], [1.2, 2.25, 3.5],
+                                 [1.2, 2.25, 3.5])
+
     def get_name(self):
         return 'LIR-CMOP7'
 
@@ -312,6 +402,7 @@ class LIRCMOP8(LIRCMOP6):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP8, self).__init__(number_of_variables)
+        self.number_of_constraints = 3
 
     def evaluate_constraints(self, solution: FloatSolution) -> FloatSolution:
         constraints = [0.0 for _ in range(self.number_of_constraints)]
@@ -336,6 +427,10 @@ class LIRCMOP8(LIRCMOP6):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return _rotated_ellipses(f[:, 0], f[:, 1], [2.0, 2.5, 2.5], [6.0, 12.0, 10.0], [1.2, 2.25, 3.5],
+                                 [1.2, 2.25, 3.5])
+
     def get_name(self):
         return 'LIR-CMOP8'
 
@@ -349,6 +444,7 @@ class LIRCMOP9(LIRCMOP8):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP9, self).__init__(number_of_variables)
+        self.number_of_constraints = 2
 
     def evaluate(self, solution: FloatSolution) -> FloatSolution:
         x = solution.variables
@@ -384,6 +480,16 @@ class LIRCMOP9(LIRCMOP8):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((1.7057 * x[:, 0] * (10 * self.g1_batch(x) + 1),
+                             1.7957 * (1 - x[:, 0] * x[:, 0]) * (10 * self.g2_batch(x) + 1)))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return np.column_stack((_rotated_sinusoid(f[:, 0], f[:, 1], 2),
+                                _rotated_ellipses(f[:, 0], f[:, 1], [1.5], [6.0], [1.40], [1.40])[:, 0]))
+
     def get_name(self):
         return 'LIR-CMOP9'
 
@@ -397,6 +503,7 @@ class LIRCMOP10(LIRCMOP8):
 
     def __init__(self, number_of_variables: int = 30):
         super(LIRCMOP10, self).__init__(number_of_variables)
+        self.number_of_constraints = 2
 
     def evaluate(self, solution: FloatSolution) -> FloatSolution:
         x = solution.variables
@@ -431,6 +538,16 @@ class LIRCMOP10(LIRCMOP8):
 
         return solution
 
+    def evaluate_batch(self, x: np.ndarray):
+        f = np.column_stack((1.7057 * x[:, 0] * (10 * self.g1_batch(x) + 1),
+                             1.7957 * (1 - np.sqrt(x[:, 0])) * (10 * self.g2_batch(x) + 1)))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return np.column_stack((_rotated_sinusoid(f[:, 0], f[:, 1], 1),
+                                _rotated_ellipses(f[:, 0], f[:, 1], [2.0], [4.0], [1.1], [1.2])[:, 0]))
+
     def get_name(self):
         return 'LIR-CMOP10'
 
@@ -468,6 +585,10 @@ class LIRCMOP11(LIRCMOP10):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return np.column_stack((_rotated_sinusoid(f[:, 0], f[:, 1], 2.1),
+                                _rotated_ellipses(f[:, 0], f[:, 1], [1.5], [5.0], [1.2], [1.2])[:, 0]))
+
     def get_name(self):
         return 'LIR-CMOP11'
 
@@ -505,6 +626,10 @@ class LIRCMOP12(LIRCMOP9):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        return np.column_stack((_rotated_sinusoid(f[:, 0], f[:, 1], 2.5),
+                                _rotated_ellipses(f[:, 0], f[:, 1], [1.5], [6.0], [1.6], [1.6])[:, 0]))
+
     def get_name(self):
         return 'LIR-CMOP12'
 
@@ -558,6 +683,22 @@ class LIRCMOP13(FloatProblem):
 
         return result
 
+    def evaluate_batch(self, x: np.ndarray):
+        radius = 1.7057 + self.g1_batch(x)
+        f = np.column_stack((radius * np.cos(0.5 * pi * x[:, 0]) * np.cos(0.5 * pi + x[:, 1]),
+                             radius * np.cos(0.5 * pi * x[:, 0]) * np.sin(0.5 * pi + x[:, 1]),
+                             radius * np.sin(0.5 * pi + x[:, 0])))
+
+        return f, self.evaluate_constraints_batch(x, f)
+
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        f = (f ** 2).sum(axis=1)
+
+        return np.column_stack(((f - 9) * (f - 4), (f - 1.9 * 1.9) * (f - 1.8 * 1.8)))
+
+    def g1_batch(self, x: np.ndarray) -> np.ndarray:
+        return (10 * (x[:, 2:self.number_of_variables:2] - 0.5) ** 2.0).sum(axis=1)
+
     def get_name(self):
         return 'LIR-CMOP13'
 
@@ -586,5 +727,11 @@ class LIRCMOP14(LIRCMOP13):
 
         return solution
 
+    def evaluate_constraints_batch(self, x: np.ndarray, f: np.ndarray) -> np.ndarray:
+        f = (f ** 2).sum(axis=1)
+
+        return np.column_stack(((f - 9) * (f - 4), (f - 1.9 * 1.9) * (f - 1.8 * 1.8),
+                                (f - 1.75 * 1.75) * (f - 1.6 * 1.6)))
+
     def get_name(self):
         return 'LIR-CMOP14'
@@ -1,6 +1,8 @@
 import math
 from abc import ABCMeta
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -267,6 +269,160 @@ class LZ09(FloatProblem):
 
         return y_objectives
 
+    def evaluate_batch(self, x: np.ndarray):
+        y_objectives = np.zeros((x.shape[0], self.number_of_objectives))
+
+        if self.number_of_objectives == 2 and self.ltype in [21, 22, 23, 24, 25, 26]:
+            n = np.arange(1, self.number_of_variables)
+            t1 = np.repeat(x[:, :1], len(n), axis=1)
+
+            if self.ltype == 25:
+                css = np.where(n % 3 == 0, 1, np.where(n % 3 == 1, 2, 3))
+                in_aa = (n % 3 == 0) | ((n % 3 == 2) & (n % 2 == 0))
+                t1[:, css == 2] = x[:, n[css == 2]]
+            else:
+                css = np.where(n % 2 == 0, 1, 2)
+                in_aa = n % 2 == 0
+
+            ps = np.zeros((x.shape[0], len(n)))
+            for value in np.unique(css):
+                mask = css == value
+                ps[:, mask] = self.__ps_func2_batch(x[:, n[mask]], t1[:, mask], n[mask], self.ltype, value)
+
+            g = self.__beta_func_batch(ps[:, in_aa], self.dtype)
+            h = self.__beta_func_batch(ps[:, ~in_aa], self.dtype)
+
+            alpha = self.__alpha_func_batch(x, 2, self.ptype)
+
+            y_objectives[:, 0] = alpha[:, 0] + h
+            y_objectives[:, 1] = alpha[:, 1] + g
+
+        if self.number_of_objectives == 3 and self.ltype in [31, 32]:
+            n = np.arange(2, self.number_of_variables)
+            ps = self.__ps_func3_batch(x[:, n], x[:, :1], x[:, 1:2], n, self.ltype)
+
+            g = self.__beta_func_batch(ps[:, n % 3 == 0], self.dtype)
+            h = self.__beta_func_batch(ps[:, n % 3 == 1], self.dtype)
+            e = self.__beta_func_batch(ps[:, n % 3 == 2], self.dtype)
+
+            alpha = self.__alpha_func_batch(x, 3, self.ptype)
+
+            y_objectives[:, 0] = alpha[:, 0] + h
+            y_objectives[:, 1] = alpha[:, 1] + g
+            y_objectives[:, 2] = alpha[:, 2] + e
+
+        return y_objectives, None
+
+    def __ps_func2_batch(self, x: np.ndarray, t1: np.ndarray, dim: np.ndarray, type: int, css: int) -> np.ndarray:
+        """ Vectorized version of `__ps_func2`: `x` and `t1` are (N, d) matrices and `dim` holds the d indices. """
+        beta = np.zeros(x.shape)
+        dim = dim + 1
+        xy = 2 * (x - 0.5)
+
+        if type == 21:
+            beta = xy - t1 ** (0.5 * (self.number_of_variables + 3 * dim - 8) / (self.number_of_variables - 2))
+        if type == 22:
+            theta = 6 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            beta = xy - np.sin(theta)
+        if type == 23:
+            theta = 6 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            ra = 0.8 * t1
+            beta = xy - ra * (np.cos(theta) if css == 1 else np.sin(theta))
+        if type == 24:
+            theta = 6 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            ra = 0.8 * t1
+            beta = xy - ra * (np.cos(theta / 3) if css == 1 else np.sin(theta))
+        if type == 25:
+            rho = 0.8
+            phi = math.pi * t1
+            theta = 6 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            if css == 1:
+                beta = xy - rho * np.sin(phi) * np.sin(theta)
+            elif css == 2:
+                beta = xy - rho * np.sin(phi) * np.cos(theta)
+            else:
+                beta = xy - rho * np.cos(phi)
+        if type == 26:
+            theta = 6 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            ra = 0.3 * t1 * (t1 * np.cos(4 * theta) + 2)
+            beta = xy - ra * (np.cos(theta) if css == 1 else np.sin(theta))
+
+        return beta
+
+    def __ps_func3_batch(self, x: np.ndarray, t1: np.ndarray, t2: np.ndarray, dim: np.ndarray, type: int) -> np.ndarray:
+        """ Vectorized version of `__ps_func3`. """
+        beta = np.zeros(x.shape)
+        dim = dim + 1
+        xy = 4 * (x - .5)
+
+        if type == 31:
+            rate = 1.0 * dim / self.number_of_variables
+            beta = xy - 4 * (t1 * t1 * rate + t2 * (1.0 - rate)) + 2
+        if type == 32:
+            theta = 2 * math.pi * t1 + dim * math.pi / self.number_of_variables
+            beta = xy - 2 * t2 * np.sin(theta)
+
+        return beta
+
+    def __alpha_func_batch(self, x: np.ndarray, dim: int, type: int) -> np.ndarray:
+        """ Vectorized version of `__alpha_func`. """
+        alpha = np.zeros((x.shape[0], dim))
+        x0 = x[:, 0]
+
+        if dim == 2:
+            alpha[:, 0] = x0
+            if type == 21:
+                alpha[:, 1] = 1 - np.sqrt(x0)
+            if type == 22:
+                alpha[:, 1] = 1 - x0 * x0
+            if type == 23:
+                alpha[:, 1] = 1 - np.sqrt(x0) - x0 * np.sin(10 * x0 * x0 * math.pi)
+            if type == 24:
+                alpha[:, 1] = 1 - x0 - 0.05 * np.sin(4 * math.pi * x0)
+            if type not in [21, 22, 23, 24]:
+                alpha[:, 0] = 0.0
+        else:
+            x1 = x[:, 1]
+            if type == 31:
+                alpha[:, 0] = np.cos(x0 * math.pi / 2) * np.cos(x1 * math.pi / 2)
+                alpha[:, 1] = np.cos(x0 * math.pi / 2) * np.sin(x1 * math.pi / 2)
+                alpha[:, 2] = np.sin(x0 * math.pi / 2)
+            if type == 32:
+                alpha[:, 0] = 1 - np.cos(x0 * math.pi / 2) * np.cos(x1 * math.pi / 2)
+                alpha[:, 1] = 1 - np.cos(x0 * math.pi / 2) * np.sin(x1 * math.pi / 2)
+                alpha[:, 2] = 1 - np.sin(x0 * math.pi / 2)
+            if type == 33:
+                alpha[:, 0] = x0
+                alpha[:, 1] = x1
+                alpha[:, 2] = 3 - (np.sin(3 * math.pi * x0) + np.sin(3 * math.pi * x1) - 2 * (x0 + x1))
+            if type == 34:
+                alpha[:, 0] = x0 - x1
+                alpha[:, 1] = x0 * (1 - x1)
+                alpha[:, 2] = 1 - x0
+
+        return alpha
+
+    def __beta_func_batch(self, x: np.ndarray, type: int) -> np.ndarray:
+        """ Vectorized version of `__beta_func`: each row of `x` holds the values of one solution. """
+        beta = np.zeros(x.shape[0])
+        dim = x.shape[1]
+
+        if dim == 0:
+            return beta
+        if type == 1:
+            beta = 2.0 * (x * x).sum(axis=1) / dim
+        if type == 2:
+            beta = 2.0 * (np.sqrt(np.arange(1, dim + 1)) * x * x).sum(axis=1) / dim
+        if type == 3:
+            xx = 2 * x
+            beta = 2.0 * (xx * xx - np.cos(4 * math.pi * xx) + 1).sum(axis=1) / dim
+        if type == 4:
+            xx = 2 * x
+            prod = np.cos(10 * math.pi * xx / np.sqrt(np.arange(1, dim + 1))).prod(axis=1)
+            beta = 2.0 * ((xx * xx).sum(axis=1) - 2 * prod + 2) / dim
+
+        return beta
+
     def get_name(self):
         return 'LZ09'
 
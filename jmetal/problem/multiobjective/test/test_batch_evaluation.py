@@ -0,0 +1,92 @@
+import unittest
+
+import numpy as np
+
+from jmetal.problem.multiobjective.constrained import Srinivas, Tanaka, Osyczka2, Binh2
+from jmetal.problem.multiobjective.dtlz import DTLZ1, DTLZ2, DTLZ3, DTLZ4, DTLZ5, DTLZ6, DTLZ7
+from jmetal.problem.multiobjective.fda import FDA1, FDA2, FDA3, FDA4, FDA5
+from jmetal.problem.multiobjective.lircmop import LIRCMOP1, LIRCMOP2, LIRCMOP3, LIRCMOP4, LIRCMOP5, LIRCMOP6, \
+    LIRCMOP7, LIRCMOP8, LIRCMOP9, LIRCMOP10, LIRCMOP11, LIRCMOP12, LIRCMOP13, LIRCMOP14
+from jmetal.problem.multiobjective.lz09 import LZ09_F1, LZ09_F2, LZ09_F3, LZ09_F4, LZ09_F5, LZ09_F6, LZ09_F7, \
+    LZ09_F8, LZ09_F9
+from jmetal.problem.multiobjective.wfg import WFG1, WFG2, WFG3, WFG4, WFG5, WFG6, WFG7, WFG8, WFG9
+from jmetal.problem.multiobjective.zdt import ZDT1, ZDT2, ZDT3, ZDT4, ZDT6, ZDT1Modified
+
+
+class BatchEvaluationTestCases(unittest.TestCase):
+
+    def assert_batch_evaluation_is_equivalent(self, problem) -> None:
+        self.assertTrue(problem.supports_batch_evaluation())
+
+        solutions = [problem.create_solution() for _ in range(10)]
+        objectives, constraints = problem.evaluate_batch(np.array([solution.variables for solution in solutions]))
+
+        self.assertEqual((10, problem.number_of_objectives), objectives.shape)
+        if problem.number_of_constraints == 0:
+            self.assertIsNone(constraints)
+        else:
+            self.assertEqual((10, problem.number_of_constraints), constraints.shape)
+
+        for index, solution in enumerate(solutions):
+            problem.evaluate(solution)
+            self.assertTrue(np.allclose(solution.objectives, objectives[index]), problem.get_name())
+            if problem.number_of_constraints > 0:
+                self.assertTrue(np.allclose(solution.constraints, constraints[index]), problem.get_name())
+
+    def test_should_zdt_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [ZDT1(), ZDT2(), ZDT3(), ZDT4(), ZDT6()]:
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_dtlz_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [DTLZ1(), DTLZ2(), DTLZ3(), DTLZ4(), DTLZ5(), DTLZ6(), DTLZ7(), DTLZ2(12, 5)]:
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_wfg_problems_be_evaluated_in_batch(self) -> None:
+        for problem_class in [WFG1, WFG2, WFG3, WFG4, WFG5, WFG6, WFG7, WFG8, WFG9]:
+            self.assert_batch_evaluation_is_equivalent(problem_class(k=4, number_of_variables=12,
+                                                                     number_of_objectives=3))
+
+    def test_should_lz09_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [LZ09_F1(), LZ09_F2(), LZ09_F3(), LZ09_F4(), LZ09_F5(), LZ09_F6(), LZ09_F7(), LZ09_F8(),
+                        LZ09_F9()]:
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_lircmop_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [LIRCMOP1(), LIRCMOP2(), LIRCMOP3(), LIRCMOP4(), LIRCMOP5(), LIRCMOP6(), LIRCMOP7(),
+                        LIRCMOP8(), LIRCMOP9(), LIRCMOP10(), LIRCMOP11(), LIRCMOP12(), LIRCMOP13(), LIRCMOP14()]:
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_fda_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [FDA1(), FDA2(), FDA3(), FDA4(), FDA5()]:
+            problem.time = 0.3
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_constrained_problems_be_evaluated_in_batch(self) -> None:
+        for problem in [Srinivas(), Tanaka(), Osyczka2(), Binh2()]:
+            self.assert_batch_evaluation_is_equivalent(problem)
+
+    def test_should_subclasses_overriding_only_evaluate_not_support_batch_evaluation(self) -> None:
+        self.assertFalse(ZDT1Modified().supports_batch_evaluation())
+
+    def test_should_subclasses_overriding_only_evaluate_constraints_not_support_batch_evaluation(self) -> None:
+        class LIRCMOP1Modified(LIRCMOP1):
+            def evaluate_constraints(self, solution):
+                solution.constraints = [-1.0 for _ in range(self.number_of_constraints)]
+                return solution
+
+        self.assertFalse(LIRCMOP1Modified().supports_batch_evaluation())
+
+    def test_should_subclasses_overriding_both_constraint_methods_support_batch_evaluation(self) -> None:
+        class LIRCMOP1Modified(LIRCMOP1):
+            def evaluate_constraints(self, solution):
+                solution.constraints = [-1.0 for _ in range(self.number_of_constraints)]
+                return solution
+
+            def evaluate_constraints_batch(self, x, f):
+                return np.full((len(x), self.number_of_constraints), -1.0)
+
+        self.assert_batch_evaluation_is_equivalent(LIRCMOP1Modified())
+
+
+if __name__ == '__main__':
+    unittest.main()
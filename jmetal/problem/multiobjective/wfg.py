@@ -2,6 +2,8 @@
 # -*- coding: utf-8 -*-
 from math import sqrt, pow, sin, pi, cos
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -320,6 +322,127 @@ def disc(
 	return correct_to_01(result)
 
 
+# Vectorized versions of the transformation and shape functions. They operate element-wise on NumPy arrays holding one
+# row per solution; the reductions (r_sum, r_nonsep) and the shapes reduce the last axis.
+
+def correct_to_01_batch(a, epsilon=1.0e-10):
+	"""Vectorized version of :func:`correct_to_01`."""
+
+	a = np.where((a <= 0.0) & (a >= -epsilon), 0.0, a)
+	return np.where((a >= 1.0) & (a <= 1.0 + epsilon), 1.0, a)
+
+
+def b_poly_batch(y, alpha):
+	"""Vectorized transformation function."""
+
+	return correct_to_01_batch(y ** alpha)
+
+
+def b_flat_batch(y, a, b, c):
+	"""Vectorized transformation function."""
+
+	tmp1 = np.minimum(0.0, np.floor(y - b)) * a * (b - y) / b
+	tmp2 = np.minimum(0.0, np.floor(c - y)) * (1.0 - a) * (y - c) / (1.0 - c)
+	return correct_to_01_batch(a + tmp1 - tmp2)
+
+
+def b_param_batch(y, u, a, b, c):
+	"""Vectorized transformation function."""
+
+	v = a - (1.0 - 2.0 * u) * np.abs(np.floor(0.5 - u) + a)
+	return correct_to_01_batch(y ** (b + (c - b) * v))
+
+
+def s_linear_batch(y, a):
+	"""Vectorized transformation function."""
+
+	return correct_to_01_batch(np.abs(y - a) / np.abs(np.floor(a - y) + a))
+
+
+def s_decept_batch(y, a, b, c):
+	"""Vectorized transformation function."""
+
+	tmp1 = np.floor(y - a + b) * (1.0 - c + (a - b) / b) / (a - b)
+	tmp2 = np.floor(a + b - y) * (1.0 - c + (1.0 - a - b) / b) / (1.0 - a - b)
+	return correct_to_01_batch(1.0 + (np.abs(y - a) - b) * (tmp1 + tmp2 + 1.0 / b))
+
+
+def s_multi_batch(y, a, b, c):
+	"""Vectorized transformation function."""
+
+	tmp1 = np.abs(y - c) / (2.0 * (np.floor(c - y) + c))
+	tmp2 = (4.0 * a + 2.0) * math.pi * (0.5 - tmp1)
+	return correct_to_01_batch((1.0 + np.cos(tmp2) + 4.0 * b * tmp1 ** 2.0) / (b + 2.0))
+
+
+def r_sum_batch(y, w):
+	"""Vectorized transformation function."""
+
+	w = np.asarray(w, dtype=float)
+	return correct_to_01_batch((y * w).sum(axis=-1) / w.sum(axis=-1))
+
+
+def r_nonsep_batch(y, a):
+	"""Vectorized transformation function."""
+
+	numerator = y.sum(axis=-1)
+	for k in range(0, a - 1):
+		numerator = numerator + np.abs(y - np.roll(y, -(k + 1), axis=-1)).sum(axis=-1)
+	tmp = math.ceil(a / 2.0)
+	denominator = y.shape[-1] * tmp * (1.0 + 2.0 * a - 2.0 * tmp) / a
+	return correct_to_01_batch(numerator / denominator)
+
+
+def r_sum_groups_batch(y, k, m, w):
+	"""Reduces the k position-related parameters to m - 1 groups and the distance-related ones to one value."""
+
+	n = y.shape[1]
+	w = np.asarray(w, dtype=float)
+	head = r_sum_batch(y[:, :k].reshape(-1, m - 1, k // (m - 1)), w[:k].reshape(m - 1, k // (m - 1)))
+	return np.column_stack((head, r_sum_batch(y[:, k:n], w[k:n])))
+
+
+def linear_batch(x, m):
+	"""Vectorized shape function."""
+
+	result = x[:, :x.shape[1] - m].prod(axis=1)
+	if m != 1:
+		result = result * (1 - x[:, x.shape[1] - m])
+	return correct_to_01_batch(result)
+
+
+def convex_batch(x, m):
+	"""Vectorized shape function."""
+
+	result = (1.0 - np.cos(x[:, :x.shape[1] - m] * math.pi / 2.0)).prod(axis=1)
+	if m != 1:
+		result = result * (1.0 - np.sin(x[:, x.shape[1] - m] * math.pi / 2.0))
+	return correct_to_01_batch(result)
+
+
+def concave_batch(x, m):
+	"""Vectorized shape function."""
+
+	result = np.sin(x[:, :x.shape[1] - m] * math.pi / 2.0).prod(axis=1)
+	if m != 1:
+		result = result * np.cos(x[:, x.shape[1] - m] * math.pi / 2.0)
+	return correct_to_01_batch(result)
+
+
+def mixed_batch(x, a, alpha):
+	"""Vectorized shape function."""
+
+	tmp = 2.0 * a * math.pi
+	return correct_to_01_batch((1.0 - x[:, 0] - np.cos(tmp * x[:, 0] + math.pi / 2.0) / tmp) ** alpha)
+
+
+def disc_batch(x, a, alpha, beta):
+	"""Vectorized shape function."""
+
+	tmp1 = a * x[:, 0] ** beta * math.pi
+	return correct_to_01_batch(1.0 - x[:, 0] ** alpha * np.cos(tmp1) ** 2.0)
+
+
 class Shape:
 
 	"""Abstract base class for shape objects."""
@@ -367,10 +490,24 @@ class Shape:
 			s.append(m * 2.0)
 		return calculate_f(1.0, x, h, s)
 
+	@staticmethod
+	def calculate_x_batch(tp, a):
+		tmp1 = np.maximum(tp[:, -1:], np.asarray(a, dtype=float))
+		return np.column_stack((tmp1 * (tp[:, :-1] - 0.5) + 0.5, tp[:, -1]))
+
+	@staticmethod
+	def calculate_f_batch(x, h):
+		return x[:, -1:] + 2.0 * np.arange(1, h.shape[1] + 1) * h
+
 	def __call__(self, tp):
 		raise NotImplementedError('Abstract class `Shape` is not callable.'
 								  )
 
+	def batch(self, tp):
+		"""Evaluates the shape on a matrix holding one transformed vector per row."""
+
+		raise NotImplementedError('Abstract class `Shape` is not callable.')
+
 
 class WFG(FloatProblem):
 
@@ -423,6 +560,15 @@ class WFG(FloatProblem):
 			result.append(z[i] / self.max_bounds[i])
 		return result
 
+	def normalize_z_batch(self, z):
+		min_bounds = np.asarray(self.min_bounds)
+		max_bounds = np.asarray(self.max_bounds)
+		invalid = (z < min_bounds) | (z > max_bounds)
+		if invalid.any():
+			row, i = np.argwhere(invalid)[0]
+			raise BoundConstraintError(z[row, i], self.min_bounds[i], self.max_bounds[i], 'z_' + str(i))
+		return z / max_bounds
+
 	@property
 	def m(self):
 		"""The number of objective functions."""
@@ -433,6 +579,10 @@ class WFG(FloatProblem):
 		solution.objectives = self.objective_function(solution.variables)
 		return solution
 
+	def evaluate_batch(self, x):
+		assert x.shape[1] == self.number_of_variables
+		return self.objective_function_batch(np.asarray(x, dtype=float)), None
+
 
 
 class WFG1(WFG):
@@ -450,6 +600,12 @@ class WFG1(WFG):
 			h.append(mixed(x, 5, 1.0))
 			return self.calculate_f(x, h)
 
+		def batch(self, tp):
+			x = self.calculate_x_batch(tp, self.create_a(tp.shape[1], False))
+			h = [convex_batch(x, m) for m in range(1, tp.shape[1])]
+			h.append(mixed_batch(x, 5, 1.0))
+			return self.calculate_f_batch(x, np.column_stack(h))
+
 	def __init__(self, k, number_of_variables, number_of_objectives, **kwargs) :
 		super(WFG1, self).__init__(self.objective_function, number_of_objectives, number_of_variables, k, **kwargs)
 
@@ -515,15 +671,29 @@ class WFG1(WFG):
 		t.append(r_sum(y_sub, w_sub))
 		return t
 
-	def objective_function(self, phenome):
-		assert len(phenome) == self.number_of_variables
-		assert self.args_ok(phenome, self.k, self.m)
-		y = self.normalize_z(phenome)
-		y = self.transition1(y, self.k)
-		y = self.transition2(y, self.k)
-		y = self.transition3(y)
-		y = self.transition4(y, self.k, self.m)
-		return self.shape(y)
+	@staticmethod
+	def transition1_batch(y, k):
+		return np.column_stack((y[:, :k], s_linear_batch(y[:, k:], 0.35)))
+
+	@staticmethod
+	def transition2_batch(y, k):
+		return np.column_stack((y[:, :k], b_flat_batch(y[:, k:], 0.8, 0.75, 0.85)))
+
+	@staticmethod
+	def transition3_batch(y):
+		return b_poly_batch(y, 0.02)
+
+	@staticmethod
+	def transition4_batch(y, k, m):
+		return r_sum_groups_batch(y, k, m, 2.0 * np.arange(1, y.shape[1] + 1))
+
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y, self.k)
+		y = self.transition2_batch(y, self.k)
+		y = self.transition3_batch(y)
+		y = self.transition4_batch(y, self.k, self.m)
+		return self.shape.batch(y)
 
 	def objective_function(self, phenome):
 		assert len(phenome) == self.number_of_variables
@@ -555,6 +725,12 @@ class WFG2(WFG):
 			h.append(disc(x, 5, 1.0, 1.0))
 			return self.calculate_f(x, h)
 
+		def batch(self, tp):
+			x = self.calculate_x_batch(tp, self.create_a(tp.shape[1], False))
+			h = [convex_batch(x, m) for m in range(1, tp.shape[1])]
+			h.append(disc_batch(x, 5, 1.0, 1.0))
+			return self.calculate_f_batch(x, np.column_stack(h))
+
 	def __init__(self, k, number_of_variables, number_of_objectives, **kwargs) :
 		super(WFG2, self).__init__(self.objective_function, number_of_objectives, number_of_variables, k, **kwargs)
 		self.number_of_variables = number_of_variables
@@ -608,6 +784,15 @@ class WFG2(WFG):
 		t.append(r_sum(y_sub, w_sub))
 		return t
 
+	@staticmethod
+	def transition2_batch(y, k):
+		pairs = y[:, k:].reshape(y.shape[0], -1, 2)
+		return np.column_stack((y[:, :k], r_nonsep_batch(pairs, 2)))
+
+	@staticmethod
+	def transition3_batch(y, k, m):
+		return r_sum_groups_batch(y, k, m, np.ones(y.shape[1]))
+
 	def objective_function(self, phenome):
 		assert len(phenome) == self.number_of_variables
 		assert self.args_ok(phenome, self.k, self.m)
@@ -618,6 +803,13 @@ class WFG2(WFG):
 		y = self.transition3(y, self.k, self.m)
 		return self.shape(y)
 
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = WFG1.transition1_batch(y, self.k)
+		y = self.transition2_batch(y, self.k)
+		y = self.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG2'
 
@@ -636,6 +828,11 @@ class WFG3(WFG):
 				h.append(linear(x, m))
 			return self.calculate_f(x, h)
 
+		def batch(self, tp):
+			x = self.calculate_x_batch(tp, self.create_a(tp.shape[1], True))
+			h = [linear_batch(x, m) for m in range(1, tp.shape[1] + 1)]
+			return self.calculate_f_batch(x, np.column_stack(h))
+
 	def __init__(self, k, number_of_variables, number_of_objectives, **kwargs) :
 		super(WFG3, self).__init__(self.objective_function, number_of_objectives, number_of_variables, k, **kwargs)
 		self.number_of_variables = number_of_variables
@@ -661,6 +858,13 @@ class WFG3(WFG):
 		y = self.transition3(y, self.k, self.m)
 		return self.shape(y)
 
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = WFG1.transition1_batch(y, self.k)
+		y = WFG2.transition2_batch(y, self.k)
+		y = WFG2.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG3'
 
@@ -679,6 +883,11 @@ class WFG4(WFG):
 				h.append(concave(x, m))
 			return self.calculate_f(x, h)
 
+		def batch(self, tp):
+			x = self.calculate_x_batch(tp, self.create_a(tp.shape[1], False))
+			h = [concave_batch(x, m) for m in range(1, tp.shape[1] + 1)]
+			return self.calculate_f_batch(x, np.column_stack(h))
+
 	def __init__(self, k, number_of_variables, number_of_objectives, **kwargs) :
 		super(WFG4, self).__init__(self.objective_function, number_of_objectives, number_of_variables, k, **kwargs)
 		self.number_of_variables = number_of_variables
@@ -710,6 +919,16 @@ class WFG4(WFG):
 		y = self.transition2(y, self.k, self.m)
 		return self.shape(y)
 
+	@staticmethod
+	def transition1_batch(y):
+		return s_multi_batch(y, 30, 10, 0.35)
+
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y)
+		y = WFG2.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG4'
 
@@ -747,6 +966,16 @@ class WFG5(WFG):
 		y = self.transition2(y, self.k, self.m)
 		return self.shape(y)
 
+	@staticmethod
+	def transition1_batch(y):
+		return s_decept_batch(y, 0.35, 0.001, 0.05)
+
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y)
+		y = WFG2.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG5'
 
@@ -793,6 +1022,17 @@ class WFG6(WFG):
 		y = self.transition2(y, self.k, self.m)
 		return self.shape(y)
 
+	@staticmethod
+	def transition2_batch(y, k, m):
+		head = r_nonsep_batch(y[:, :k].reshape(y.shape[0], m - 1, k // (m - 1)), k // (m - 1))
+		return np.column_stack((head, r_nonsep_batch(y[:, k:], y.shape[1] - k)))
+
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = WFG1.transition1_batch(y, self.k)
+		y = self.transition2_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG6'
 
@@ -830,6 +1070,14 @@ class WFG7(WFG):
 			t.append(y[i])
 		return t
 
+	@staticmethod
+	def transition1_batch(y, k):
+		n = y.shape[1]
+		# Mean of y[i + 1:] for every i < k, computed from the suffix sums
+		suffix_sums = np.cumsum(y[:, ::-1], axis=1)[:, ::-1]
+		u = correct_to_01_batch(suffix_sums[:, 1:k + 1] / (n - np.arange(1, k + 1)))
+		return np.column_stack((b_param_batch(y[:, :k], u, 0.98 / 49.98, 0.02, 50), y[:, k:]))
+
 	def objective_function(self, phenome):
 		assert len(phenome) == self.number_of_variables
 		assert self.args_ok(phenome, self.k, self.m)
@@ -839,6 +1087,13 @@ class WFG7(WFG):
 		y = self.transition3(y, self.k, self.m)
 		return self.shape(y)
 
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y, self.k)
+		y = WFG1.transition1_batch(y, self.k)
+		y = WFG2.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG7'
 
@@ -878,6 +1133,14 @@ class WFG8(WFG):
 			t.append(b_param(y[i], u, 0.98 / 49.98, 0.02, 50))
 		return t
 
+	@staticmethod
+	def transition1_batch(y, k):
+		n = y.shape[1]
+		# Mean of y[:i] for every i >= k, computed from the prefix sums
+		prefix_sums = np.cumsum(y, axis=1)
+		u = correct_to_01_batch(prefix_sums[:, k - 1:n - 1] / np.arange(k, n))
+		return np.column_stack((y[:, :k], b_param_batch(y[:, k:], u, 0.98 / 49.98, 0.02, 50)))
+
 
 	def objective_function(self, phenome):
 		assert len(phenome) == self.number_of_variables
@@ -888,6 +1151,13 @@ class WFG8(WFG):
 		y = self.transition3(y, self.k, self.m)
 		return self.shape(y)
 
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y, self.k)
+		y = WFG1.transition1_batch(y, self.k)
+		y = WFG2.transition3_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG8'
 
@@ -962,6 +1232,14 @@ class WFG9(WFG):
 			t.append(s_multi(y[i], 30, 95, 0.35))
 		return t
 
+	@staticmethod
+	def transition1_batch(y):
+		return WFG7.transition1_batch(y, y.shape[1] - 1)
+
+	@staticmethod
+	def transition2_batch(y, k):
+		return np.column_stack((s_decept_batch(y[:, :k], 0.35, 0.001, 0.05), s_multi_batch(y[:, k:], 30, 95, 0.35)))
+
 
 	def objective_function(self, phenome):
 		assert len(phenome) == self.number_of_variables
@@ -972,5 +1250,12 @@ class WFG9(WFG):
 		y = self.transition3(y, self.k, self.m)
 		return self.shape(y)
 
+	def objective_function_batch(self, phenome):
+		y = self.normalize_z_batch(phenome)
+		y = self.transition1_batch(y)
+		y = self.transition2_batch(y, self.k)
+		y = WFG6.transition2_batch(y, self.k, self.m)
+		return self.shape.batch(y)
+
 	def get_name(self):
 		return 'WFG9'
@@ -1,5 +1,7 @@
 from math import sqrt, pow, sin, pi, cos
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
 
@@ -52,6 +54,20 @@ class ZDT1(FloatProblem):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
+    def evaluate_batch(self, x: np.ndarray):
+        g = self.eval_g_batch(x)
+        h = self.eval_h_batch(x[:, 0], g)
+
+        return np.column_stack((x[:, 0], h * g)), None
+
+    def eval_g_batch(self, x: np.ndarray) -> np.ndarray:
+        constant = 9.0 / (x.shape[1] - 1)
+
+        return constant * x[:, 1:].sum(axis=1) + 1.0
+
+    def eval_h_batch(self, f: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - np.sqrt(f / g)
+
     def get_name(self):
         return 'ZDT1'
 
@@ -82,6 +98,9 @@ class ZDT2(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def eval_h_batch(self, f: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - (f / g) ** 2.0
+
     def get_name(self):
         return 'ZDT2'
 
@@ -95,6 +114,9 @@ class ZDT3(ZDT1):
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g) - (f / g) * sin(10.0 * f * pi)
 
+    def eval_h_batch(self, f: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - np.sqrt(f / g) - (f / g) * np.sin(10.0 * f * pi)
+
     def get_name(self):
         return 'ZDT3'
 
@@ -125,6 +147,11 @@ class ZDT4(ZDT1):
 
         return g
 
+    def eval_g_batch(self, x: np.ndarray) -> np.ndarray:
+        y = x[:, 1:]
+
+        return (y ** 2.0 - 10.0 * np.cos(4.0 * pi * y)).sum(axis=1) + 1.0 + 10.0 * (x.shape[1] - 1)
+
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - sqrt(f / g)
 
@@ -153,8 +180,14 @@ class ZDT6(ZDT1):
 
         return g
 
+    def eval_g_batch(self, x: np.ndarray) -> np.ndarray:
+        return 1.0 + 9.0 * (x[:, 1:].sum(axis=1) / (x.shape[1] - 1)) ** 0.25
+
     def eval_h(self, f: float, g: float) -> float:
         return 1.0 - pow(f / g, 2.0)
 
+    def eval_h_batch(self, f: np.ndarray, g: np.ndarray) -> np.ndarray:
+        return 1.0 - (f / g) ** 2.0
+
     def get_name(self):
         return 'ZDT6'
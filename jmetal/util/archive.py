@@ -4,8 +4,13 @@ from abc import ABC, abstractmethod
 from threading import Lock
 from typing import TypeVar, Generic, List
 
-from jmetal.util.comparator import Comparator, DominanceComparator, SolutionAttributeComparator
-from jmetal.util.density_estimator import DensityEstimator, CrowdingDistance
+import numpy as np
+
+from jmetal.util.comparator import Comparator, DominanceComparator, SolutionAttributeComparator, \
+    OverallConstraintViolationComparator
+from jmetal.util.constraint_handling import overall_constraint_violation_degree
+from jmetal.util.density_estimator import DensityEstimator, CrowdingDistance, IncrementalCrowdingDistance
+from jmetal.util.front_index import FrontIndex, create_front_index, non_dominated_indices
 
 S = TypeVar('S')
 
@@ -56,18 +61,39 @@ class BoundedArchive(Archive[S]):
     def add(self, solution: S) -> bool:
         success = self.non_dominated_solution_archive.add(solution)
 
-        if success:
-            if self.size() > self.maximum_size:
-                self.compute_density_estimator()
-                worst_solution, index_to_remove = self.__find_worst_solution(self.solution_list)
-                self.solution_list.pop(index_to_remove)
+        if success and self.size() > self.maximum_size:
+            self.truncate()
 
         return success
 
+    def add_all(self, solutions: List[S]) -> List[S]:
+        """ Adds a batch of solutions, removing the worst ones in a single truncation pass if the archive overflows.
+
+        :return: The solutions of the batch accepted by the non-dominated archive (some of them may have been removed
+            by the truncation, as :meth:`add` returns True for them).
+        """
+        added_solutions = self.non_dominated_solution_archive.add_all(solutions)
+
+        if self.size() > self.maximum_size:
+            self.truncate()
+
+        return added_solutions
+
+    def truncate(self) -> None:
+        """ Removes the worst solution, according to the density estimator, until the archive is not over its maximum
+        size. The density estimation is updated after every removal. """
+        solutions = list(self.solution_list)
+        self.density_estimator.compute_density_estimator(solutions)
+
+        while len(solutions) > self.maximum_size:
+            worst_solution, index_to_remove = self.__find_worst_solution(solutions)
+            self.density_estimator.remove(solutions, index_to_remove)
+            self.non_dominated_solution_archive.remove(worst_solution)
+
     def __find_worst_solution(self, solution_list: List[S]) -> S:
         if solution_list is None:
             raise Exception("The solution list is None")
-        elif len(solution_list) is 0:
+        elif len(solution_list) == 0:
             raise Exception("The solution list is empty")
 
         worst_solution = solution_list[0]
@@ -82,12 +108,112 @@ class BoundedArchive(Archive[S]):
 
 
 class NonDominatedSolutionsArchive(Archive[S]):
+    """ Unbounded archive of non-dominated solutions. With the default Pareto dominance comparator the solutions are
+    kept in a spatial index (see :mod:`jmetal.util.front_index`), so that insertions do not scan the whole archive;
+    other comparators (e.g., epsilon-dominance) use a linear scan. The archive must be modified through its methods;
+    the order of `solution_list` is not meaningful, as removed solutions are replaced by the last one.
+    """
 
     def __init__(self, dominance_comparator: Comparator = DominanceComparator()):
         super(NonDominatedSolutionsArchive, self).__init__()
         self.comparator = dominance_comparator
+        self.front_index: FrontIndex = None
+        self.positions = {}
+        self.constraint_violation = 0.0
 
     def add(self, solution: S) -> bool:
+        if not self.__is_indexed():
+            return self.__linear_add(solution)
+
+        if len(self.positions) != len(self.solution_list):
+            self.__rebuild_index()
+
+        return self.__indexed_add(solution)
+
+    def add_all(self, solutions: List[S]) -> List[S]:
+        """ Adds a batch of solutions, filtering their non-dominated ones at once first.
+
+        :return: The solutions of the batch which were added to the archive.
+        """
+        solutions = list(solutions)
+        if not self.__is_indexed() or len(solutions) == 0:
+            return [solution for solution in solutions if self.add(solution)]
+
+        if len(self.positions) != len(self.solution_list):
+            self.__rebuild_index()
+
+        constraint_violation = np.array([overall_constraint_violation_degree(solution) for solution in solutions])
+        candidates = np.flatnonzero(constraint_violation == constraint_violation.max())
+        objectives = np.array([solutions[i].objectives for i in candidates.tolist()], dtype=float)
+        candidates = candidates[non_dominated_indices(objectives)]
+
+        return [solutions[i] for i in candidates.tolist() if self.__indexed_add(solutions[i])]
+
+    def remove(self, solution: S) -> bool:
+        if not self.__is_indexed():
+            for index, current_solution in enumerate(self.solution_list):
+                if current_solution is solution:
+                    del self.solution_list[index]
+                    return True
+            return False
+
+        if len(self.positions) != len(self.solution_list):
+            self.__rebuild_index()
+
+        if not self.front_index.remove(solution):
+            return False
+        self.__delete(solution)
+
+        return True
+
+    def __is_indexed(self) -> bool:
+        return type(self.comparator) is DominanceComparator and \
+            type(self.comparator.constraint_comparator) is OverallConstraintViolationComparator
+
+    def __indexed_add(self, solution: S) -> bool:
+        # The solutions of the archive share the same constraint violation degree, as less violated solutions
+        # dominate the more violated ones
+        constraint_violation = overall_constraint_violation_degree(solution)
+        if len(self.solution_list) == 0 or constraint_violation > self.constraint_violation:
+            self.__clear(len(solution.objectives))
+            self.constraint_violation = constraint_violation
+        elif constraint_violation < self.constraint_violation:
+            return False
+
+        removed_solutions = self.front_index.update(solution.objectives, solution)
+        if removed_solutions is None:
+            return False
+
+        for removed_solution in removed_solutions:
+            self.__delete(removed_solution)
+        self.positions[id(solution)] = len(self.solution_list)
+        self.solution_list.append(solution)
+
+        return True
+
+    def __delete(self, solution: S) -> None:
+        position = self.positions.pop(id(solution))
+        last_solution = self.solution_list.pop()
+
+        if last_solution is not solution:
+            self.solution_list[position] = last_solution
+            self.positions[id(last_solution)] = position
+
+    def __clear(self, number_of_objectives: int) -> None:
+        self.solution_list.clear()
+        self.positions = {}
+        self.front_index = create_front_index(number_of_objectives)
+
+    def __rebuild_index(self) -> None:
+        """ Indexes again the solutions if the list was modified from outside the archive. """
+        solutions = list(self.solution_list)
+        self.solution_list.clear()
+        self.positions = {}
+
+        for solution in solutions:
+            self.__indexed_add(solution)
+
+    def __linear_add(self, solution: S) -> bool:
         is_dominated = False
         is_contained = False
 
@@ -107,7 +233,7 @@ class NonDominatedSolutionsArchive(Archive[S]):
                     is_dominated = True
                     break
                 elif is_dominated_flag == 0:
-                    if solution.objectives == current_solution.objectives:
+                    if list(solution.objectives) == list(current_solution.objectives):
                         is_contained = True
                         break
 
@@ -119,6 +245,10 @@ class NonDominatedSolutionsArchive(Archive[S]):
 
 
 class CrowdingDistanceArchive(BoundedArchive[S]):
+    """ Bounded archive truncated by crowding distance. The distances are kept by an
+    :class:`IncrementalCrowdingDistance`, which is brought up to date with the archive only when they are needed (on
+    overflow or when they are requested), so insertions and removals only recompute the distances of their neighbors.
+    """
 
     def __init__(self,
                  maximum_size: int):
@@ -126,6 +256,19 @@ class CrowdingDistanceArchive(BoundedArchive[S]):
             maximum_size=maximum_size,
             comparator=SolutionAttributeComparator("crowding_distance", lowest_is_best=False),
             density_estimator=CrowdingDistance())
+        self.crowding_distances = IncrementalCrowdingDistance()
+
+    def compute_density_estimator(self):
+        self.crowding_distances.synchronize(self.solution_list)
+        self.crowding_distances.assign()
+
+    def truncate(self) -> None:
+        self.crowding_distances.synchronize(self.solution_list)
+
+        while self.size() > self.maximum_size:
+            worst_solution = self.crowding_distances.most_crowded()
+            self.crowding_distances.remove(worst_solution)
+            self.non_dominated_solution_archive.remove(worst_solution)
 
 
 class ArchiveWithReferencePoint(BoundedArchive[S]):
@@ -161,20 +304,22 @@ class ArchiveWithReferencePoint(BoundedArchive[S]):
                 result = super(ArchiveWithReferencePoint, self).add(solution)
 
             if result and dominated_solution is not None and len(self.solution_list) > 1:
-                if dominated_solution in self.solution_list:
-                    self.solution_list.remove(dominated_solution)
+                self.non_dominated_solution_archive.remove(dominated_solution)
 
             if result and len(self.solution_list) > self.maximum_size:
                 self.compute_density_estimator()
 
         return result
 
+    def add_all(self, solutions: List[S]) -> List[S]:
+        return [solution for solution in solutions if self.add(solution)]
+
     def filter(self):
         # In case of having at least a solution which is non-dominated with the reference point, filter it
         if len(self.solution_list) > 1:
-            self.solution_list[:] = \
-                [sol for sol in self.solution_list
-                 if self.__dominance_test(sol.objectives, self.__reference_point) != 0]
+            for solution in [sol for sol in self.solution_list
+                             if self.__dominance_test(sol.objectives, self.__reference_point) == 0]:
+                self.non_dominated_solution_archive.remove(solution)
 
     def update_reference_point(self, new_reference_point) -> None:
         with self.lock:
@@ -184,7 +329,7 @@ class ArchiveWithReferencePoint(BoundedArchive[S]):
             self.filter()
 
             if len(self.solution_list) == 0:
-                self.solution_list.append(first_solution)
+                self.non_dominated_solution_archive.add(first_solution)
 
     def get_reference_point(self) -> List[float]:
         with self.lock:
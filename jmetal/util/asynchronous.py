@@ -0,0 +1,105 @@
+import functools
+import os
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from typing import TypeVar, Union
+
+from jmetal.core.algorithm import Algorithm
+from jmetal.core.problem import Problem
+from jmetal.util.evaluator import evaluate_solution, _initialize_worker, _evaluate_in_worker
+
+S = TypeVar('S')
+
+"""
+.. module:: asynchronous
+   :platform: Unix, Windows
+   :synopsis: Asynchronous steady-state master/worker engine.
+
+The engine evaluates the solutions in a pool of workers and keeps all of them busy: as soon as a solution is
+evaluated, it is given to the steady-state replacement of the algorithm and a new solution is submitted, without
+waiting for the rest of the population. The algorithms provide two hooks:
+
+* `propose_solution() -> (solution, context)`: creates a new solution to be evaluated from the current state.
+* `accept_solution(solution, context)`: integrates the evaluated solution into the current state.
+
+They are implemented by :class:`GeneticAlgorithm` (and thus by NSGA-II), MOCell, GDE3 and SMPSO (and its variants).
+
+Example:
+
+>>> algorithm = NSGAII(problem, population_size=100, offspring_population_size=100, ...)
+>>> AsynchronousEngine(workers=8).run(algorithm)
+>>> front = algorithm.get_result()
+"""
+
+
+class AsynchronousEngine:
+
+    def __init__(self, workers: int = None, executor: Union[str, Executor] = 'process'):
+        """
+        :param workers: Number of solutions being evaluated at the same time (number of CPUs by default).
+        :param executor: 'process' or 'thread' to run the workers in a pool created for each run (the process workers
+            are initialised once with the problem), or any :class:`concurrent.futures.Executor` (e.g., the executor of
+            a dask client), which receives the problem with every solution.
+        """
+        if isinstance(executor, str) and executor not in ('process', 'thread'):
+            raise Exception('Unknown executor: ' + executor)
+
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.executor = executor
+
+    def run(self, algorithm: Algorithm) -> None:
+        """ Runs an algorithm until its stopping condition is met. The initial solutions are evaluated together, and
+        then every evaluated solution is accepted as soon as it is available. The observers are notified after every
+        accepted solution. """
+        executor, evaluate = self._open(algorithm.problem)
+        pending = {}
+
+        try:
+            algorithm.start_computing_time = time.time()
+
+            solutions = algorithm.create_initial_solutions()
+            algorithm.solutions = [future.result() for future in [executor.submit(evaluate, s) for s in solutions]]
+            algorithm.init_progress()
+
+            while len(pending) < self.workers:
+                self._submit(algorithm, executor, evaluate, pending)
+
+            while pending and not algorithm.stopping_condition_is_met():
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    algorithm.accept_solution(future.result(), pending.pop(future))
+                    algorithm.evaluations += 1
+
+                    observable_data = algorithm.get_observable_data()
+                    algorithm.observable.notify_all(**observable_data)
+
+                    if algorithm.stopping_condition_is_met():
+                        break
+
+                    self._submit(algorithm, executor, evaluate, pending)
+
+            algorithm.total_computing_time = time.time() - algorithm.start_computing_time
+        finally:
+            for future in pending:
+                future.cancel()
+
+            if executor is not self.executor:
+                executor.shutdown(wait=True)
+
+    def _open(self, problem: Problem) -> tuple:
+        """ Returns the executor and the function evaluating a solution in it. """
+        if self.executor == 'process':
+            return ProcessPoolExecutor(self.workers, initializer=_initialize_worker, initargs=(problem,)), \
+                   _evaluate_in_worker
+
+        evaluate = functools.partial(evaluate_solution, problem=problem)
+        if self.executor == 'thread':
+            return ThreadPoolExecutor(self.workers), evaluate
+
+        return self.executor, evaluate
+
+    @staticmethod
+    def _submit(algorithm: Algorithm, executor: Executor, evaluate, pending: dict) -> None:
+        solution, context = algorithm.propose_solution()
+        pending[executor.submit(evaluate, solution)] = context
@@ -1,9 +1,69 @@
+import json
+import os
+import tempfile
+
 import numpy as np
 from scipy.integrate import odeint
-from scipy.optimize import brentq
 
 logistic = lambda x : 4*x*(1-x)
 
+
+def cachePath () :
+    """
+    Path of the file persisting the limits of the chaotic flows/maps between
+    processes. Its directory is $CHAOSGEN_CACHE_DIR if set, or the user cache
+    directory otherwise
+    """
+
+    root = os.environ.get('CHAOSGEN_CACHE_DIR') or os.path.join(
+        os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'chaosGen')
+    return os.path.join(root, 'limits.json')
+
+def limitsKey (params) :
+    """ Key of a set of parameters in the cache file """
+
+    return repr(tuple(float(p) for p in params))
+
+def loadLimits (name, params) :
+    """ Returns the cached limits of a flow/map for some parameters, or None """
+
+    try :
+        with open(cachePath()) as f :
+            return np.array(json.load(f)[name][limitsKey(params)], dtype=float)
+    except (OSError, ValueError, KeyError, TypeError) :
+        return None
+
+def saveLimits (name, params, lims) :
+    """
+    Adds the limits of a flow/map to the cache file. The file is replaced
+    atomically, as several processes may write it, and errors are ignored as
+    the cache is only an optimisation
+    """
+
+    path = cachePath()
+    try :
+        try :
+            with open(path) as f :
+                cache = json.load(f)
+        except (OSError, ValueError) :
+            cache = {}
+
+        cache.setdefault(name, {})[limitsKey(params)] = np.asarray(lims).tolist()
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix='.tmp')
+        try :
+            with os.fdopen(fd, 'w') as f :
+                json.dump(cache, f)
+            os.replace(tmp, path)
+        finally :
+            # Left behind only if writing or replacing failed
+            if os.path.exists(tmp) :
+                os.remove(tmp)
+    except (OSError, TypeError) :
+        pass
+
+
 class ChaosGenerator () :
     """
     Base class for the chaotic generator
@@ -16,7 +76,7 @@ class ChaosGenerator () :
 
         return (lambda s : lambda i : ChaosGenerator.cgen[gentype](s).chaosPoints(i))(shape)
 
-    def __init__ (self, oshape, gshape=None, cascade=True, gens=2) :
+    def __init__ (self, oshape, gshape=None, cascade=True, gens=2, ahead=4) :
         """
         Child classes use this constructor to initialise essential parameters
         and the internal generators
@@ -32,6 +92,9 @@ class ChaosGenerator () :
                    independent of the other, however!
             gens    - Number of independent internal chaotic generators. Two by
                    default for chaotic pso
+            ahead   - With cascade=True, number of (Np, D) matrices that are
+                   generated ahead per generator. The internal generators
+                   are then ahead of the numbers returned
         """
 
         self.oshape = oshape
@@ -53,8 +116,17 @@ class ChaosGenerator () :
             for i in range(gens)
         ])
 
+        # Buffer (gens, ahead*Np, D) of the cascaded numbers generated ahead,
+        # with the position of the next number of every generator
+        self.ahead = ahead
+        self.buffer = None
+        self.heads = None
+
     def getCgens (self) :
-        """ Returns a copy of the internal generators """
+        """
+        Returns a copy of the internal generators. In cascade mode, they run
+        up to ahead*Np iterates ahead of the numbers returned so far
+        """
         return np.copy (self.cgens)
 
     def chaosPoints (self, gno=0) :
@@ -69,17 +141,48 @@ class ChaosGenerator () :
 
         if gno :
             if self.cascade :
-                # Evolve per particle
-                return np.array ([
-                    self.evolve(gno-1) for i in range(self.oshape[0])
-                ])
+                return self.cascadePoints(gno-1)
             else :
                 return self.evolve(gno-1)
         else :
-            # Evolve per generator (independent of 'cascade') --> Recursive call
-            return np.array ([
-                self.chaosPoints(i+1) for i in range(self.gens)
-            ])
+            if self.cascade :
+                return np.array ([
+                    self.cascadePoints(i) for i in range(self.gens)
+                ])
+            else :
+                # All the generators evolve together
+                return self.evolve(slice(None))
+
+    def __fill__ (self, gind) :
+        """
+        Iterates the map ahead*Np times into the buffer, for the generator
+        gind or for all of them when gind is a slice. Every iterate evolves
+        all the dimensions at once
+        """
+
+        for t in range(self.buffer.shape[1]) :
+            self.buffer[gind, t] = self.evolve(gind)
+        self.heads[gind] = 0
+
+    def cascadePoints (self, gind) :
+        """
+        Returns the next (Np, D) matrix of the generator gind in cascade
+        mode, each particle being the iterate of the previous one
+        """
+
+        Np = self.oshape[0]
+        if self.buffer is None :
+            self.buffer = np.empty((self.gens, self.ahead*Np) + tuple(self.oshape[1:]))
+            self.heads = np.full(self.gens, self.ahead*Np)
+
+        size = self.buffer.shape[1]
+        if self.heads[gind] == size :
+            # All the generators are iterated together once all have run out
+            self.__fill__(slice(None) if (self.heads == size).all() else gind)
+
+        start = self.heads[gind]
+        self.heads[gind] += Np
+        return np.copy(self.buffer[gind, start:start+Np])
 
 
 class Logistic (ChaosGenerator) :
@@ -88,13 +191,13 @@ class Logistic (ChaosGenerator) :
     r = 4 for full chaos
     """
 
-    def __init__ (self, oshape, r=4, cascade=True, gens=2) :
+    def __init__ (self, oshape, r=4, cascade=True, gens=2, ahead=4) :
         """
         r - logistic bifurcation parameter
         Rest is defined in the parent class
         """
 
-        super().__init__(oshape, None, cascade, gens)
+        super().__init__(oshape, None, cascade, gens, ahead)
         self.r = r
 
     def evolve (self, gind) :
@@ -116,43 +219,72 @@ class InverseLE (ChaosGenerator) :
         by Marcin Lawnik
     """
 
-    def __invmap__ (self, eps=1e-4) :
-        if self.le < np.log(2) :
-            lep = lambda p : self.le + p*np.log(p) + (1-p)*np.log(1-p)
-            lo, mid, hi = 0, 0.5, 1
-            cmap = lambda p : lambda x : x/p if x <= p else (1-x)/(1-p)
-        else :
-            n = np.ceil(np.exp(self.le)).astype(np.int)
-            lep = lambda p : self.le - (n-2)/n*np.log(n) + p*np.log(p) + (2/n - p)*np.log(2/n - p)
-            lo, mid, hi = 0, 1/n, 2/n
+    def solve (les, eps=1e-4, iters=100) :
+        """
+        Solves the parameters of the maps of many lyapunov exponents at once
+            les     - Array of lyapunov exponents
+            eps     - Distance of the search intervals to the ends of the
+                    branches
+            iters   - Number of bisection steps
+        Returns the number of branches n of every map (2 for exponents below
+        log(2), whose map is a skew tent map) and the two solutions p of every
+        exponent, with shape les.shape + (2,). If exp(le) is an integer, both
+        are within eps of the tangent solution 1/n
+        """
+
+        les = np.asarray(les, dtype=float)
+        n = np.where(les < np.log(2), 2, np.ceil(np.exp(les)))
 
-            def cmap (p) :
-                def _cmap(x) :
-                    nx = n*x
-                    nums = np.arange(0, n-2)
-                    sub = nums[np.argmin(np.where(nx - nums > 0, nx - nums, n))]
+        # For n == 2 this is le + p*log(p) + (1-p)*log(1-p)
+        lep = lambda p : les - (n-2)/n*np.log(n) + p*np.log(p) + (2/n - p)*np.log(2/n - p)
 
-                    if sub < n-3 or nx < n-2 :
-                        return nx - sub
-                    elif nx < n-2 + p*n : # sub == n-3
-                        return (nx - (sub+1))/(n*p)
-                    else :
-                        return (nx - (sub+1) - n*p)/(2 - n*p)
-                return _cmap
+        def bisect (lo, hi) :
+            flo, fhi = lep(lo), lep(hi)
+            # Without a sign change (exp(le) integer, as le == log(2)) the
+            # root is the tangent one p = 1/n, at the end closest to it
+            tangent = np.sign(flo) == np.sign(fhi)
+            closest = np.where(np.abs(flo) < np.abs(fhi), lo, hi)
 
+            for _ in range(iters) :
+                mid = (lo + hi)/2
+                fmid = lep(mid)
+                same = np.sign(fmid) == np.sign(flo)
+                lo, flo, hi = np.where(same, mid, lo), np.where(same, fmid, flo), np.where(same, hi, mid)
+            return np.where(tangent, closest, (lo + hi)/2)
 
-        plist = [brentq(lep, lo+eps, mid-eps), brentq(lep, mid+eps, hi-eps)]
-        self.invmap = np.vectorize(cmap(plist[
-            1 if np.random.rand() >= 0.5 else 0
-        ]))
+        plist = np.stack((bisect(0*n + eps, 1/n - eps), bisect(1/n + eps, 2/n - eps)), axis=-1)
+        return n.astype(np.int64), plist
 
-    def __init__ (self, oshape, le=1.28991999999, cascade=True, gens=2) :
+    def branchMap (x, n, p) :
+        """
+        Evaluates the piecewise linear map with n branches over an array: the
+        first n-2 branches have slope n, and the last part of the interval is
+        folded as a skew tent map of parameter p
+        """
+
+        if n == 2 :
+            return np.where(x <= p, x/p, (1-x)/(1-p))
+
+        nx = n*x
+        # Branch of every point, the last one including the folded part
+        sub = np.clip(np.ceil(nx) - 1, 0, n-3)
+
+        return np.where((sub < n-3) | (nx < n-2), nx - sub,
+                        np.where(nx < n-2 + p*n, (nx - (n-2))/(n*p), (nx - (n-2) - n*p)/(2 - n*p)))
+
+    def __invmap__ (self, eps=1e-4) :
+        n, plist = InverseLE.solve(self.le, eps)
+        n, p = int(n), plist[1 if np.random.rand() >= 0.5 else 0]
+
+        self.invmap = lambda x : InverseLE.branchMap(x, n, p)
+
+    def __init__ (self, oshape, le=1.28991999999, cascade=True, gens=2, ahead=4) :
         """
 			le      - The lyapunov exponent whose map has to be found
 			Rest is defined in the base class
 		"""
 
-        super().__init__(oshape, None, cascade, gens)
+        super().__init__(oshape, None, cascade, gens, ahead)
         self.le = le
 
         if le == np.log(2) :
@@ -176,11 +308,11 @@ class Tent (ChaosGenerator) :
     """Tent map --> f(x) = 2*x , x <= 0.5 ; 2*(1-x) , x > 0.5
     mu = 0.49999 in the equivalent form for numerical stability"""
 
-    def __init__ (self, oshape, mu=0.49999, cascade=True, gens=2) :
+    def __init__ (self, oshape, mu=0.49999, cascade=True, gens=2, ahead=4) :
         """mu - Tent bifurcation paramater
         Rest is defined in the parent class"""
 
-        super().__init__(oshape, None, cascade, gens)
+        super().__init__(oshape, None, cascade, gens, ahead)
         self.mu = mu
 
     def evolve (self, gind) :
@@ -202,8 +334,13 @@ class Lorenz (ChaosGenerator) :
     sigma, beta, rho = 10, 8/3, 28
     """
 
-	# lims is a dictonary containing {(sigma, beta, rho) : limits(3,2)} pairs
-    lims = {}
+    # lims is a dictonary containing {(sigma, beta, rho) : limits(3,2)} pairs,
+    # with precomputed limits for the default parameters
+    lims = {
+        (10, 8.0/3, 28) : np.array([
+            [-19.58688089, 19.72149918], [-27.26273462, 27.44284128], [0.43258213, 48.09211422]
+        ])
+    }
 
     def lorenz (X, t, sigma, beta, rho) :
         """ lorenz differential equation needed by scipy odeint """
@@ -212,31 +349,86 @@ class Lorenz (ChaosGenerator) :
         dXdt = [sigma*(y-x), x*(rho-z) - y, x*y - beta*z]
         return dXdt
 
+    def derivative (X, params) :
+        """ lorenz differential equation for an array of states (..., 3) """
+
+        sigma, beta, rho = params
+        x, y, z = X[...,0], X[...,1], X[...,2]
+        return np.stack((sigma*(y-x), x*(rho-z) - y, x*y - beta*z), axis=-1)
+
+    def rk4 (X, params, h) :
+        """ Advances an array of states (..., 3) one h-timestep with the fixed-step RK4 """
+
+        k1 = Lorenz.derivative(X, params)
+        k2 = Lorenz.derivative(X + h/2*k1, params)
+        k3 = Lorenz.derivative(X + h/2*k2, params)
+        k4 = Lorenz.derivative(X + h*k3, params)
+        return X + h/6*(k1 + 2*k2 + 2*k3 + k4)
+
+    def computeLimits (params, h=0.01, trajectories=1000, transient=1000, steps=1000) :
+        """
+        Limits of the flow over many trajectories integrated together, after
+        discarding their transient
+        """
+
+        X = np.random.random_sample((trajectories, 3))
+        for _ in range(transient) :
+            X = Lorenz.rk4(X, params, h)
+
+        mn, mx = X.min(axis=0), X.max(axis=0)
+        for _ in range(steps) :
+            X = Lorenz.rk4(X, params, h)
+            mn, mx = np.minimum(mn, X.min(axis=0)), np.maximum(mx, X.max(axis=0))
+
+        return np.stack((mn, mx), axis=1)
+
+    # trajectories is a dictionary containing {(params, h, length) : trajectory(length,3)}
+    # pairs of the pre-rolled trajectories
+    trajectories = {}
+
+    def trajectory (params, h, length, transient=1000) :
+        """
+        Returns a long trajectory of the flow sampled every h-timestep,
+        integrated once per set of parameters
+        """
+
+        key = (params, h, length)
+        if key not in Lorenz.trajectories :
+            Lorenz.trajectories[key] = odeint(Lorenz.lorenz, np.random.rand(3),
+                                              h*np.arange(transient + length), args=params)[transient:]
+        return Lorenz.trajectories[key]
+
     def setLimits (params) :
         """
         No need to recalculate limits of the lorenz flow everytime for the
-        same set of parameters
+        same set of parameters: they are looked up in memory, then in the
+        cache file, and computed and cached otherwise
         """
 
         if params not in Lorenz.lims :
-            # Argument to lambda - (Time series of lorenz flow in all three dimensions)
-            Lorenz.lims[params] = (lambda s:np.array([
-                [np.min(s[:,i]), np.max(s[:,i])] for i in [0, 1, 2]
-            ]))\
-            (odeint (Lorenz.lorenz, np.random.rand(3), np.linspace (0, 9999, 999999), args = params))
+            lims = loadLimits('lorenz', params)
+            if lims is None :
+                lims = Lorenz.computeLimits(params)
+                saveLimits('lorenz', params, lims)
+            Lorenz.lims[params] = lims
 
-    def __init__ (self, oshape, params=(10, 8.0/3, 28), cascade=True, comp=0, h=0.01, gens=2) :
+    def __init__ (self, oshape, params=(10, 8.0/3, 28), cascade=True, comp=0, h=0.01, gens=2, preroll=0, ahead=4) :
         """"
         params  - (sigma, beta, rho) of lorenz parameters
         comp    - which cdim to consider for chaotic numbers
         h       - Time step of evolution
+        preroll - If non-zero, length of a trajectory integrated once and
+                shared by all the points, which start at random positions of
+                it and move one sample per h-timestep (wrapping around at its
+                end) instead of being integrated
         Rest is defined in the parent class
         """
 
-        super().__init__ (oshape, oshape+(3,), cascade, gens)
+        super().__init__ (oshape, oshape+(3,), cascade, gens, ahead)
         self.params = params
         self.comp = comp
         self.h = h
+        self.preroll = preroll
 
         # Set limits if not set already
         Lorenz.setLimits (params)
@@ -256,16 +448,28 @@ class Lorenz (ChaosGenerator) :
                                     (self.cgens[i,...,j], Lorenz.lims[params][j,0], Lorenz.lims[params][j,1])
                 # Argument to lambda - (ith generator jth cdim, min of jth cdim, max of jth cdim)
 
+        if preroll :
+            # Position of every point in the pre-rolled trajectory
+            self.prerolled = Lorenz.trajectory(params, h, preroll)
+            self.positions = np.random.randint(0, preroll, self.cgens.shape[:-1])
+            self.cgens = self.prerolled[self.positions]
+
     def evolveT (self, gind, T=1) :
         """
         Evolves the lorenz map for T timesteps
-        and sets the internal generator
+        and sets the internal generator. gind may also be a slice, e.g. to
+        evolve all the generators together
         """
 
-        for pt in np.ndindex(self.gshape[:-1]) :
-        # Per index in (Np, D)
-            self.cgens[gind][pt] = odeint(Lorenz.lorenz, self.cgens[gind][pt],
-                                          np.arange(0,self.h*(T+1),self.h), args=self.params)[-1]
+        if self.preroll :
+            self.positions[gind] = (self.positions[gind] + T) % self.preroll
+            self.cgens[gind] = self.prerolled[self.positions[gind]]
+        else :
+            # All the points (Np, D) at once
+            states = self.cgens[gind]
+            for _ in range(T) :
+                states = Lorenz.rk4(states, self.params, self.h)
+            self.cgens[gind] = states
 
     def evolve (self, gind) :
         """
@@ -299,38 +503,71 @@ class Henon (ChaosGenerator) :
     (x,y) -> (1-ax^2+y, bx)
     """
 
-    lims = {}
+    # Precomputed limits for the default parameters
+    lims = {
+        (1.4, 0.3) : np.array([
+            [-1.28466379, 1.27297361], [-0.38539914, 0.38189208]
+        ])
+    }
+
+    def computeLimits (params, orbits=1000, transient=100, steps=1000) :
+        """
+        Limits of many orbits iterated together, after discarding their
+        transient. They start close to the origin, which lies in the basin of
+        attraction
+        """
+
+        a, b = params
+        x, y = 0.1*np.random.random_sample(orbits), 0.1*np.random.random_sample(orbits)
+        for _ in range(transient) :
+            x, y = 1 - a*x*x + y, b*x
+
+        minx, maxx, miny, maxy = x.min(), x.max(), y.min(), y.max()
+        for _ in range(steps) :
+            x, y = 1 - a*x*x + y, b*x
+            minx, maxx = min(minx, x.min()), max(maxx, x.max())
+            miny, maxy = min(miny, y.min()), max(maxy, y.max())
+
+        return np.array([
+            [minx, maxx], [miny, maxy]
+        ])
 
     def setLimits (params) :
-        """ Sets the x, y limits of a run of iterates of the Henon map """
+        """
+        Sets the x, y limits of the iterates of the Henon map, looking them up
+        in memory, then in the cache file, and computing and caching them
+        otherwise
+        """
 
         if not params in Henon.lims :
-            a, b = params
-            x, y = np.random.rand(), np.random.rand()
-            minx, maxx, miny, maxy = x, x, y, y
+            lims = loadLimits('henon', params)
+            if lims is None :
+                lims = Henon.computeLimits(params)
+                saveLimits('henon', params, lims)
+            Henon.lims[params] = lims
 
-            for _ in range(999999) :
-                tmp = x
-                x = 1 - a*x*x + y
-                y = b*tmp
+    def escapes (states, params, iters=100) :
+        """
+        Tells which states (..., 2) leave the attractor within iters iterates,
+        as some points of the bounding box lie out of its basin of attraction
+        """
 
-                minx = min(minx, x)
-                miny = min(miny, y)
-                maxx = max(maxx, x)
-                maxy = max(maxy, y)
+        a, b = params
+        x, y = np.copy(states[...,0]), np.copy(states[...,1])
 
-            Henon.lims[params] = np.array([
-                [minx, maxx], [miny, maxy]
-            ])
+        with np.errstate(over='ignore', invalid='ignore') :
+            for _ in range(iters) :
+                x, y = 1 - a*x*x + y, b*x
 
+        return np.invert(np.isfinite(x)) | (np.abs(x) > 2)
 
-    def __init__ (self, oshape, params=(1.4, 0.3), cascade=True, comp=0, gens=2) :
+    def __init__ (self, oshape, params=(1.4, 0.3), cascade=True, comp=0, gens=2, ahead=4) :
         """
         Constructor for the Henon chaotic map object
         params          - (a, b) parameters of the Henon map
         """
 
-        super().__init__ (oshape, oshape+(2,), cascade, gens)
+        super().__init__ (oshape, oshape+(2,), cascade, gens, ahead)
         self.params = params
         self.comp = comp
 
@@ -344,6 +581,13 @@ class Henon (ChaosGenerator) :
                 self.cgens[i,...,j] = (lambda st,mn,mx : mn + (mx - mn)*st)\
                                     (self.cgens[i,...,j], Henon.lims[params][j,0], Henon.lims[params][j,1])
 
+        # Diverging initial points are drawn again
+        escaping = Henon.escapes(self.cgens, params)
+        while np.any(escaping) :
+            lims = Henon.lims[params]
+            self.cgens[escaping] = lims[:,0] + (lims[:,1] - lims[:,0])*np.random.random_sample((np.count_nonzero(escaping), 2))
+            escaping = Henon.escapes(self.cgens, params)
+
     def evolve (self, gind) :
         """ Evolves the Henon map by one iterate """
 
@@ -374,9 +618,9 @@ class Baker (ChaosGenerator) :
                     (2-2x, 1-y/2) 1/2 <= x < 1
     """
 
-    def __init__ (self, oshape, mu=0.49999, cascade=True, comp=0, gens=2) :
+    def __init__ (self, oshape, mu=0.49999, cascade=True, comp=0, gens=2, ahead=4) :
 
-        super().__init__ (oshape, oshape+(2,), cascade, gens)
+        super().__init__ (oshape, oshape+(2,), cascade, gens, ahead)
         self.mu = mu
         self.comp = comp
 
@@ -385,13 +629,14 @@ class Baker (ChaosGenerator) :
 
         ret = np.copy(self.cgens[gind,...,self.comp])
         x, y = np.copy(self.cgens[gind,...,0]), np.copy(self.cgens[gind,...,1])
-        less = x < self.mu
-        more = np.invert(less)
+        mu = self.mu
+        less = x < mu
 
-        self.cgens[gind,less,0] = 2*x[less]
-        self.cgens[gind,less,1] = y[less]/2
-        self.cgens[gind,more,0] = 2 - 2*x[more]
-        self.cgens[gind,more,1] = 1 - y[more]/2
+        # Equivalent form of the map with mu instead of 1/2, as in the tent
+        # map, so that the iterates do not collapse to 0 in floating point.
+        # gind may also be a slice of the generators
+        self.cgens[gind,...,0] = np.where(less, x/mu, (1 - x)/(1 - mu))
+        self.cgens[gind,...,1] = np.where(less, mu*y, 1 - (1 - mu)*y)
 
         return ret
 
@@ -470,3 +715,70 @@ cgen = {
 "inverse"   : InverseLE,
 "beach"		: Beach
 }
+
+
+class ChaoticRandomSource () :
+    """
+    Hands out chaotic numbers in [0, 1] in matrices of any shape, as needed by
+    the r1, r2 coefficients of chaotic PSOs. Every internal generator evolves
+    many independent streams of a chaotic map at once (cascade=False) and the
+    numbers are precomputed in blocks, so drawing a matrix for a whole swarm
+    costs a slice instead of one map evolution per number. The streams are
+    interleaved, so neighbouring numbers come from different streams rather
+    than being consecutive (correlated) iterates of the same one
+    """
+
+    def __init__ (self, name='tent', args=(), streams=256, block=256, gens=2) :
+        """
+        name    - Key of the chaotic map in 'cgen'
+        args    - Parameters of the chaotic map (defaults of the map if empty)
+        streams - Number of independent chaotic sequences per generator
+        block   - Number of iterates of every stream computed per refill
+        gens    - Number of independent internal generators
+        """
+
+        if name not in cgen or not issubclass(cgen[name], ChaosGenerator) :
+            raise Exception('Unsupported chaotic map: {}'.format(name))
+
+        self.generator = cgen[name]((streams, ), *args, cascade=False, gens=gens)
+        self.block = block
+        self.gens = gens
+
+        # Precomputed numbers and position of the next one, per generator
+        self.buffers = [np.empty(0) for _ in range(gens)]
+        self.offsets = [0]*gens
+
+    def __fill__ (self, gind) :
+        """ Precomputes the next block of iterates of every stream """
+
+        # (block, streams), flattened row by row, so the consecutive numbers
+        # of a buffer are the same iterate of consecutive streams
+        iterates = np.array([
+            self.generator.evolve(gind) for _ in range(self.block)
+        ])
+
+        self.buffers[gind] = np.ravel(iterates)
+        self.offsets[gind] = 0
+
+    def chaosPoints (self, shape, gno=1) :
+        """
+        Returns a matrix of the given shape with the next numbers of the
+        internal generator gno (indexed from 1)
+        """
+
+        gind = gno - 1
+        remaining = int(np.prod(shape))
+        parts = []
+
+        while remaining > 0 :
+            if self.offsets[gind] == len(self.buffers[gind]) :
+                self.__fill__(gind)
+
+            start = self.offsets[gind]
+            end = min(start + remaining, len(self.buffers[gind]))
+            parts.append(self.buffers[gind][start:end])
+
+            self.offsets[gind] = end
+            remaining -= end - start
+
+        return np.concatenate(parts).reshape(shape) if parts else np.empty(shape)
@@ -1,11 +1,15 @@
+import heapq
 import logging
 from abc import ABC, abstractmethod
+from bisect import bisect_left
 from functools import cmp_to_key
 from typing import TypeVar, List
 
 import numpy
-from scipy.spatial.distance import euclidean
+from scipy.spatial import cKDTree
+from scipy.spatial.distance import cdist
 
+from jmetal.core.population import Population
 from jmetal.util.comparator import SolutionAttributeComparator, Comparator
 
 LOGGER = logging.getLogger('jmetal')
@@ -26,68 +30,169 @@ class DensityEstimator(List[S], ABC):
     """
 
     @abstractmethod
-    def compute_density_estimator(self, solutions: List[S]) -> float:
+    def compute_density_estimator(self, solutions: List[S]) -> numpy.ndarray:
         pass
 
     @abstractmethod
     def sort(self, solutions: List[S]) -> List[S]:
         pass
 
+    def remove(self, solutions: List[S], index: int) -> numpy.ndarray:
+        """ Deletes a solution from a list and updates the density estimation of the remaining ones. Subclasses may
+        override it to update the values computed by the last call to :meth:`compute_density_estimator` instead of
+        computing them again.
+
+        :param solutions: The list of solutions, which is modified in place.
+        :param index: Position of the solution to remove.
+        :return: Density values of the remaining solutions.
+        """
+        del solutions[index]
+
+        return self.compute_density_estimator(solutions)
+
     @classmethod
     def get_comparator(cls) -> Comparator:
         pass
 
 
+def _objective_matrix(solutions: List[S]) -> numpy.ndarray:
+    if isinstance(solutions, Population):
+        return solutions.objectives
+
+    return numpy.array([solution.objectives for solution in solutions], dtype=float)
+
+
+def _set_attribute(solutions: List[S], name: str, values: numpy.ndarray) -> None:
+    if isinstance(solutions, Population):
+        solutions.set_column(name, values)
+    else:
+        for solution, value in zip(solutions, values.tolist()):
+            solution.attributes[name] = value
+
+
+def _row_of(solution, solutions: List[S]) -> int:
+    """ Position of a solution (compared by identity) in a list, or -1. """
+    for row, other in enumerate(solutions):
+        if other is solution:
+            return row
+
+    return -1
+
+
+def crowding_distances(objectives, orders: List[numpy.ndarray] = None) -> numpy.ndarray:
+    """ Computes the crowding distance of every row of an objective matrix.
+
+    :param objectives: (N, m) matrix of objective values.
+    :param orders: Row indices sorted by each objective (optional, computed if not given).
+    :return: Array with the crowding distance of each row.
+    """
+    objectives = numpy.asarray(objectives, dtype=float)
+    size = objectives.shape[0]
+    if size <= 2:
+        return numpy.full(size, float('inf'))
+
+    if orders is None:
+        orders = _objective_orders(objectives)
+
+    distances = numpy.zeros(size)
+    for i, order in enumerate(orders):
+        values = objectives[order, i]
+        gaps = values[2:] - values[:-2]
+
+        # If the minimum and maximum are the same the gaps are not normalized
+        objective_range = values[-1] - values[0]
+        if objective_range != 0:
+            gaps = gaps / objective_range
+
+        distances[order[1:-1]] += gaps
+        distances[order[[0, -1]]] = float('inf')
+
+    return distances
+
+
+def _objective_orders(objectives: numpy.ndarray) -> List[numpy.ndarray]:
+    """ Row indices sorted by each objective. As in successive calls to `sorted`, ties keep the order given by the
+    previous objective. """
+    orders = []
+    order = numpy.arange(objectives.shape[0])
+    for i in range(objectives.shape[1]):
+        order = order[numpy.argsort(objectives[order, i], kind='stable')]
+        orders.append(order)
+
+    return orders
+
+
+def k_nearest_neighbor_distances(objectives, k: int = 1) -> numpy.ndarray:
+    """ Computes the distance from every row of an objective matrix to its k-th nearest row.
+
+    :param objectives: (N, m) matrix of objective values, with N > k.
+    :param k: Neighbor used as density estimation.
+    :return: Array with the k-th nearest distance of each row.
+    """
+    objectives = numpy.asarray(objectives, dtype=float)
+
+    # Each row is its own nearest neighbor, at distance 0
+    if objectives.shape[0] > KNearestNeighborDensityEstimator.KD_TREE_SIZE:
+        distances, _ = cKDTree(objectives).query(objectives, k=k + 1)
+        return distances[:, k]
+
+    return numpy.partition(cdist(objectives, objectives), k, axis=1)[:, k]
+
+
 class CrowdingDistance(DensityEstimator[List[S]]):
     """This class implements a DensityEstimator based on the crowding distance of algorithm NSGA-II.
+
+    The orders of the last front given to :meth:`compute_density_estimator` are kept, so that :meth:`remove` updates
+    the distances in O(N m) instead of sorting the front again. The estimator holds references to the solutions of that
+    front until the next call, which releases them.
     """
 
-    def compute_density_estimator(self, front: List[S]):
+    def __init__(self):
+        super().__init__()
+        self.solutions = []
+        self.objectives = numpy.zeros((0, 0))
+        self.orders = []
+
+    def compute_density_estimator(self, front: List[S]) -> numpy.ndarray:
         """This function performs the computation of the crowding density estimation over the solution list.
 
         .. note::
            This method assign the distance in the inner elements of the solution list.
 
         :param front: The list of solutions.
+        :return: Array with the crowding distance of each solution.
         """
-        size = len(front)
+        if len(front) == 0:
+            self.solutions, self.orders = [], []
+            return numpy.zeros(0)
 
-        if size is 0:
-            return
-        elif size is 1:
-            front[0].attributes['crowding_distance'] = float("inf")
-            return
-        elif size is 2:
-            front[0].attributes['crowding_distance'] = float("inf")
-            front[1].attributes['crowding_distance'] = float("inf")
-            return
+        self.solutions = list(front)
+        self.objectives = _objective_matrix(front)
+        self.orders = _objective_orders(self.objectives) if len(front) > 2 else []
 
-        for i in range(len(front)):
-            front[i].attributes['crowding_distance'] = 0.0
+        distances = crowding_distances(self.objectives, self.orders)
+        _set_attribute(front, 'crowding_distance', distances)
 
-        number_of_objectives = front[0].number_of_objectives
+        return distances
 
-        for i in range(number_of_objectives):
-            # Sort the population by Obj n
-            front = sorted(front, key=lambda x: x.objectives[i])
-            objective_minn = front[0].objectives[i]
-            objective_maxn = front[len(front) - 1].objectives[i]
+    def remove(self, solutions: List[S], index: int) -> numpy.ndarray:
+        row = _row_of(solutions[index], self.solutions)
+        if row < 0 or len(self.solutions) != len(solutions):
+            return super().remove(solutions, index)
 
-            # Set de crowding distance
-            front[0].attributes['crowding_distance'] = float('inf')
-            front[size - 1].attributes['crowding_distance'] = float('inf')
+        del solutions[index]
+        del self.solutions[row]
+        self.objectives = numpy.delete(self.objectives, row, axis=0)
+        if len(self.solutions) > 2:
+            self.orders = [_delete_row(order, row) for order in self.orders]
+        else:
+            self.orders = []
 
-            for j in range(1, size - 1):
-                distance = front[j + 1].objectives[i] - front[j - 1].objectives[i]
+        distances = crowding_distances(self.objectives, self.orders)
+        for solution, distance in zip(self.solutions, distances.tolist()):
+            solution.attributes['crowding_distance'] = distance
 
-                # Check if minimum and maximum are the same (in which case do nothing)
-                if objective_maxn - objective_minn == 0:
-                    pass;  # LOGGER.warning('Minimum and maximum are the same!')
-                else:
-                    distance = distance / (objective_maxn - objective_minn)
-
-                distance += front[j].attributes['crowding_distance']
-                front[j].attributes['crowding_distance'] = distance
+        return distances
 
     def sort(self, solutions: List[S]) -> List[S]:
         solutions.sort(key=cmp_to_key(self.get_comparator().compare))
@@ -97,65 +202,322 @@ class CrowdingDistance(DensityEstimator[List[S]]):
         return SolutionAttributeComparator("crowding_distance", lowest_is_best=False)
 
 
+class IncrementalCrowdingDistance:
+    """ Crowding distances of a set of solutions changing by single insertions and removals, such as the set kept by a
+    bounded archive. The solutions are kept sorted by each objective, so an insertion or a removal only recomputes the
+    distances of its neighbors (or of all the solutions, for an objective whose extreme values change), and a heap
+    gives the most crowded solution. Ties in an objective, and between equally crowded solutions, are broken by
+    insertion order.
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.sequences = {}
+        self.keys: List[List[tuple]] = []
+        self.sorted_entries: List[list] = []
+        self.heap = []
+        self.next_sequence = 0
+
+    def add(self, solution: S) -> None:
+        objectives = [float(value) for value in solution.objectives]
+        if len(self.entries) == 0:
+            self.keys = [[] for _ in objectives]
+            self.sorted_entries = [[] for _ in objectives]
+
+        entry = _CrowdingEntry(solution, objectives, self.next_sequence)
+        self.next_sequence += 1
+        self.entries[id(solution)] = entry
+        self.sequences[entry.sequence] = entry
+
+        changed = {entry.sequence: entry}
+        for i, value in enumerate(objectives):
+            key = (value, entry.sequence)
+            position = bisect_left(self.keys[i], key)
+            self.keys[i].insert(position, key)
+            self.sorted_entries[i].insert(position, entry)
+            self.__update_contributions(i, position - 1, position + 2, changed)
+
+        self.__update_distances(changed)
+
+    def remove(self, solution: S) -> bool:
+        entry = self.entries.pop(id(solution), None)
+        if entry is None:
+            return False
+        del self.sequences[entry.sequence]
+
+        changed = {}
+        for i, value in enumerate(entry.objectives):
+            position = bisect_left(self.keys[i], (value, entry.sequence))
+            del self.keys[i][position]
+            del self.sorted_entries[i][position]
+            self.__update_contributions(i, position - 1, position + 1, changed)
+
+        self.__update_distances(changed)
+
+        return True
+
+    def synchronize(self, solutions: List[S]) -> None:
+        """ Removes the solutions which are not in a list (compared by identity) and adds the new ones. """
+        current = {id(solution): solution for solution in solutions}
+        for entry in [entry for key, entry in self.entries.items() if key not in current]:
+            self.remove(entry.solution)
+        for key, solution in current.items():
+            if key not in self.entries:
+                self.add(solution)
+
+    def most_crowded(self) -> S:
+        """ Returns the solution with the lowest crowding distance. """
+        while self.heap:
+            distance, sequence = self.heap[0]
+            entry = self.sequences.get(sequence)
+            if entry is not None and entry.distance == distance:
+                return entry.solution
+            heapq.heappop(self.heap)
+
+        raise Exception('The set of solutions is empty')
+
+    def assign(self) -> None:
+        """ Sets the 'crowding_distance' attribute of the solutions. """
+        for entry in self.entries.values():
+            entry.solution.attributes['crowding_distance'] = entry.distance
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __update_contributions(self, i: int, start: int, end: int, changed: dict) -> None:
+        """ Recomputes the contribution of objective i to the distances of the positions in [start, end), or of all the
+        positions if the range of the objective changes, or if there were or there are at most two solutions. """
+        keys = self.keys[i]
+        entries = self.sorted_entries[i]
+        size = len(entries)
+        if size <= 3 or start < 0 or end > size:
+            start, end = 0, size
+
+        objective_range = keys[-1][0] - keys[0][0] if size > 0 else 0.0
+        for position in range(start, end):
+            entry = entries[position]
+            if size <= 2 or position == 0 or position == size - 1:
+                entry.contributions[i] = float('inf')
+            else:
+                # If the minimum and maximum are the same the gaps are not normalized
+                gap = keys[position + 1][0] - keys[position - 1][0]
+                entry.contributions[i] = gap / objective_range if objective_range != 0 else gap
+            changed[entry.sequence] = entry
+
+    def __update_distances(self, changed: dict) -> None:
+        for entry in changed.values():
+            # Summed as in crowding_distances, so that the values are the same
+            distance = 0.0
+            for contribution in entry.contributions:
+                distance += contribution
+
+            if distance != entry.distance:
+                entry.distance = distance
+                heapq.heappush(self.heap, (distance, entry.sequence))
+
+        # Outdated heap items are discarded when they reach the top; the heap is rebuilt if there are too many
+        if len(self.heap) > 4 * len(self.entries) + 64:
+            self.heap = [(entry.distance, entry.sequence) for entry in self.entries.values()]
+            heapq.heapify(self.heap)
+
+
+class _CrowdingEntry:
+
+    __slots__ = ['solution', 'objectives', 'sequence', 'contributions', 'distance']
+
+    def __init__(self, solution, objectives: List[float], sequence: int):
+        self.solution = solution
+        self.objectives = objectives
+        self.sequence = sequence
+        self.contributions = [float('inf')] * len(objectives)
+        self.distance = None
+
+
+def _decreasing_lexicographic_order(rows: numpy.ndarray) -> numpy.ndarray:
+    """ Stable order of the rows of a matrix by decreasing lexicographic value. Most rows differ in their first values,
+    so the number of compared columns is doubled until every pair of consecutive rows is told apart. """
+    width = 1
+    while True:
+        # lexsort is stable and uses its last key as the primary one
+        keys = -rows[:, :width]
+        order = numpy.lexsort(keys[:, ::-1].T)
+
+        sorted_keys = keys[order]
+        if width >= rows.shape[1] or not (sorted_keys[1:] == sorted_keys[:-1]).all(axis=1).any():
+            return order
+
+        width = min(2 * width, rows.shape[1])
+
+
+def _delete_row(order: numpy.ndarray, row: int) -> numpy.ndarray:
+    order = order[order != row]
+    order[order > row] -= 1
+
+    return order
+
+
 class KNearestNeighborDensityEstimator(DensityEstimator[List[S]]):
     """This class implements a density estimator based on the distance to the k-th nearest solution.
+
+    The distances of the last solution list given to :meth:`compute_density_estimator` are kept. Once they are needed by
+    :meth:`sort` or :meth:`remove`, the neighbors of every solution are sorted by distance and the nearest ones are kept
+    in a head of `k + HEAD_SIZE` values. Removing a solution only updates the heads containing it, refilling them with
+    the next alive neighbor, so that the sequential truncation of SPEA2 does not compute the distances again. The
+    estimator holds references to the solutions of that list until the next call, which releases them.
     """
 
+    # Lists larger than this use a KD-tree when only the densities are needed
+    KD_TREE_SIZE = 2000
+
+    HEAD_SIZE = 16
+
     def __init__(self, k: int = 1):
         super().__init__()
         self.k = k
+        self.solutions = []
+        self.rows = {}
+        self.objectives = numpy.zeros((0, 0))
         self.distance_matrix = []
-
-    def compute_density_estimator(self, solutions: List[S]):
+        self.neighbors = None
+        self.sorted_distances = numpy.zeros((0, 0))
+        self.alive = numpy.zeros(0, dtype=bool)
+        self.head_size = 0
+        self.heads = numpy.zeros((0, 0), dtype=numpy.int64)
+        self.head_distances = numpy.zeros((0, 0))
+        self.next_neighbor = numpy.zeros(0, dtype=numpy.int64)
+        self.sorted_list, self.sorted_rows = None, None
+
+    def compute_density_estimator(self, solutions: List[S]) -> numpy.ndarray:
+        """ Assigns to every solution the distance to its k-th nearest solution.
+
+        :param solutions: The list of solutions.
+        :return: Array with the density of each solution. If the list has no more than k solutions, none of them has a
+            k-th nearest solution, so their attributes are left unchanged and their distances are infinite.
+        """
         solutions_size = len(solutions)
         if solutions_size <= self.k:
-            return
+            self.solutions, self.rows = [], {}
+            self.objectives, self.distance_matrix = numpy.zeros((0, 0)), []
+            self.neighbors = None
+            self.sorted_list, self.sorted_rows = None, None
+            return numpy.full(solutions_size, numpy.inf)
+
+        self.solutions = list(solutions)
+        self.rows = {id(solution): row for row, solution in enumerate(self.solutions)}
+        self.objectives = _objective_matrix(solutions)
+        self.neighbors = None
+        self.sorted_list, self.sorted_rows = None, None
+
+        if solutions_size > self.KD_TREE_SIZE:
+            # The distance matrix is only computed if it is required later
+            self.distance_matrix = None
+            densities = k_nearest_neighbor_distances(self.objectives, self.k)
+        else:
+            self.distance_matrix = cdist(self.objectives, self.objectives)
+            densities = numpy.partition(self.distance_matrix, self.k, axis=1)[:, self.k]
+
+        _set_attribute(solutions, 'knn_density', densities)
+
+        return densities
+
+    def remove(self, solutions: List[S], index: int) -> numpy.ndarray:
+        row = self.rows.get(id(solutions[index]), -1)
+        if row < 0 or len(self.rows) != len(solutions) or len(solutions) <= self.k + 1:
+            return super().remove(solutions, index)
 
-        points = []
-        for i in range(solutions_size):
-            points.append(solutions[i].objectives)
-
-        # Compute distance matrix
-        self.distance_matrix = numpy.zeros(shape=(solutions_size, solutions_size))
-        for i in range(solutions_size):
-            for j in range(solutions_size):
-                self.distance_matrix[i, j] = self.distance_matrix[j, i] = euclidean(solutions[i].objectives,
-                                                                                    solutions[j].objectives)
-        # Gets the k-nearest distance of all the solutions
-        for i in range(solutions_size):
-            distances = []
-            for j in range(solutions_size):
-                distances.append(self.distance_matrix[i, j])
-            distances.sort()
-            solutions[i].attributes['knn_density'] = distances[self.k]
+        self.__sort_neighbors()
+
+        del solutions[index]
+        del self.rows[id(self.solutions[row])]
+        self.alive[row] = False
+
+        affected = numpy.flatnonzero((self.heads[:, :self.head_size] == row).any(axis=1) & self.alive)
+        for i in affected.tolist():
+            self.__remove_from_head(i, row)
+        self.head_size = min(self.head_size, len(self.rows))
+
+        for i, density in zip(affected.tolist(), self.head_distances[affected, self.k].tolist()):
+            self.solutions[i].attributes['knn_density'] = density
+
+        return self.head_distances[self.__rows_of(solutions, removed=index), self.k]
 
     def sort(self, solutions: List[S]) -> List[S]:
-        def compare(solution1, solution2):
-            distances1 = solution1.attributes["distances_"]
-            distances2 = solution2.attributes["distances_"]
-
-            tmp_k = self.k
-            if distances1[tmp_k] > distances2[tmp_k]:
-                return -1
-            elif distances1[tmp_k] < distances2[tmp_k]:
-                return 1
-            else:
-                while tmp_k < (len(distances1) - 1):
-                    tmp_k += 1
-                    if distances1[tmp_k] > distances2[tmp_k]:
-                        return -1
-                    elif distances1[tmp_k] < distances2[tmp_k]:
-                        return 1
-            return 0
-
-        for i in range(len(solutions)):
-            distances = []
-            for j in range(len(solutions)):
-                distances.append(self.distance_matrix[i, j])
-            distances.sort()
-            solutions[i].attributes["distances_"] = distances
-
-        solutions.sort(key=cmp_to_key(compare))
+        """ Sorts the solutions by decreasing distance to their k-th nearest solution, breaking ties with the distances
+        to the following ones. """
+        if len(solutions) <= self.k:
+            return
+
+        rows = self.__rows_of(solutions)
+        if (rows < 0).any():
+            self.compute_density_estimator(solutions)
+            rows = numpy.arange(len(solutions))
+        self.__sort_neighbors()
+
+        keys = self.head_distances[rows, self.k:self.head_size]
+        order = _decreasing_lexicographic_order(keys)
+
+        # Rows tied in their heads are compared with all their distances
+        if self.head_size < len(self.rows):
+            sorted_keys = keys[order]
+            ties = numpy.concatenate(([False], (sorted_keys[1:] == sorted_keys[:-1]).all(axis=1), [False]))
+            starts = numpy.flatnonzero(~ties[:-1] & ties[1:])
+            ends = numpy.flatnonzero(ties[:-1] & ~ties[1:]) + 1
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                group = order[start:end]
+                distances = numpy.array([self.__alive_distances(row)[self.k:] for row in rows[group].tolist()])
+                order[start:end] = group[_decreasing_lexicographic_order(distances)]
+
+        solutions[:] = [solutions[i] for i in order.tolist()]
+        self.sorted_list, self.sorted_rows = solutions, rows[order]
+
+    def __rows_of(self, solutions: List[S], removed: int = None) -> numpy.ndarray:
+        """ Rows of the solutions of a list. The rows of the last sorted list are kept, as the truncation only sorts
+        the list and removes its last solution. """
+        if solutions is self.sorted_list:
+            if removed is not None:
+                self.sorted_rows = numpy.delete(self.sorted_rows, removed)
+            if len(self.sorted_rows) == len(solutions):
+                return self.sorted_rows
+
+        self.sorted_list, self.sorted_rows = None, None
+
+        return numpy.array([self.rows.get(id(solution), -1) for solution in solutions], dtype=numpy.int64)
+
+    def __sort_neighbors(self) -> None:
+        if self.neighbors is not None:
+            return
+
+        if self.distance_matrix is None:
+            self.distance_matrix = cdist(self.objectives, self.objectives)
+        self.neighbors = numpy.argsort(self.distance_matrix, axis=1, kind='stable')
+        self.sorted_distances = numpy.take_along_axis(self.distance_matrix, self.neighbors, axis=1)
+        self.alive = numpy.ones(len(self.solutions), dtype=bool)
+
+        # Every head holds the nearest alive neighbors (the solution itself included) in increasing distance
+        self.head_size = min(len(self.solutions), self.k + self.HEAD_SIZE)
+        self.heads = self.neighbors[:, :self.head_size].copy()
+        self.head_distances = self.sorted_distances[:, :self.head_size].copy()
+        self.next_neighbor = numpy.full(len(self.solutions), self.head_size)
+
+    def __remove_from_head(self, i: int, row: int) -> None:
+        last = self.head_size - 1
+        position = int(numpy.flatnonzero(self.heads[i, :self.head_size] == row)[0])
+        self.heads[i, position:last] = self.heads[i, position + 1:self.head_size]
+        self.head_distances[i, position:last] = self.head_distances[i, position + 1:self.head_size]
+
+        start = int(self.next_neighbor[i])
+        while start < len(self.solutions):
+            alive = self.alive[self.neighbors[i, start:start + 64]]
+            if alive.any():
+                start += int(alive.argmax())
+                self.heads[i, last] = self.neighbors[i, start]
+                self.head_distances[i, last] = self.sorted_distances[i, start]
+                break
+            start += 64
+        self.next_neighbor[i] = min(start + 1, len(self.solutions))
+
+    def __alive_distances(self, row: int) -> numpy.ndarray:
+        return self.sorted_distances[row][self.alive[self.neighbors[row]]]
 
     @classmethod
     def get_comparator(cls) -> Comparator:
@@ -1,7 +1,20 @@
+import copy
 import functools
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+import weakref
 from abc import ABC, abstractmethod
-from multiprocessing.pool import ThreadPool, Pool
-from typing import TypeVar, List, Generic
+from collections import deque, OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import TypeVar, List, Generic, Callable, Iterable
+
+import numpy as np
 
 try:
     import dask
@@ -13,7 +26,9 @@ try:
 except ImportError:
     pass
 
-from jmetal.core.problem import Problem
+from jmetal.core.population import Population
+from jmetal.core.problem import Problem, DynamicProblem
+from jmetal.core.solution import Solution, FloatSolution, IntegerSolution
 
 S = TypeVar('S')
 
@@ -28,50 +43,262 @@ class Evaluator(Generic[S], ABC):
     def evaluate_solution(solution: S, problem: Problem) -> None:
         problem.evaluate(solution)
 
+    @staticmethod
+    def evaluate_in_batch(solution_list: List[S], problem: Problem) -> None:
+        """ Evaluates a list of solutions (or a :class:`Population`) with a single call to `problem.evaluate_batch`. """
+        if isinstance(solution_list, Population):
+            objectives, constraints = problem.evaluate_batch(solution_list.variables)
+            solution_list.objectives[:] = objectives
+            if constraints is not None:
+                solution_list.constraints[:] = constraints
+        else:
+            variables = np.array([solution.variables for solution in solution_list], dtype=float)
+            objectives, constraints = problem.evaluate_batch(variables)
+            for index, solution in enumerate(solution_list):
+                solution.objectives = objectives[index].tolist()
+                if constraints is not None:
+                    solution.constraints = constraints[index].tolist()
+
 
 class SequentialEvaluator(Evaluator[S]):
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        for solution in solution_list:
-            Evaluator.evaluate_solution(solution, problem)
+        if len(solution_list) > 0 and problem.supports_batch_evaluation():
+            Evaluator.evaluate_in_batch(solution_list, problem)
+        else:
+            for solution in solution_list:
+                Evaluator.evaluate_solution(solution, problem)
 
         return solution_list
 
 
-class MapEvaluator(Evaluator[S]):
+class PoolEvaluator(Evaluator[S], ABC):
+    """ Base class of the evaluators running the solutions in a pool of workers (threads, processes, dask or spark).
+
+    The evaluators share their lifecycle: they can be used as context managers, and :meth:`close` releases the
+    workers. The solutions are sent to the workers in chunks with :meth:`map_chunked`, which also measures the latency
+    (seconds per solution) of the workers. Unless a chunk size is given, chunks take about `target_chunk_time` seconds,
+    so that cheap objectives are not dominated by the communication overhead, but no more than a quarter of the
+    solutions per worker, so that expensive objectives are balanced among the workers.
+    """
 
-    def __init__(self, processes: int = None):
-        self.pool = ThreadPool(processes)
+    def __init__(self, processes: int = None, chunk_size: int = None, target_chunk_time: float = 0.05):
+        """
+        :param processes: Number of workers (number of CPUs by default).
+        :param chunk_size: Number of solutions per chunk (adaptive by default).
+        :param target_chunk_time: Seconds of evaluation per chunk when the chunk size is adaptive.
+        """
+        self.processes = processes if processes is not None else os.cpu_count()
+        self.chunk_size = chunk_size
+        self.target_chunk_time = target_chunk_time
+
+        self.latency = None
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        self.pool.map(lambda solution: Evaluator.evaluate_solution(solution, problem), solution_list)
+        evaluated_solutions = self.map_chunked(functools.partial(evaluate_solution, problem=problem), solution_list)
 
-        return solution_list
+        return write_back(solution_list, evaluated_solutions)
+
+    def map_chunked(self, function: Callable, items: Iterable, chunk_size: int = None) -> List:
+        """ Applies a function to the items in the workers, in chunks, and returns the results in order. """
+        items = list(items)
+        chunk_size = chunk_size or self.get_chunk_size(len(items))
+        chunks = [items[start:start + chunk_size] for start in range(0, len(items), chunk_size)]
+
+        results = []
+        for chunk_results, elapsed in self._map_chunks(functools.partial(_apply_to_chunk, function), chunks):
+            self.record_latency(elapsed, len(chunk_results))
+            results.extend(chunk_results)
+
+        return results
+
+    def get_chunk_size(self, number_of_items: int) -> int:
+        """ Chunk size for a number of items, adapted to the latency measured so far. """
+        if self.chunk_size is not None:
+            return self.chunk_size
+
+        balanced = max(1, -(-number_of_items // (4 * self.processes)))
+        if not self.latency:
+            return balanced
+
+        return max(1, min(balanced, int(self.target_chunk_time / self.latency)))
+
+    def record_latency(self, elapsed: float, count: int) -> None:
+        """ Updates the moving average of the seconds per item with a chunk of `count` items. """
+        if count > 0:
+            latency = elapsed / count
+            self.latency = latency if self.latency is None else 0.8 * self.latency + 0.2 * latency
+
+    @abstractmethod
+    def _map_chunks(self, function: Callable, chunks: List[list]) -> Iterable:
+        """ Applies a function to every chunk in the workers, yielding the results in order. """
+        pass
+
+    def close(self) -> None:
+        """ Releases the workers. """
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+class MapEvaluator(PoolEvaluator[S]):
+    """ Evaluator running the solutions in a pool of threads. It scales with objectives releasing the GIL (e.g., NumPy
+    or external simulators). At most `max_in_flight` chunks are submitted at the same time. """
+
+    def __init__(self, processes: int = None, chunk_size: int = None, max_in_flight: int = None,
+                 target_chunk_time: float = 0.05):
+        super(MapEvaluator, self).__init__(processes, chunk_size, target_chunk_time)
+        self.max_in_flight = max_in_flight if max_in_flight is not None else 2 * self.processes
+        self.pool = ThreadPoolExecutor(self.processes)
 
+    def _map_chunks(self, function: Callable, chunks: List[list]) -> Iterable:
+        return bounded_map(self.pool, function, chunks, self.max_in_flight)
 
-class MultiprocessEvaluator(Evaluator[S]):
-    def __init__(self, processes: int = None):
-        super().__init__()
-        self.pool = Pool(processes)
+    def close(self) -> None:
+        self.pool.shutdown(wait=True)
+
+
+class MultiprocessEvaluator(PoolEvaluator[S]):
+    """ Evaluator running a pool of persistent worker processes initialised once with the problem.
+
+    The variables of float and integer solutions (and of a :class:`Population`) are shipped to the workers through a
+    shared memory matrix, and the workers write the objectives and constraints back in place into shared matrices,
+    so neither the problem nor the solutions are pickled at each call. Every task evaluates a chunk of consecutive
+    rows, calling `problem.evaluate_batch` if the problem supports it. Other solutions (e.g., binary or permutation
+    ones) are sent to the workers in chunks. The workers are started again when the problem changes. At most
+    `max_in_flight` chunks are submitted at the same time. The workers and the shared memory are released by
+    :meth:`close`, or when the evaluator is garbage collected or the interpreter exits.
+    """
+
+    def __init__(self, processes: int = None, chunk_size: int = None, max_in_flight: int = None,
+                 target_chunk_time: float = 0.05):
+        super(MultiprocessEvaluator, self).__init__(processes, chunk_size, target_chunk_time)
+        self.max_in_flight = max_in_flight if max_in_flight is not None else 2 * self.processes
+
+        self.pool = None
+        self.problem = None
+        self.blocks = {}
+
+        self._pool_finalizer = None
+        weakref.finalize(self, _release_blocks, self.blocks)
 
     def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        return self.pool.map(functools.partial(evaluate_solution, problem=problem), solution_list)
+        if len(solution_list) == 0:
+            return solution_list
+
+        if self.pool is None or problem is not self.problem or \
+                (isinstance(problem, DynamicProblem) and problem.the_problem_has_changed()):
+            self._start(problem)
 
+        if isinstance(solution_list, Population) or all(
+                isinstance(solution, (FloatSolution, IntegerSolution)) for solution in solution_list):
+            self._evaluate_shared(solution_list, problem)
+            return solution_list
 
-class SparkEvaluator(Evaluator[S]):
-    def __init__(self, processes: int = 8):
+        evaluated_solutions = self.map_chunked(_evaluate_in_worker, solution_list)
+
+        return write_back(solution_list, evaluated_solutions)
+
+    def _map_chunks(self, function: Callable, chunks: List[list]) -> Iterable:
+        if self.pool is None:
+            self._start(None)
+
+        return bounded_map(self.pool, function, chunks, self.max_in_flight)
+
+    def close(self) -> None:
+        """ Stops the workers and releases the shared memory. """
+        if self.pool is not None:
+            self._pool_finalizer()
+            self.pool = None
+            self.problem = None
+
+        _release_blocks(self.blocks)
+
+    def _start(self, problem: Problem) -> None:
+        if self.pool is not None:
+            self._pool_finalizer()
+
+        # The workers must share the resource tracker of this process, so that the shared memory blocks they attach to
+        # are not unlinked when they exit
+        resource_tracker.ensure_running()
+        self.pool = ProcessPoolExecutor(self.processes, initializer=_initialize_worker, initargs=(problem,))
+        self.problem = problem
+        self._pool_finalizer = weakref.finalize(self, self.pool.shutdown, wait=True)
+
+    def _shared_matrix(self, role: str, shape: tuple) -> tuple:
+        """ Returns a matrix backed by the shared memory block of a role, allocating a larger block if needed, and
+        the (name, shape) specification the workers use to attach to it. """
+        size = max(1, int(np.prod(shape)) * np.dtype(float).itemsize)
+        block = self.blocks.get(role)
+        if block is None or block.size < size:
+            if block is not None:
+                block.close()
+                block.unlink()
+            block = self.blocks[role] = SharedMemory(create=True, size=size)
+
+        return np.ndarray(shape, dtype=float, buffer=block.buf), (block.name, shape)
+
+    def _evaluate_shared(self, solution_list: List[S], problem: Problem) -> None:
+        number_of_solutions = len(solution_list)
+        chunk_size = self.get_chunk_size(number_of_solutions)
+        if isinstance(solution_list, Population):
+            template = None
+            number_of_objectives = solution_list.number_of_objectives
+            number_of_constraints = solution_list.number_of_constraints
+        else:
+            template = copy.copy(solution_list[0])
+            number_of_objectives = len(template.objectives)
+            number_of_constraints = len(template.constraints)
+
+        variables, variables_spec = self._shared_matrix(
+            'variables', (number_of_solutions, len(solution_list[0].variables)))
+        objectives, objectives_spec = self._shared_matrix('objectives', (number_of_solutions, number_of_objectives))
+        constraints, constraints_spec = self._shared_matrix(
+            'constraints', (number_of_solutions, number_of_constraints))
+
+        if isinstance(solution_list, Population):
+            variables[:] = solution_list.variables
+        else:
+            variables[:] = [solution.variables for solution in solution_list]
+
+        batch = problem.supports_batch_evaluation()
+        tasks = [(variables_spec, objectives_spec, constraints_spec, start,
+                  min(start + chunk_size, number_of_solutions), batch, template)
+                 for start in range(0, number_of_solutions, chunk_size)]
+        for task, elapsed in zip(tasks, bounded_map(self.pool, _evaluate_chunk, tasks, self.max_in_flight)):
+            self.record_latency(elapsed, task[4] - task[3])
+
+        if isinstance(solution_list, Population):
+            solution_list.objectives[:] = objectives
+            solution_list.constraints[:] = constraints
+        else:
+            for solution, objective_values, constraint_values in zip(solution_list, objectives.tolist(),
+                                                                      constraints.tolist()):
+                solution.objectives = objective_values
+                if number_of_constraints > 0:
+                    solution.constraints = constraint_values
+
+
+class SparkEvaluator(PoolEvaluator[S]):
+    """ Evaluator running the solutions in a local spark context, every chunk being a partition. """
+
+    def __init__(self, processes: int = 8, chunk_size: int = None, target_chunk_time: float = 0.05):
+        super(SparkEvaluator, self).__init__(processes, chunk_size, target_chunk_time)
         self.spark_conf = SparkConf().setAppName("jmetalpy").setMaster(f"local[{processes}]")
         self.spark_context = SparkContext(conf=self.spark_conf)
 
         logger = self.spark_context._jvm.org.apache.log4j
         logger.LogManager.getLogger("org").setLevel(logger.Level.WARN)
 
-    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
-        solutions_to_evaluate = self.spark_context.parallelize(solution_list)
+    def _map_chunks(self, function: Callable, chunks: List[list]) -> Iterable:
+        return self.spark_context.parallelize(chunks, len(chunks)).map(function).collect()
 
-        return solutions_to_evaluate \
-            .map(lambda s: problem.evaluate(s)) \
-            .collect()
+    def close(self) -> None:
+        self.spark_context.stop()
 
 
 def evaluate_solution(solution, problem):
@@ -79,12 +306,317 @@ def evaluate_solution(solution, problem):
     return solution
 
 
-class DaskEvaluator(Evaluator[S]):
-    def __init__(self, scheduler='processes'):
+def bounded_map(executor: Executor, function: Callable, items: List, max_in_flight: int) -> Iterable:
+    """ Applies a function to the items in an executor, yielding the results in order, with at most `max_in_flight`
+    items submitted and not yet consumed at any time. """
+    futures = deque()
+    for item in items:
+        if len(futures) >= max_in_flight:
+            yield futures.popleft().result()
+        futures.append(executor.submit(function, item))
+
+    while futures:
+        yield futures.popleft().result()
+
+
+def _apply_to_chunk(function: Callable, chunk: list) -> tuple:
+    """ Applies a function to the items of a chunk, returning the results and the elapsed time. """
+    start = time.perf_counter()
+    results = [function(item) for item in chunk]
+
+    return results, time.perf_counter() - start
+
+
+# Problem and shared memory blocks attached by a worker process of a MultiprocessEvaluator
+_worker_problem = None
+_worker_blocks = {}
+
+
+def _initialize_worker(problem: Problem) -> None:
+    global _worker_problem
+    _worker_problem = problem
+
+
+def _release_blocks(blocks: dict) -> None:
+    """ Closes and unlinks the shared memory blocks of a :class:`MultiprocessEvaluator`, emptying the dictionary. """
+    for block in blocks.values():
+        block.close()
+        block.unlink()
+    blocks.clear()
+
+
+def _attach(specs) -> List[np.ndarray]:
+    """ Returns the matrices of the (name, shape) specifications, keeping the blocks attached between tasks. """
+    names = [name for name, _ in specs]
+    for name in list(_worker_blocks):
+        if name not in names:
+            _worker_blocks.pop(name).close()
+
+    for name in names:
+        if name not in _worker_blocks:
+            _worker_blocks[name] = SharedMemory(name)
+
+    return [np.ndarray(shape, dtype=float, buffer=_worker_blocks[name].buf) for name, shape in specs]
+
+
+def _evaluate_chunk(task) -> float:
+    """ Evaluates the rows [start, stop) of the shared variables, writing the objectives and constraints in place.
+
+    :return: Elapsed time. """
+    variables_spec, objectives_spec, constraints_spec, start, stop, batch, template = task
+    variables, objectives, constraints = _attach((variables_spec, objectives_spec, constraints_spec))
+    started = time.perf_counter()
+
+    if batch:
+        objective_values, constraint_values = _worker_problem.evaluate_batch(variables[start:stop])
+        objectives[start:stop] = objective_values
+        if constraint_values is not None:
+            constraints[start:stop] = constraint_values
+        return time.perf_counter() - started
+
+    if template is None:
+        template = _worker_problem.create_solution()
+    integer = isinstance(template, IntegerSolution)
+
+    for index in range(start, stop):
+        solution = copy.copy(template)
+        solution.variables = (variables[index].astype(int) if integer else variables[index]).tolist()
+        _worker_problem.evaluate(solution)
+
+        objectives[index] = solution.objectives
+        if constraints.shape[1] > 0:
+            constraints[index] = solution.constraints
+
+    return time.perf_counter() - started
+
+
+def _evaluate_in_worker(solution):
+    return evaluate_solution(solution, _worker_problem)
+
+
+def write_back(solution_list: List[S], evaluated_solutions: List[S]) -> List[S]:
+    """ Copies solutions evaluated in other processes back into a :class:`Population`. Plain lists are returned
+    unchanged, as they are simply replaced by the evaluated copies. """
+    if isinstance(solution_list, Population):
+        for index, solution in enumerate(evaluated_solutions):
+            solution_list[index] = solution
+        return solution_list
+
+    return evaluated_solutions
+
+
+class DaskEvaluator(PoolEvaluator[S]):
+    """ Evaluator running the solutions with a dask scheduler, every chunk being a task. """
+
+    def __init__(self, scheduler='processes', processes: int = None, chunk_size: int = None,
+                 target_chunk_time: float = 0.05):
+        super(DaskEvaluator, self).__init__(processes, chunk_size, target_chunk_time)
         self.scheduler = scheduler
 
-    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+    def _map_chunks(self, function: Callable, chunks: List[list]) -> Iterable:
         with dask.config.set(scheduler=self.scheduler):
-            return list(dask.compute(*[
-                dask.delayed(evaluate_solution)(solution=solution, problem=problem) for solution in solution_list
-            ]))
+            return dask.compute(*[dask.delayed(function)(chunk) for chunk in chunks])
+
+
+class CachingEvaluator(Evaluator[S]):
+    """ Evaluator wrapping another one and remembering the objectives and constraints of the variables already
+    evaluated, so that duplicated solutions (e.g., copies of the parents when crossover is skipped, or the population
+    re-evaluated after a restart) are not evaluated again.
+
+    The variables are hashed after rounding the floats to `decimals` decimals, together with the identity of the
+    problem: its name, its numbers of variables, objectives and constraints, and a digest of the state of the instance
+    when this evaluator first sees it (or the given `problem_key`), so that two instances of a problem with different
+    parameters do not share entries. The most recently used entries are kept
+    in memory, up to `max_size`, and all of them are stored in a SQLite database if a `database` file is given, so that
+    they survive the runs. Solutions repeated in the same list are evaluated once. The attributes set by the problem
+    are not cached. The entries are discarded when a :class:`DynamicProblem` has changed.
+    """
+
+    def __init__(self, evaluator: Evaluator[S] = None, max_size: int = 100000, decimals: int = 12,
+                 database: str = None, problem_key: str = None):
+        """
+        :param evaluator: Evaluator of the solutions not in the cache (sequential by default).
+        :param max_size: Number of entries kept in memory.
+        :param decimals: Number of decimals the float variables are rounded to.
+        :param database: Path of a SQLite database storing the entries on disk (not used by default).
+        :param problem_key: Identity of the parameters of the problem, replacing the digest of its state (e.g., for
+            problems which cannot be pickled).
+        """
+        self.evaluator = evaluator if evaluator is not None else SequentialEvaluator()
+        self.max_size = max_size
+        self.decimals = decimals
+        self.problem_key = problem_key
+        self.problem_keys = weakref.WeakKeyDictionary()
+
+        self.memory = OrderedDict()
+        self.connection = None
+        if database is not None:
+            self.connection = sqlite3.connect(database)
+            self.connection.execute('CREATE TABLE IF NOT EXISTS evaluations (problem TEXT, key BLOB, '
+                                    'objectives TEXT, constraints TEXT, PRIMARY KEY (problem, key))')
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """ Fraction of the solutions whose evaluation was avoided (0 if no solution was evaluated yet). """
+        requests = self.hits + self.misses
+        return self.hits / requests if requests > 0 else 0.0
+
+    def evaluate(self, solution_list: List[S], problem: Problem) -> List[S]:
+        if isinstance(problem, DynamicProblem) and problem.the_problem_has_changed():
+            self.clear(problem)
+
+        if isinstance(solution_list, Population):
+            keys = [self.get_key(variables, problem) for variables in solution_list.variables.tolist()]
+        else:
+            keys = [self.get_key(solution.variables, problem) for solution in solution_list]
+
+        # Entries of the cached keys, and index of the first solution with every key not in the cache
+        cached = {}
+        missing = OrderedDict()
+        for index, key in enumerate(keys):
+            if key not in cached and key not in missing:
+                entry = self._lookup(key, problem)
+                if entry is None:
+                    missing[key] = index
+                else:
+                    cached[key] = entry
+
+        self.misses += len(missing)
+        self.hits += len(keys) - len(missing)
+
+        if isinstance(solution_list, Population):
+            if len(missing) > 0:
+                indices = list(missing.values())
+                evaluated = self.evaluator.evaluate(solution_list.take(indices), problem)
+                solution_list.objectives[indices] = evaluated.objectives
+                solution_list.constraints[indices] = evaluated.constraints
+                cached.update(self._store([(key, solution_list[index]) for key, index in missing.items()], problem))
+
+            for index, key in enumerate(keys):
+                if missing.get(key) != index:
+                    solution_list.objectives[index], solution_list.constraints[index] = cached[key]
+
+            return solution_list
+
+        solution_list = list(solution_list)
+        if len(missing) > 0:
+            evaluated = self.evaluator.evaluate([solution_list[index] for index in missing.values()], problem)
+            for index, solution in zip(missing.values(), evaluated):
+                solution_list[index] = solution
+            cached.update(self._store([(key, solution_list[index]) for key, index in missing.items()], problem))
+
+        for index, key in enumerate(keys):
+            if missing.get(key) != index:
+                objectives, constraints = cached[key]
+                solution_list[index].objectives = list(objectives)
+                solution_list[index].constraints = list(constraints)
+
+        return solution_list
+
+    def get_key(self, variables, problem: Problem) -> bytes:
+        """ Hash of the variables of a solution of a problem, the floats being rounded. """
+        return hashlib.blake2b(repr((self.get_problem_key(problem), self._normalize(variables))).encode(),
+                               digest_size=16).digest()
+
+    def get_problem_key(self, problem: Problem) -> str:
+        """ Identity of a problem in the cache. The state of the problem is digested the first time it is seen, so
+        that attributes changing during the run (e.g., counters of evaluations) do not change its identity. """
+        problem_key = self.problem_keys.get(problem)
+        if problem_key is None:
+            state = self.problem_key
+            if state is None:
+                try:
+                    state = hashlib.blake2b(pickle.dumps(vars(problem), protocol=4), digest_size=16).hexdigest()
+                except Exception as exception:
+                    raise Exception('The state of the problem cannot be pickled, a problem_key must be given: '
+                                    + str(exception))
+
+            problem_key = '{}/{}/{}/{}/{}'.format(problem.get_name(), problem.number_of_variables,
+                                                  problem.number_of_objectives, problem.number_of_constraints, state)
+            self.problem_keys[problem] = problem_key
+
+        return problem_key
+
+    def clear(self, problem: Problem = None) -> None:
+        """ Discards the entries in memory and, if a problem is given, those of the problem in the database. """
+        self.memory.clear()
+
+        if self.connection is not None and problem is not None:
+            self.connection.execute('DELETE FROM evaluations WHERE problem = ?', (self.get_problem_key(problem),))
+            self.connection.commit()
+
+    def close(self) -> None:
+        """ Closes the database and the wrapped evaluator. """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+        if hasattr(self.evaluator, 'close'):
+            self.evaluator.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _normalize(self, variables):
+        if isinstance(variables, (list, tuple, np.ndarray)):
+            return tuple(self._normalize(value) for value in variables)
+        if isinstance(variables, Solution):
+            return self._normalize(variables.variables)
+        if isinstance(variables, np.generic):
+            variables = variables.item()
+        if isinstance(variables, float):
+            # Adding 0.0 turns -0.0 into 0.0
+            return round(variables, self.decimals) + 0.0
+
+        return variables
+
+    def _lookup(self, key: bytes, problem: Problem):
+        """ Returns the objectives and constraints of a key (None if it is not cached), loading them from the
+        database into memory if needed. """
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            return entry
+
+        if self.connection is not None:
+            row = self.connection.execute(
+                'SELECT objectives, constraints FROM evaluations WHERE problem = ? AND key = ?',
+                (self.get_problem_key(problem), key)).fetchone()
+            if row is not None:
+                self.disk_hits += 1
+                entry = (json.loads(row[0]), json.loads(row[1]))
+                self._remember(key, entry)
+
+        return entry
+
+    def _store(self, evaluated: List[tuple], problem: Problem) -> dict:
+        """ Caches the objectives and constraints of a list of (key, solution) pairs.
+
+        :return: The new entries. """
+        entries = [(key, ([float(value) for value in solution.objectives],
+                          [float(value) for value in solution.constraints])) for key, solution in evaluated]
+
+        for key, entry in entries:
+            self._remember(key, entry)
+
+        if self.connection is not None:
+            self.connection.executemany('INSERT OR REPLACE INTO evaluations VALUES (?, ?, ?, ?)', [
+                (self.get_problem_key(problem), key, json.dumps(objectives), json.dumps(constraints))
+                for key, (objectives, constraints) in entries
+            ])
+            self.connection.commit()
+
+        return dict(entries)
+
+    def _remember(self, key: bytes, entry: tuple) -> None:
+        self.memory[key] = entry
+        self.memory.move_to_end(key)
+        if len(self.memory) > self.max_size:
+            self.memory.popitem(last=False)
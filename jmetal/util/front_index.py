@@ -0,0 +1,407 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from operator import le
+from typing import List
+
+import numpy as np
+
+"""
+.. module:: front_index
+   :platform: Unix, Windows
+   :synopsis: Spatial indexes of sets of mutually non-dominated points.
+
+Minimization is assumed. Every point is stored together with an item (e.g., the solution it belongs to), which is
+identified by identity. Two objectives are handled with a skyline sorted by the first objective, and any other number of
+objectives with an ND-tree (Jaszkiewicz and Lust, 2018), so that dominance queries and updates usually visit only a
+small part of the set.
+"""
+
+
+class FrontIndex(ABC):
+
+    @abstractmethod
+    def update(self, point, item) -> list:
+        """ Inserts a point unless it is weakly dominated by (i.e., dominated by or equal to) a stored point, removing
+        the stored points it dominates.
+
+        :return: None if the point was not inserted, the list of removed items otherwise.
+        """
+        pass
+
+    @abstractmethod
+    def is_weakly_dominated(self, point) -> bool:
+        pass
+
+    @abstractmethod
+    def remove(self, item) -> bool:
+        pass
+
+    @abstractmethod
+    def items(self) -> list:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+
+def non_dominated_indices(points) -> np.ndarray:
+    """ Computes the non-dominated rows of a matrix at once, keeping only the first one of repeated rows.
+
+    :param points: (N, m) matrix of objective values.
+    :return: Increasing array with the indices of the non-dominated rows.
+    """
+    points = np.asarray(points, dtype=float)
+    number_of_points, number_of_objectives = points.shape
+    if number_of_points == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    # In lexicographic order (stable, so repeated rows keep their order) a row can only be weakly dominated by the
+    # preceding ones
+    order = np.lexsort(points.T[::-1])
+    points = points[order]
+
+    if number_of_objectives == 1:
+        return order[:1]
+
+    if number_of_objectives == 2:
+        lowest = np.minimum.accumulate(points[:, 1])
+        return np.sort(order[np.concatenate(([True], points[1:, 1] < lowest[:-1]))])
+
+    front = np.empty((0, number_of_objectives))
+    front_rows = []
+    block_size = 512
+    for start in range(0, number_of_points, block_size):
+        block = points[start:start + block_size]
+
+        is_dominated = np.zeros(len(block), dtype=bool)
+        chunk_size = max(1, 2 ** 22 // len(block))
+        for chunk_start in range(0, len(front), chunk_size):
+            is_dominated |= _weak_dominance_matrix(front[chunk_start:chunk_start + chunk_size], block).any(axis=0)
+
+        candidates = np.flatnonzero(~is_dominated)
+        block = block[candidates]
+        weakly_dominated = np.triu(_weak_dominance_matrix(block, block), k=1)
+        survivors = candidates[~weakly_dominated.any(axis=0)]
+
+        front = np.concatenate((front, points[start + survivors]))
+        front_rows.append(start + survivors)
+
+    return np.sort(order[np.concatenate(front_rows)])
+
+
+def _weak_dominance_matrix(points1: np.ndarray, points2: np.ndarray) -> np.ndarray:
+    """ Tells whether each row of the first matrix weakly dominates each row of the second one. The objectives are
+    compared one at a time, which is faster than reducing a three-dimensional array. """
+    result = points1[:, 0, None] <= points2[None, :, 0]
+    for k in range(1, points1.shape[1]):
+        result &= points1[:, k, None] <= points2[None, :, k]
+
+    return result
+
+
+def create_front_index(number_of_objectives: int) -> FrontIndex:
+    if number_of_objectives == 2:
+        return TwoObjectiveFrontIndex()
+
+    return NDTreeFrontIndex(number_of_objectives)
+
+
+class TwoObjectiveFrontIndex(FrontIndex):
+    """ The points are sorted by increasing first objective, so their second objectives are decreasing. A point is
+    weakly dominated if its predecessor by the first objective is not worse in the second one, and it dominates the
+    contiguous run of points which follows it with worse second objectives. """
+
+    def __init__(self):
+        self.xs: List[float] = []
+        self.ys: List[float] = []
+        self.stored_items = []
+        self.points = {}
+
+    def update(self, point, item) -> list:
+        x, y = float(point[0]), float(point[1])
+        if self.__is_weakly_dominated(x, y):
+            return None
+
+        start = bisect_left(self.xs, x)
+        end = start
+        while end < len(self.ys) and self.ys[end] >= y:
+            end += 1
+
+        removed_items = self.stored_items[start:end]
+        self.xs[start:end] = [x]
+        self.ys[start:end] = [y]
+        self.stored_items[start:end] = [item]
+
+        for removed_item in removed_items:
+            del self.points[id(removed_item)]
+        self.points[id(item)] = (x, y)
+
+        return removed_items
+
+    def is_weakly_dominated(self, point) -> bool:
+        return self.__is_weakly_dominated(float(point[0]), float(point[1]))
+
+    def remove(self, item) -> bool:
+        point = self.points.pop(id(item), None)
+        if point is None:
+            return False
+
+        # The first objectives of the stored points are unique
+        index = bisect_left(self.xs, point[0])
+        del self.xs[index]
+        del self.ys[index]
+        del self.stored_items[index]
+
+        return True
+
+    def items(self) -> list:
+        return list(self.stored_items)
+
+    def __is_weakly_dominated(self, x: float, y: float) -> bool:
+        predecessor = bisect_right(self.xs, x) - 1
+
+        return predecessor >= 0 and self.ys[predecessor] <= y
+
+    def __len__(self) -> int:
+        return len(self.stored_items)
+
+
+class _Node:
+
+    __slots__ = ['ideal', 'nadir', 'points', 'items', 'children', 'size']
+
+    def __init__(self, points: np.ndarray, items: list):
+        self.points = points
+        self.items = items
+        self.children: List[_Node] = None
+        self.size = len(items)
+        self.update_bounds()
+
+    def update_bounds(self) -> None:
+        self.ideal = self.points.min(axis=0).tolist()
+        self.nadir = self.points.max(axis=0).tolist()
+
+    def is_leaf(self) -> bool:
+        return self.children is None
+
+    def is_empty(self) -> bool:
+        return self.size == 0
+
+
+def _weakly_dominates(vector1, vector2) -> bool:
+    return all(map(le, vector1, vector2))
+
+
+class NDTreeFrontIndex(FrontIndex):
+    """ ND-tree: every node keeps an approximation of the ideal and nadir points of its subtree (the bounds are
+    enlarged on insertion and kept on removal), so a subtree can be skipped when the point neither dominates its nadir
+    nor is dominated by its ideal. Leaves hold up to `MAX_LEAF_SIZE` points; a full leaf is split into
+    `number_of_objectives + 1` children around points far from each other. As the bounds are not tightened on removal,
+    a subtree left with half a leaf of points is merged back into a leaf.
+
+    The bounds are compared as lists, which is faster than NumPy for a few values; the points of the leaves are
+    matrices. """
+
+    # Larger than the 20 points suggested by the authors, as checking a leaf with NumPy costs about as much as visiting
+    # a node in Python
+    MAX_LEAF_SIZE = 64
+
+    def __init__(self, number_of_objectives: int):
+        self.number_of_objectives = number_of_objectives
+        self.number_of_children = number_of_objectives + 1
+        self.root: _Node = None
+        self.points = {}
+        self.size = 0
+
+    def update(self, point, item) -> list:
+        point = [float(value) for value in point]
+        array = np.array(point)
+        removed_items = []
+
+        if self.root is not None:
+            if not self.__update_node(self.root, point, array, removed_items):
+                return None
+            if self.root.is_empty():
+                self.root = None
+
+        for removed_item in removed_items:
+            del self.points[id(removed_item)]
+        self.size -= len(removed_items)
+
+        self.__insert(point, array, item)
+        self.points[id(item)] = point
+        self.size += 1
+
+        return removed_items
+
+    def is_weakly_dominated(self, point) -> bool:
+        point = [float(value) for value in point]
+
+        return self.root is not None and self.__is_weakly_dominated(self.root, point, np.array(point))
+
+    def remove(self, item) -> bool:
+        point = self.points.get(id(item))
+        if point is None or not self.__remove_from_node(self.root, point, item):
+            return False
+
+        if self.root.is_empty():
+            self.root = None
+        del self.points[id(item)]
+        self.size -= 1
+
+        return True
+
+    def items(self) -> list:
+        items = []
+        if self.root is not None:
+            self.__collect_items(self.root, items)
+
+        return items
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __update_node(self, node: _Node, point: list, array: np.ndarray, removed_items: list) -> bool:
+        """ Removes the points of the subtree dominated by the new point; returns False if the new point is weakly
+        dominated, in which case nothing is removed as the stored points are mutually non-dominated. """
+        if _weakly_dominates(node.nadir, point):
+            return False
+
+        # A point equal to the ideal one may be equal to a stored point, so it is handled as a general one
+        if _weakly_dominates(point, node.ideal) and point != node.ideal:
+            self.__collect_items(node, removed_items)
+            node.points = np.empty((0, self.number_of_objectives))
+            node.items = []
+            node.children = None
+            node.size = 0
+            return True
+
+        if not (_weakly_dominates(node.ideal, point) or _weakly_dominates(point, node.nadir)):
+            return True
+
+        if node.is_leaf():
+            if (node.points <= array).all(axis=1).any():
+                return False
+
+            dominated = (array <= node.points).all(axis=1)
+            if dominated.any():
+                removed_items.extend(item for item, is_dominated in zip(node.items, dominated.tolist()) if is_dominated)
+                node.items = [item for item, is_dominated in zip(node.items, dominated.tolist()) if not is_dominated]
+                node.points = node.points[~dominated]
+                node.size = len(node.items)
+            return True
+
+        for child in node.children:
+            if not self.__update_node(child, point, array, removed_items):
+                return False
+        self.__prune(node)
+
+        return True
+
+    def __is_weakly_dominated(self, node: _Node, point: list, array: np.ndarray) -> bool:
+        if _weakly_dominates(node.nadir, point):
+            return True
+        if not _weakly_dominates(node.ideal, point):
+            return False
+        if node.is_leaf():
+            return bool((node.points <= array).all(axis=1).any())
+
+        return any(self.__is_weakly_dominated(child, point, array) for child in node.children)
+
+    def __insert(self, point: list, array: np.ndarray, item) -> None:
+        if self.root is None:
+            self.root = _Node(array[None, :], [item])
+            return
+
+        node = self.root
+        while True:
+            node.size += 1
+            node.ideal = list(map(min, node.ideal, point))
+            node.nadir = list(map(max, node.nadir, point))
+            if node.is_leaf():
+                break
+
+            # Child with the closest center
+            node = min(node.children, key=lambda child: sum(
+                ((lower + upper) / 2.0 - value) ** 2 for lower, upper, value in zip(child.ideal, child.nadir, point)))
+
+        node.points = np.concatenate((node.points, array[None, :]))
+        node.items.append(item)
+
+        if len(node.items) > self.MAX_LEAF_SIZE:
+            self.__split(node)
+
+    def __split(self, node: _Node) -> None:
+        points = node.points
+        distances = np.sqrt(np.sum((points[:, None, :] - points[None, :, :]) ** 2, axis=2))
+
+        # Seeds: the point farthest (on average) from the others, then the points farthest from the chosen seeds
+        seeds = [int(np.argmax(distances.mean(axis=1)))]
+        while len(seeds) < self.number_of_children:
+            average_distances = distances[:, seeds].mean(axis=1)
+            average_distances[seeds] = -1.0
+            seeds.append(int(np.argmax(average_distances)))
+
+        groups = np.argmin(distances[:, seeds], axis=1)
+        groups[seeds] = np.arange(len(seeds))
+
+        node.children = []
+        for group in range(len(seeds)):
+            members = np.flatnonzero(groups == group)
+            node.children.append(_Node(points[members], [node.items[i] for i in members.tolist()]))
+        node.points = None
+        node.items = None
+
+    def __remove_from_node(self, node: _Node, point: list, item) -> bool:
+        if not (_weakly_dominates(node.ideal, point) and _weakly_dominates(point, node.nadir)):
+            return False
+
+        if node.is_leaf():
+            for index, stored_item in enumerate(node.items):
+                if stored_item is item:
+                    del node.items[index]
+                    node.points = np.delete(node.points, index, axis=0)
+                    node.size -= 1
+                    return True
+            return False
+
+        for child in node.children:
+            if self.__remove_from_node(child, point, item):
+                self.__prune(node)
+                return True
+
+        return False
+
+    def __prune(self, node: _Node) -> None:
+        """ Removes the empty children of a node, which becomes a leaf if it is left with few points, or takes the
+        place of its child if only one is left. """
+        node.children = [child for child in node.children if not child.is_empty()]
+        node.size = sum(child.size for child in node.children)
+
+        if node.size <= self.MAX_LEAF_SIZE // 2:
+            leaves = []
+            self.__collect_leaves(node, leaves)
+            node.points = np.concatenate([leaf.points for leaf in leaves] + [np.empty((0, self.number_of_objectives))])
+            node.items = [item for leaf in leaves for item in leaf.items]
+            node.children = None
+            if node.size > 0:
+                node.update_bounds()
+        elif len(node.children) == 1:
+            child = node.children[0]
+            node.points, node.items, node.children = child.points, child.items, child.children
+            node.ideal, node.nadir = child.ideal, child.nadir
+
+    def __collect_leaves(self, node: _Node, leaves: list) -> None:
+        if node.is_leaf():
+            leaves.append(node)
+        else:
+            for child in node.children:
+                self.__collect_leaves(child, leaves)
+
+    def __collect_items(self, node: _Node, items: list) -> None:
+        if node.is_leaf():
+            items.extend(node.items)
+        else:
+            for child in node.children:
+                self.__collect_items(child, items)
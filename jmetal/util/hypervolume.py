@@ -0,0 +1,248 @@
+from bisect import bisect_left, bisect_right
+
+import numpy as np
+
+"""
+.. module:: hypervolume
+   :platform: Unix, Windows
+   :synopsis: Hypervolume algorithms working on objective matrices.
+
+Minimization is assumed. Only the points strictly dominating the reference point contribute to the hypervolume. The
+exact value is computed with O(N log N) sweeps for two and three objectives and with the WFG algorithm (While, Bradstreet
+and Barone, 2012) for more objectives; a Monte Carlo estimator with its standard error is given for many objectives.
+"""
+
+ALGORITHMS = ('auto', 'exact', 'monte-carlo')
+
+# Number of objectives above which the 'auto' algorithm estimates the hypervolume with Monte Carlo sampling
+MONTE_CARLO_OBJECTIVES = 8
+
+MONTE_CARLO_SAMPLES = 100000
+
+
+def hypervolume(points, reference_point, algorithm: str = 'auto', samples: int = MONTE_CARLO_SAMPLES,
+                seed: int = None) -> float:
+    """ Computes the hypervolume dominated by a set of points.
+
+    :param points: (N, m) matrix of objective values.
+    :param reference_point: Reference point (m values).
+    :param algorithm: 'exact', 'monte-carlo', or 'auto' (Monte Carlo sampling only for more than
+        `MONTE_CARLO_OBJECTIVES` objectives).
+    :param samples: Number of samples of the Monte Carlo estimator.
+    :param seed: Seed of the Monte Carlo estimator (optional).
+    :return: The hypervolume.
+    """
+    if algorithm not in ALGORITHMS:
+        raise Exception('Unknown hypervolume algorithm: {}'.format(algorithm))
+
+    points, reference_point = _relevant_points(points, reference_point)
+    number_of_objectives = len(reference_point)
+
+    if algorithm == 'monte-carlo' or (algorithm == 'auto' and number_of_objectives > MONTE_CARLO_OBJECTIVES):
+        return monte_carlo_hypervolume(points, reference_point, samples, seed)[0]
+
+    return _exact_hypervolume(points, reference_point)
+
+
+def monte_carlo_hypervolume(points, reference_point, samples: int = MONTE_CARLO_SAMPLES, seed: int = None) -> tuple:
+    """ Estimates the hypervolume by sampling uniformly the box between the ideal and the reference points.
+
+    :return: Tuple with the estimated hypervolume and its standard error.
+    """
+    points, reference_point = _relevant_points(points, reference_point)
+    if len(points) == 0:
+        return 0.0, 0.0
+
+    points = non_dominated_points(points)
+    lower_bound = points.min(axis=0)
+    box_volume = float(np.prod(reference_point - lower_bound))
+
+    random = np.random.default_rng(seed)
+    batch_size = max(1, 2 ** 22 // (len(points) * len(reference_point)))
+    dominated = 0
+    for start in range(0, samples, batch_size):
+        batch = random.uniform(lower_bound, reference_point, (min(batch_size, samples - start), len(reference_point)))
+        dominated += int(np.count_nonzero(_is_dominated_by_any(batch, points)))
+
+    ratio = dominated / samples
+
+    return box_volume * ratio, box_volume * np.sqrt(ratio * (1.0 - ratio) / samples)
+
+
+def hypervolume_contributions(points, reference_point) -> np.ndarray:
+    """ Computes the exclusive hypervolume contribution of every point, i.e., the hypervolume lost if it is removed.
+    Dominated and repeated points contribute 0.
+
+    :param points: (N, m) matrix of objective values.
+    :param reference_point: Reference point (m values).
+    :return: Array with the contribution of each point.
+    """
+    points = np.asarray(points, dtype=float)
+    reference_point = np.asarray(reference_point, dtype=float)
+    contributions = np.zeros(len(points))
+    if len(points) == 0:
+        return contributions
+
+    relevant = np.flatnonzero(np.all(points < reference_point, axis=1))
+    unique_points, inverse, counts = np.unique(points[relevant], axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+
+    is_dominated = _is_dominated(unique_points)
+    front, dominated_points = unique_points[~is_dominated], unique_points[is_dominated]
+
+    # Removing a point of the front exposes the dominated points not dominated by any other point of the front
+    dominators = np.all(front[:, None, :] <= dominated_points[None, :, :], axis=2)
+    exposed = dominators & (np.count_nonzero(dominators, axis=0) == 1)
+
+    if len(reference_point) == 2 and not exposed.any():
+        front_contributions = _two_objective_contributions(front, reference_point)
+    else:
+        volumes = np.prod(reference_point - front, axis=1)
+        front_contributions = np.empty(len(front))
+        for i in range(len(front)):
+            limit_set = np.concatenate((np.maximum(np.delete(front, i, axis=0), front[i]), dominated_points[exposed[i]]))
+            front_contributions[i] = volumes[i] - _exact_hypervolume(limit_set, reference_point)
+
+    # Repeated points contribute 0, as every copy is covered by the other ones
+    unique_contributions = np.zeros(len(unique_points))
+    unique_contributions[~is_dominated] = front_contributions
+    unique_contributions[counts > 1] = 0.0
+    contributions[relevant] = unique_contributions[inverse]
+
+    return contributions
+
+
+def non_dominated_points(points: np.ndarray) -> np.ndarray:
+    """ Returns the unique non-dominated rows of a matrix. """
+    points = np.unique(np.asarray(points, dtype=float), axis=0)
+
+    return points[~_is_dominated(points)]
+
+
+def _relevant_points(points, reference_point) -> tuple:
+    reference_point = np.asarray(reference_point, dtype=float)
+    points = np.asarray(points, dtype=float).reshape(-1, len(reference_point))
+
+    return points[np.all(points < reference_point, axis=1)], reference_point
+
+
+def _is_dominated(points: np.ndarray) -> np.ndarray:
+    """ Tells which rows of a matrix of unique rows are dominated by another row. """
+    dominated = np.zeros(len(points), dtype=bool)
+    batch_size = max(1, 2 ** 22 // max(1, points.size))
+    for start in range(0, len(points), batch_size):
+        batch = points[start:start + batch_size]
+        weakly_dominated = np.all(points[None, :, :] <= batch[:, None, :], axis=2)
+        # Unique rows only weakly dominate themselves among the equal ones
+        dominated[start:start + batch_size] = np.count_nonzero(weakly_dominated, axis=1) > 1
+
+    return dominated
+
+
+def _is_dominated_by_any(samples: np.ndarray, points: np.ndarray) -> np.ndarray:
+    return np.any(np.all(points[None, :, :] <= samples[:, None, :], axis=2), axis=1)
+
+
+def _exact_hypervolume(points: np.ndarray, reference_point: np.ndarray) -> float:
+    """ Hypervolume of a set of points strictly dominating the reference point. """
+    number_of_points = len(points)
+    if number_of_points == 0:
+        return 0.0
+    if number_of_points == 1:
+        return float(np.prod(reference_point - points[0]))
+
+    number_of_objectives = len(reference_point)
+    if number_of_objectives == 1:
+        return float(reference_point[0] - points[:, 0].min())
+    if number_of_objectives == 2:
+        return _two_objective_hypervolume(points, reference_point)
+    if number_of_objectives == 3:
+        return _three_objective_hypervolume(points, reference_point)
+
+    return _wfg_hypervolume(non_dominated_points(points), reference_point)
+
+
+def _two_objective_hypervolume(points: np.ndarray, reference_point: np.ndarray) -> float:
+    """ Sum of the rectangles of the staircase of the front. Sorting the points by the first objective (and then by the
+    second one), the non-dominated ones are those improving the lowest second objective seen so far. """
+    points = points[np.lexsort((points[:, 1], points[:, 0]))]
+    lowest = np.minimum.accumulate(points[:, 1])
+    front = points[np.concatenate(([True], points[1:, 1] < lowest[:-1]))]
+    widths = np.diff(np.append(front[:, 0], reference_point[0]))
+
+    return float(np.sum(widths * (reference_point[1] - front[:, 1])))
+
+
+def _two_objective_contributions(front: np.ndarray, reference_point: np.ndarray) -> np.ndarray:
+    order = np.argsort(front[:, 0])
+    x = front[order, 0]
+    y = front[order, 1]
+
+    contributions = np.empty(len(front))
+    contributions[order] = (np.append(x[1:], reference_point[0]) - x) * (np.append(reference_point[1], y[:-1]) - y)
+
+    return contributions
+
+
+def _three_objective_hypervolume(points: np.ndarray, reference_point: np.ndarray) -> float:
+    """ Sweep by increasing third objective keeping the two-objective front of the visited points, sorted by the first
+    objective (and decreasing second objective), together with the area it dominates (Beume et al., 2009). Dominated
+    points are discarded by the sweep. """
+    points = points[np.argsort(points[:, 2], kind='stable')]
+    reference_x, reference_y, reference_z = reference_point.tolist()
+
+    xs, ys = [], []
+    area = 0.0
+    volume = 0.0
+    previous_z = None
+
+    for x, y, z in points.tolist():
+        if previous_z is not None:
+            volume += area * (z - previous_z)
+        previous_z = z
+
+        # The point with the greatest first objective not greater than the new one has the lowest second objective
+        predecessor = bisect_right(xs, x) - 1
+        if predecessor >= 0 and ys[predecessor] <= y:
+            continue
+
+        # The new point dominates the points with a greater or equal first and second objectives
+        position = bisect_left(xs, x)
+        end = position
+        while end < len(xs) and ys[end] >= y:
+            end += 1
+
+        next_x = xs[end] if end < len(xs) else reference_x
+        previous_y = ys[position - 1] if position > 0 else reference_y
+
+        # Area added: the region between the new point and its neighbors minus the area of the removed points
+        removed = 0.0
+        for i in range(position, end):
+            following_x = xs[i + 1] if i + 1 < len(xs) else reference_x
+            removed += (following_x - xs[i]) * (previous_y - ys[i])
+        area += (next_x - x) * (previous_y - y) - removed
+
+        xs[position:end] = [x]
+        ys[position:end] = [y]
+
+    return volume + area * (reference_z - previous_z)
+
+
+def _wfg_hypervolume(front: np.ndarray, reference_point: np.ndarray) -> float:
+    """ WFG algorithm. Points are visited by decreasing last objective, so all the points of the limit set of a point
+    share its last objective and the exclusive hypervolumes are computed with one objective less. """
+    front = front[np.argsort(-front[:, -1], kind='stable')]
+    heights = reference_point[-1] - front[:, -1]
+    projected_front = front[:, :-1]
+    projected_reference_point = reference_point[:-1]
+    volumes = np.prod(projected_reference_point - projected_front, axis=1)
+
+    total = 0.0
+    for k in range(len(front)):
+        exclusive_volume = volumes[k]
+        if k + 1 < len(front):
+            limit_set = np.maximum(projected_front[k + 1:], projected_front[k])
+            exclusive_volume -= _exact_hypervolume(limit_set, projected_reference_point)
+        total += heights[k] * exclusive_volume
+
+    return float(total)
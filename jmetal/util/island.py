@@ -0,0 +1,227 @@
+import multiprocessing
+import queue
+import random
+import time
+import traceback
+from typing import Callable, List, TypeVar
+
+import numpy as np
+
+from jmetal.core.algorithm import EvolutionaryAlgorithm
+from jmetal.operator.selection import RankingAndCrowdingDistanceSelection
+from jmetal.util.archive import NonDominatedSolutionsArchive
+from jmetal.util.comparator import DominanceComparator
+from jmetal.util.ranking import FastNonDominatedRanking
+
+S = TypeVar('S')
+
+"""
+.. module:: island
+   :platform: Unix, Windows
+   :synopsis: Island model running several evolutionary algorithms in parallel processes with migration.
+
+Every island is an evolutionary algorithm (e.g., NSGA-II, a genetic algorithm, GDE3 or SPEA2) running its own
+generations, including selection, ranking and replacement, in a separate process. Every `migration_interval`
+generations, an island sends `migration_size` solutions picked at random among its non-dominated ones to its
+neighbours in the topology:
+
+* 'ring': island i sends to island i + 1.
+* 'star': island 0 sends to all the others, which send to island 0.
+* 'random': every island sends to another island chosen at random at each migration.
+
+The migration is asynchronous: the immigrants received so far are merged into the population of an island at its next
+migration, keeping the best solutions by ranking and crowding distance. The result is the non-dominated solutions of
+the final populations of all the islands.
+
+The islands are created in the worker processes by a function receiving the index of the island, which must be
+picklable with the spawn start method (e.g., a module-level function or a :func:`functools.partial` of one).
+
+Example:
+
+>>> def create_island(index):
+...     return NSGAII(problem, population_size=100, offspring_population_size=100, ...,
+...                   termination_criterion=StoppingByEvaluations(25000))
+>>> islands = IslandModel(create_island, number_of_islands=4, topology='ring')
+>>> islands.run()
+>>> front = islands.get_result()
+"""
+
+TOPOLOGIES = ('ring', 'star', 'random')
+
+
+class IslandModel:
+
+    # Seconds between the checks of the island processes while waiting for their results
+    poll_interval = 1.0
+
+    def __init__(self, create_island: Callable[[int], EvolutionaryAlgorithm], number_of_islands: int = 4,
+                 topology: str = 'ring', migration_interval: int = 10, migration_size: int = 2, seed: int = None):
+        """
+        :param create_island: Function returning the algorithm of an island given its index.
+        :param number_of_islands: Number of islands (and processes).
+        :param topology: 'ring', 'star' or 'random'.
+        :param migration_interval: Number of generations between migrations.
+        :param migration_size: Number of solutions sent to every neighbour.
+        :param seed: Seed of the random generators of the islands (island i uses seed + i). By default, every island
+            is seeded from the operating system, so that forked islands do not share their random sequences.
+        """
+        if topology not in TOPOLOGIES:
+            raise Exception('Unknown topology: ' + str(topology))
+        if number_of_islands < 1:
+            raise Exception('The number of islands must be positive: ' + str(number_of_islands))
+
+        self.create_island = create_island
+        self.number_of_islands = number_of_islands
+        self.topology = topology
+        self.migration_interval = migration_interval
+        self.migration_size = migration_size
+        self.seed = seed
+
+        self.solutions: List[S] = []
+        self.island_solutions: List[List[S]] = []
+        self.evaluations = 0
+        self.total_computing_time = 0
+
+    def run(self) -> None:
+        """ Runs the islands until all of them meet their stopping condition, and merges their populations. An
+        exception is raised if an island fails, or if its process dies without a result (e.g., killed by the
+        operating system). """
+        start_computing_time = time.time()
+        self.solutions = []
+        self.island_solutions = []
+        self.evaluations = 0
+
+        inboxes = [multiprocessing.Queue() for _ in range(self.number_of_islands)]
+        results = multiprocessing.Queue()
+        processes = [
+            multiprocessing.Process(target=_run_island, args=(
+                self.create_island, index, self.number_of_islands, self.topology, self.migration_interval,
+                self.migration_size, None if self.seed is None else self.seed + index, inboxes, results))
+            for index in range(self.number_of_islands)
+        ]
+
+        for process in processes:
+            process.start()
+
+        island_results = {}
+        try:
+            island_results = self._collect(processes, results)
+        finally:
+            for process in processes:
+                if len(island_results) < len(processes) and process.is_alive():
+                    process.terminate()
+                process.join()
+
+        for index in range(self.number_of_islands):
+            _, solutions, evaluations, error = island_results[index]
+            if error is not None:
+                raise Exception('Island {} failed:\n{}'.format(index, error))
+
+            self.island_solutions.append(solutions)
+            self.evaluations += evaluations
+
+        archive = NonDominatedSolutionsArchive()
+        for solutions in self.island_solutions:
+            archive.add_all(solutions)
+        self.solutions = archive.solution_list
+
+        self.total_computing_time = time.time() - start_computing_time
+
+    def _collect(self, processes: list, results) -> dict:
+        """ Waits for the result of every island, checking that the processes still without one are alive. """
+        island_results = {}
+        dead = set()
+
+        while len(island_results) < len(processes):
+            try:
+                result = results.get(timeout=self.poll_interval)
+                island_results[result[0]] = result
+            except queue.Empty:
+                for index, process in enumerate(processes):
+                    if index in island_results or process.exitcode is None:
+                        continue
+
+                    # The result of a process which has just exited may still be on its way, so it is only missing if
+                    # the process was already dead at the previous check
+                    if index in dead:
+                        raise Exception('Island {} exited with code {} without a result'.format(
+                            index, process.exitcode))
+                    dead.add(index)
+
+        return island_results
+
+    def get_result(self) -> List[S]:
+        return self.solutions
+
+    def get_name(self) -> str:
+        return 'Island model'
+
+
+def neighbours(topology: str, island: int, number_of_islands: int) -> List[int]:
+    """ Returns the islands receiving the emigrants of an island. """
+    if number_of_islands == 1:
+        return []
+
+    if topology == 'ring':
+        return [(island + 1) % number_of_islands]
+    elif topology == 'star':
+        return list(range(1, number_of_islands)) if island == 0 else [0]
+
+    return [random.choice([index for index in range(number_of_islands) if index != island])]
+
+
+def migrate(algorithm: EvolutionaryAlgorithm, island: int, topology: str, migration_size: int, inboxes: list) -> None:
+    """ Merges the immigrants received by an island into its population, and sends its emigrants to its neighbours. """
+    immigrants = []
+    while True:
+        try:
+            immigrants.extend(inboxes[island].get_nowait())
+        except queue.Empty:
+            break
+
+    if len(immigrants) > 0:
+        comparator = getattr(algorithm, 'dominance_comparator', DominanceComparator())
+        algorithm.solutions = RankingAndCrowdingDistanceSelection(
+            len(algorithm.solutions), dominance_comparator=comparator
+        ).execute(list(algorithm.solutions) + immigrants)
+
+    ranking = FastNonDominatedRanking()
+    ranking.compute_ranking(list(algorithm.solutions))
+    front = ranking.get_subfront(0)
+
+    for neighbour in neighbours(topology, island, len(inboxes)):
+        inboxes[neighbour].put(random.sample(front, min(migration_size, len(front))))
+
+
+def _run_island(create_island: Callable, island: int, number_of_islands: int, topology: str, migration_interval: int,
+                migration_size: int, seed: int, inboxes: list, results) -> None:
+    """ Runs an island in a worker process, putting (index, solutions, evaluations, error) in the results queue. """
+    # An island may finish while its neighbours are still sending immigrants to it, so exiting must not wait for the
+    # pending immigrants to be flushed
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+
+    try:
+        random.seed(seed)
+        np.random.seed(seed)
+
+        algorithm = create_island(island)
+        algorithm.start_computing_time = time.time()
+
+        algorithm.solutions = algorithm.evaluate(algorithm.create_initial_solutions())
+        algorithm.init_progress()
+
+        generation = 0
+        while not algorithm.stopping_condition_is_met():
+            algorithm.step()
+            algorithm.update_progress()
+
+            generation += 1
+            if generation % migration_interval == 0:
+                migrate(algorithm, island, topology, migration_size, inboxes)
+
+        algorithm.total_computing_time = time.time() - algorithm.start_computing_time
+
+        results.put((island, list(algorithm.solutions), algorithm.evaluations, None))
+    except Exception:
+        results.put((island, None, 0, traceback.format_exc()))
@@ -0,0 +1,314 @@
+from bisect import bisect_right
+
+import numpy as np
+
+"""
+.. module:: non_dominated_sorting
+   :platform: Unix, Windows
+   :synopsis: Non-dominated sorting algorithms working on objective matrices.
+
+All the algorithms assume minimization and return, for every row of an (N, m) objective matrix, the index of its
+non-dominated front (0 being the best one). Duplicated rows always share their front. When a number `k` of individuals
+is given, only the fronts needed to hold at least `k` rows are computed and the remaining rows get rank -1.
+"""
+
+ALGORITHMS = ('auto', 'ens-ss', 'ens-bs', 'jensen-fortin', 'two-objective')
+
+
+def non_dominated_sort(objectives, k: int = None, algorithm: str = 'auto', constraint_violation=None) -> np.ndarray:
+    """ Computes the non-dominated rank of every row of an objective matrix.
+
+    :param objectives: (N, m) matrix of objective values.
+    :param k: Number of individuals to be ranked (optional).
+    :param algorithm: One of 'auto', 'ens-ss', 'ens-bs' (Efficient Non-dominated Sort with sequential or binary search),
+        'jensen-fortin' (divide-and-conquer) or 'two-objective'.
+    :param constraint_violation: Overall constraint violation degree (<= 0) of each row (optional). If given, rows are
+        compared with the constrained dominance of :class:`DominanceComparator`: a less violated row dominates a more
+        violated one, and rows with the same violation degree are compared by Pareto dominance.
+    :return: Array with the rank of each row.
+    """
+    if algorithm not in ALGORITHMS:
+        raise Exception('Unknown non-dominated sorting algorithm: {}'.format(algorithm))
+
+    objectives = np.asarray(objectives, dtype=float)
+    if objectives.ndim != 2:
+        raise Exception('The objectives must be a matrix with one row per solution')
+
+    number_of_rows = objectives.shape[0]
+    if constraint_violation is None:
+        return _sort_unconstrained(objectives, k, algorithm)
+
+    # Rows with a better violation degree dominate all the rows with a worse one, so every group of equally violated
+    # rows is sorted on its own and its fronts are appended after those of the better groups
+    constraint_violation = np.asarray(constraint_violation, dtype=float)
+    ranks = np.full(number_of_rows, -1, dtype=np.int64)
+    number_of_fronts = 0
+    number_of_ranked_rows = 0
+
+    for violation in np.unique(constraint_violation)[::-1]:
+        if k is not None and number_of_ranked_rows >= k:
+            break
+
+        group = np.flatnonzero(constraint_violation == violation)
+        group_ranks = _sort_unconstrained(objectives[group], None if k is None else k - number_of_ranked_rows,
+                                          algorithm)
+        ranked = group_ranks >= 0
+        ranks[group[ranked]] = group_ranks[ranked] + number_of_fronts
+
+        number_of_fronts += group_ranks.max() + 1
+        number_of_ranked_rows += np.count_nonzero(ranked)
+
+    return ranks
+
+
+def _sort_unconstrained(objectives: np.ndarray, k: int, algorithm: str) -> np.ndarray:
+    number_of_rows, number_of_objectives = objectives.shape
+    if number_of_rows == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    points, inverse, counts = np.unique(objectives, axis=0, return_inverse=True, return_counts=True)
+    inverse = inverse.reshape(-1)
+
+    if algorithm == 'auto':
+        algorithm = 'two-objective' if number_of_objectives <= 2 else 'jensen-fortin'
+
+    if number_of_objectives == 1:
+        ranks = np.arange(len(points), dtype=np.int64)
+    elif algorithm == 'two-objective':
+        if number_of_objectives != 2:
+            raise Exception('The two-objective sorting requires two objectives, not {}'.format(number_of_objectives))
+        ranks = _two_objective_sort(points)
+    elif algorithm == 'jensen-fortin':
+        ranks = _DivideAndConquerSorter(points).sort()
+    else:
+        ranks = _efficient_non_dominated_sort(points, counts, k, algorithm == 'ens-bs')
+
+    return _truncate(ranks, counts, k)[inverse]
+
+
+def _truncate(ranks: np.ndarray, counts: np.ndarray, k: int) -> np.ndarray:
+    """ Sets to -1 the ranks of the rows not needed to hold at least k rows. """
+    if k is None:
+        return ranks
+
+    ranked = ranks >= 0
+    sizes = np.bincount(ranks[ranked], weights=counts[ranked])
+    last_front = np.searchsorted(np.cumsum(sizes), k)
+
+    return np.where(ranks > last_front, -1, ranks)
+
+
+def _two_objective_sort(points: np.ndarray) -> np.ndarray:
+    """ O(N log N) sorting for two objectives. The points must be unique and lexicographically sorted. Each front is
+    represented by the second objective of its last point, which is the lowest one of the front; a point belongs to the
+    first front whose representative is greater than its second objective. """
+    ranks = np.empty(len(points), dtype=np.int64)
+    tails = []
+
+    for index, value in enumerate(points[:, 1].tolist()):
+        rank = bisect_right(tails, value)
+        if rank == len(tails):
+            tails.append(value)
+        else:
+            tails[rank] = value
+        ranks[index] = rank
+
+    return ranks
+
+
+def _efficient_non_dominated_sort(points: np.ndarray, counts: np.ndarray, k: int, binary_search: bool) -> np.ndarray:
+    """ Efficient Non-dominated Sort (ENS) by Zhang et al. The points must be unique and lexicographically sorted, so a
+    point can only be dominated by the points preceding it, and it is added to the first front not dominating it. The
+    fronts are searched sequentially (ENS-SS) or by binary search (ENS-BS).
+
+    If `k` is given, once the first fronts hold at least k rows the points which would go to a later front are skipped.
+    """
+    number_of_points, number_of_objectives = points.shape
+    ranks = np.full(number_of_points, -1, dtype=np.int64)
+
+    fronts = []
+    sizes = []
+    weights = []
+    last_front = None
+
+    def is_dominated(point, front: int) -> bool:
+        return bool(np.any(np.all(fronts[front][:sizes[front]] <= point, axis=1)))
+
+    for index in range(number_of_points):
+        point = points[index]
+        number_of_fronts = len(fronts) if last_front is None else last_front + 1
+
+        if binary_search:
+            low, high = 0, number_of_fronts
+            while low < high:
+                middle = (low + high) // 2
+                if is_dominated(point, middle):
+                    low = middle + 1
+                else:
+                    high = middle
+            rank = low
+        else:
+            rank = 0
+            while rank < number_of_fronts and is_dominated(point, rank):
+                rank += 1
+
+        if rank == number_of_fronts and last_front is not None:
+            continue
+
+        if rank == len(fronts):
+            fronts.append(np.empty((8, number_of_objectives)))
+            sizes.append(0)
+            weights.append(0)
+        elif sizes[rank] == len(fronts[rank]):
+            fronts[rank] = np.concatenate((fronts[rank], np.empty_like(fronts[rank])))
+
+        fronts[rank][sizes[rank]] = point
+        sizes[rank] += 1
+        weights[rank] += counts[index]
+        ranks[index] = rank
+
+        if k is not None:
+            cumulative_weights = np.cumsum(weights)
+            if cumulative_weights[-1] >= k:
+                last_front = int(np.searchsorted(cumulative_weights, k))
+
+    return ranks
+
+
+class _DivideAndConquerSorter:
+    """ Divide-and-conquer non-dominated sorting by Jensen, with the modifications of Fortin et al. and Buzdalov and
+    Shalyto to handle points sharing objective values, running in O(N log^(m-1) N). The points must be unique and
+    lexicographically sorted; sets of points are index arrays kept in increasing order. """
+
+    BRUTE_FORCE_SIZE = 64
+
+    def __init__(self, points: np.ndarray):
+        self.points = points
+        self.ranks = np.zeros(len(points), dtype=np.int64)
+
+    def sort(self) -> np.ndarray:
+        self.helper_a(np.arange(len(self.points)), self.points.shape[1] - 1)
+
+        return self.ranks
+
+    def helper_a(self, s: np.ndarray, k: int) -> None:
+        """ Ranks the points in `s`, which share the values of the objectives above `k`. """
+        if len(s) < 2:
+            return
+        if len(s) <= self.BRUTE_FORCE_SIZE:
+            self.brute_force_a(s, k)
+            return
+        if k == 1:
+            self.sweep_a(s)
+            return
+
+        values = self.points[s, k]
+        if values.min() == values.max():
+            self.helper_a(s, k - 1)
+            return
+
+        median = _median(values)
+        low, middle, high = s[values < median], s[values == median], s[values > median]
+
+        self.helper_a(low, k)
+        self.helper_b(low, middle, k - 1)
+        self.helper_a(middle, k - 1)
+        self.helper_b(s[values <= median], high, k - 1)
+        self.helper_a(high, k)
+
+    def helper_b(self, low: np.ndarray, high: np.ndarray, k: int) -> None:
+        """ Updates the ranks of the points in `high` with the (final) ranks of the points in `low`, which are not
+        worse in the objectives above `k`. """
+        if len(low) == 0 or len(high) == 0:
+            return
+        if len(low) * len(high) <= self.BRUTE_FORCE_SIZE * self.BRUTE_FORCE_SIZE:
+            self.brute_force_b(low, high, k)
+            return
+        if k == 1:
+            self.sweep_b(low, high)
+            return
+
+        low_values = self.points[low, k]
+        high_values = self.points[high, k]
+        if low_values.max() <= high_values.min():
+            self.helper_b(low, high, k - 1)
+        elif low_values.min() <= high_values.max():
+            median = _median(np.concatenate((low_values, high_values)))
+
+            self.helper_b(low[low_values < median], high[high_values < median], k)
+            self.helper_b(low[low_values <= median], high[high_values >= median], k - 1)
+            self.helper_b(low[low_values > median], high[high_values > median], k)
+
+    def brute_force_a(self, s: np.ndarray, k: int) -> None:
+        points = self.points[s, :k + 1]
+        for j in range(1, len(s)):
+            dominators = np.all(points[:j] <= points[j], axis=1)
+            if dominators.any():
+                self.ranks[s[j]] = max(self.ranks[s[j]], self.ranks[s[:j][dominators]].max() + 1)
+
+    def brute_force_b(self, low: np.ndarray, high: np.ndarray, k: int) -> None:
+        dominates = np.all(self.points[low, None, :k + 1] <= self.points[None, high, :k + 1], axis=2)
+        candidate_ranks = np.where(dominates, self.ranks[low][:, None] + 1, 0).max(axis=0)
+        self.ranks[high] = np.maximum(self.ranks[high], candidate_ranks)
+
+    def sweep_a(self, s: np.ndarray) -> None:
+        """ Two-objective case of `helper_a`: the points are visited by increasing first objective and a Fenwick tree
+        gives the highest rank among the visited points with a lower or equal second objective. """
+        values = self.points[s, 1]
+        keys = np.searchsorted(np.unique(values), values).tolist()
+        tree = _MaxFenwickTree(len(keys))
+
+        for index, key in zip(s.tolist(), keys):
+            rank = max(int(self.ranks[index]), tree.query(key + 1) + 1)
+            self.ranks[index] = rank
+            tree.update(key, rank)
+
+    def sweep_b(self, low: np.ndarray, high: np.ndarray) -> None:
+        """ Two-objective case of `helper_b`. """
+        low_values = self.points[low, 1]
+        unique_low_values = np.unique(low_values)
+        low_keys = np.searchsorted(unique_low_values, low_values)
+        high_keys = np.searchsorted(unique_low_values, self.points[high, 1], side='right')
+
+        # Points of `low` are visited before the points of `high` sharing their first objective
+        indices = np.concatenate((low, high))
+        keys = np.concatenate((low_keys, high_keys)).tolist()
+        is_high = np.concatenate((np.zeros(len(low), dtype=bool), np.ones(len(high), dtype=bool)))
+        order = np.lexsort((is_high, self.points[indices, 0])).tolist()
+
+        tree = _MaxFenwickTree(len(unique_low_values))
+        indices = indices.tolist()
+        is_high = is_high.tolist()
+        for position in order:
+            index = indices[position]
+            if is_high[position]:
+                self.ranks[index] = max(int(self.ranks[index]), tree.query(keys[position]) + 1)
+            else:
+                tree.update(keys[position], int(self.ranks[index]))
+
+
+class _MaxFenwickTree:
+    """ Fenwick tree answering prefix maximum queries; empty prefixes have value -1. """
+
+    def __init__(self, size: int):
+        self.tree = [-1] * (size + 1)
+
+    def update(self, position: int, value: int) -> None:
+        position += 1
+        while position < len(self.tree):
+            if self.tree[position] < value:
+                self.tree[position] = value
+            position += position & -position
+
+    def query(self, length: int) -> int:
+        """ Maximum of the first `length` positions. """
+        result = -1
+        while length > 0:
+            if self.tree[length] > result:
+                result = self.tree[length]
+            length -= length & -length
+        return result
+
+
+def _median(values: np.ndarray) -> float:
+    return np.partition(values, len(values) // 2)[len(values) // 2]
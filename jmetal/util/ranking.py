@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
 from typing import TypeVar, List
 
-from jmetal.util.comparator import DominanceComparator, Comparator, SolutionAttributeComparator
+import numpy as np
+
+from jmetal.core.population import Population
+from jmetal.util.comparator import DominanceComparator, Comparator, SolutionAttributeComparator, \
+    OverallConstraintViolationComparator
+from jmetal.util.constraint_handling import overall_constraint_violation_degree
+from jmetal.util.non_dominated_sorting import non_dominated_sort
 
 S = TypeVar('S')
 
@@ -35,17 +41,28 @@ class Ranking(List[S], ABC):
 
 
 class FastNonDominatedRanking(Ranking[List[S]]):
-    """ Class implementing the non-dominated ranking of NSGA-II proposed by Deb et al., see [Deb2002]_ """
+    """ Class implementing the non-dominated ranking of NSGA-II proposed by Deb et al., see [Deb2002]_
 
-    def __init__(self, comparator: Comparator = DominanceComparator()):
+    When the comparator is the default (constrained) :class:`DominanceComparator`, the fronts are computed on the
+    objective matrix by the sorting engine of :mod:`jmetal.util.non_dominated_sorting`, using the given `algorithm`
+    ('auto', 'ens-ss', 'ens-bs', 'jensen-fortin' or 'two-objective'); any other comparator is applied pairwise.
+    """
+
+    def __init__(self, comparator: Comparator = DominanceComparator(), algorithm: str = 'auto'):
         super(FastNonDominatedRanking, self).__init__(comparator)
+        self.algorithm = algorithm
 
     def compute_ranking(self, solutions: List[S], k: int = None):
         """ Compute ranking of solutions.
 
         :param solutions: Solution list.
-        :param k: Number of individuals.
+        :param k: Number of individuals. If given, only the fronts needed to hold k solutions are computed, and the
+            solutions left out of them get the rank following the last computed front.
         """
+        if type(self.comparator) is DominanceComparator and \
+                type(self.comparator.constraint_comparator) is OverallConstraintViolationComparator:
+            return self.__compute_ranking_from_objective_matrix(solutions, k)
+
         # number of solutions dominating solution ith
         dominating_ith = [0 for _ in range(len(solutions))]
 
@@ -100,6 +117,45 @@ class FastNonDominatedRanking(Ranking[List[S]]):
 
         return self.ranked_sublists
 
+    def __compute_ranking_from_objective_matrix(self, solutions: List[S], k: int = None):
+        if len(solutions) == 0:
+            self.ranked_sublists = []
+            return self.ranked_sublists
+
+        if isinstance(solutions, Population):
+            objectives = solutions.objectives
+            constraint_violation = np.where(solutions.constraints < 0, solutions.constraints, 0.0).sum(axis=1)
+        else:
+            objectives = np.array([solution.objectives for solution in solutions], dtype=float)
+            constraint_violation = np.array([overall_constraint_violation_degree(solution) for solution in solutions])
+
+        if not constraint_violation.any():
+            constraint_violation = None
+
+        ranks = non_dominated_sort(objectives, k, self.algorithm, constraint_violation)
+        ranked = np.flatnonzero(ranks >= 0)
+
+        # The solutions out of the computed fronts are ranked after all of them, so that no stale rank of a previous
+        # ranking is read by the comparators
+        ranks_to_set = np.where(ranks >= 0, ranks, ranks.max(initial=-1) + 1)
+        if isinstance(solutions, Population):
+            solutions.set_column('dominance_ranking', ranks_to_set)
+        else:
+            for index, rank in enumerate(ranks_to_set.tolist()):
+                solutions[index].attributes['dominance_ranking'] = int(rank)
+
+        # Solutions of every front keep their order in the solution list
+        order = ranked[np.argsort(ranks[ranked], kind='stable')].tolist()
+        front_sizes = np.bincount(ranks[ranked]).tolist()
+
+        self.ranked_sublists = []
+        start = 0
+        for front_size in front_sizes:
+            self.ranked_sublists.append([solutions[index] for index in order[start:start + front_size]])
+            start += front_size
+
+        return self.ranked_sublists
+
     @classmethod
     def get_comparator(cls) -> Comparator:
         return SolutionAttributeComparator('dominance_ranking')
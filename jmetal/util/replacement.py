@@ -23,7 +23,7 @@ class RankingAndDensityEstimatorReplacement():
     def replace(self, solution_list: List[S], offspring_list: List[S]) -> List[S]:
         join_population = solution_list + offspring_list
 
-        self.ranking.compute_ranking(join_population)
+        self.ranking.compute_ranking(join_population, k=len(solution_list))
         if self.removal_policy is RemovalPolicyType.SEQUENTIAL:
             result_list = self.sequential_truncation(0, len(solution_list))
         else:
@@ -45,11 +45,10 @@ class RankingAndDensityEstimatorReplacement():
             for solution in current_ranked_solutions:
                 result_list.append(solution)
 
+            # The density estimator updates the values of the remaining solutions after every removal
             while len(result_list) > size_of_the_result_list:
                 self.density_estimator.sort(result_list)
-
-                del result_list[-1]
-                self.density_estimator.compute_density_estimator(result_list)
+                self.density_estimator.remove(result_list, len(result_list) - 1)
 
         return result_list
 
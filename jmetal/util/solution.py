@@ -20,9 +20,7 @@ LOGGER = logging.getLogger('jmetal')
 
 def get_non_dominated_solutions(solutions: List[Solution]) -> List[Solution]:
     archive: Archive = NonDominatedSolutionsArchive()
-
-    for solution in solutions:
-        archive.add(solution)
+    archive.add_all(solutions)
 
     return archive.solution_list
 
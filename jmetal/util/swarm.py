@@ -0,0 +1,98 @@
+import random
+from typing import List
+
+import numpy as np
+
+from jmetal.core.solution import FloatSolution
+
+"""
+.. module:: swarm
+   :platform: Unix, Windows
+   :synopsis: Particle swarm kernel working on (swarm size, number of variables) matrices.
+
+The coefficients (c1, c2, r1, r2, inertia weight, beta, ...) are given either as scalars or as arrays broadcastable to
+the matrices, e.g., as columns with one value per particle.
+"""
+
+
+def variables_matrix(solutions: List[FloatSolution]) -> np.ndarray:
+    """ Returns the (swarm size, number of variables) matrix of the variables of the solutions. The variables of a
+    solution appearing several times (e.g., a leader selected as global best by many particles) are converted once. """
+    rows = {}
+    distinct_solutions = []
+    for solution in solutions:
+        if id(solution) not in rows:
+            rows[id(solution)] = len(distinct_solutions)
+            distinct_solutions.append(solution)
+
+    matrix = np.array([solution.variables for solution in distinct_solutions], dtype=float)
+    if len(distinct_solutions) == len(solutions):
+        return matrix
+
+    return matrix[[rows[id(solution)] for solution in solutions]]
+
+
+def set_variables(solutions: List[FloatSolution], variables: np.ndarray) -> None:
+    """ Sets the rows of a matrix as the variables of the solutions. """
+    for solution, row in zip(solutions, variables.tolist()):
+        solution.variables = row
+
+
+def random_coefficients(lower: float, upper: float, swarm_size: int) -> np.ndarray:
+    """ Draws a coefficient per particle uniformly in [lower, upper] and rounded to one decimal. The values are drawn
+    with the :mod:`random` module, as in the rest of the operators, so that the runs are reproducible with
+    :func:`random.seed`.
+
+    :return: Column with the coefficients.
+    """
+    return np.array([[round(random.uniform(lower, upper), 1)] for _ in range(swarm_size)])
+
+
+def constriction_coefficient(c1, c2) -> np.ndarray:
+    """ Constriction coefficient of SMPSO. """
+    rho = np.asarray(c1 + c2, dtype=float)
+    root = np.sqrt(np.maximum(rho * rho - 4.0 * rho, 0.0))
+
+    with np.errstate(divide='ignore'):
+        return np.where(rho <= 4, 1.0, 2.0 / (2.0 - rho - root))
+
+
+def momentum_constriction_coefficient(c1, c2, beta) -> np.ndarray:
+    """ Constriction coefficient of the PSOs with momentum (EMPSO), computed from the eigenvalues of the dynamics. """
+    phi = np.asarray(c1 + c2, dtype=float)
+    delta = phi * phi - 4.0 * (1.0 - beta) * phi
+    eigenvalue = (np.abs(phi - 2.0) + np.sqrt(np.maximum(delta, 0.0))) / 2.0
+
+    return np.where((delta < 0) | (eigenvalue <= 1), 1.0, -1.0 / np.maximum(eigenvalue, 1.0))
+
+
+def acceleration(positions: np.ndarray, local_best: np.ndarray, global_best: np.ndarray, c1, c2, r1, r2) -> np.ndarray:
+    """ Cognitive and social terms of the velocity update. """
+    return c1 * r1 * (local_best - positions) + c2 * r2 * (global_best - positions)
+
+
+def constricted_velocity(speed: np.ndarray, acceleration: np.ndarray, inertia, chi, delta_min: np.ndarray,
+                         delta_max: np.ndarray) -> np.ndarray:
+    """ Velocity update of SMPSO: the constricted velocity is clipped to [delta_min, delta_max]. """
+    return np.clip(chi * (inertia * speed + acceleration), delta_min, delta_max)
+
+
+def momentum_velocity(speed: np.ndarray, momentum: np.ndarray, acceleration: np.ndarray, beta, chi,
+                      delta_min: np.ndarray, delta_max: np.ndarray) -> np.ndarray:
+    """ Velocity update of the PSOs with momentum. The momentum matrix is updated in place with the previous velocity
+    before computing the new one. """
+    momentum *= beta
+    momentum += (1 - beta) * speed
+
+    return np.clip(chi * (momentum + acceleration), delta_min, delta_max)
+
+
+def bounce_back(positions: np.ndarray, speed: np.ndarray, lower_bound: np.ndarray, upper_bound: np.ndarray,
+                change_velocity1: float = -1, change_velocity2: float = -1) -> None:
+    """ Moves back to the bounds the variables out of them, multiplying their velocity by `change_velocity1` (lower
+    bound) or `change_velocity2` (upper bound). The matrices are updated in place. """
+    below = positions < lower_bound
+    above = positions > upper_bound
+
+    np.clip(positions, lower_bound, upper_bound, out=positions)
+    speed *= np.where(below, change_velocity1, np.where(above, change_velocity2, 1.0))
@@ -113,6 +113,46 @@ class NonDominatedSolutionListArchiveTestCases(unittest.TestCase):
         self.assertTrue(solution1 in self.archive.solution_list
                         or solution3 in self.archive.solution_list)
 
+    def test_should_less_violated_solutions_replace_the_archive(self):
+        infeasible_solution = Solution(1, 2, 1)
+        infeasible_solution.objectives = [0.0, 0.0]
+        infeasible_solution.constraints = [-1.0]
+
+        feasible_solution = Solution(1, 2, 1)
+        feasible_solution.objectives = [1.0, 1.0]
+
+        self.assertTrue(self.archive.add(infeasible_solution))
+        self.assertTrue(self.archive.add(feasible_solution))
+        self.assertFalse(self.archive.add(infeasible_solution))
+        self.assertEqual([feasible_solution], self.archive.solution_list)
+
+    def test_should_remove_delete_a_solution(self):
+        solution1 = Solution(1, 3)
+        solution1.objectives = [1.0, 0.0, 1.0]
+        solution2 = Solution(1, 3)
+        solution2.objectives = [0.0, 1.0, 1.0]
+
+        self.archive.add(solution1)
+        self.archive.add(solution2)
+
+        self.assertTrue(self.archive.remove(solution1))
+        self.assertFalse(self.archive.remove(solution1))
+        self.assertEqual([solution2], self.archive.solution_list)
+
+    def test_should_add_all_keep_the_same_solutions_as_adding_them_one_by_one(self):
+        solutions = []
+        for objectives in [[2.0, 2.0, 2.0], [1.0, 3.0, 2.0], [1.0, 1.0, 1.0], [0.0, 4.0, 4.0], [1.0, 1.0, 1.0]]:
+            solution = Solution(1, 3)
+            solution.objectives = objectives
+            solutions.append(solution)
+
+        self.archive.add(solutions[0])
+        added_solutions = self.archive.add_all(solutions[1:])
+
+        self.assertEqual([solutions[2], solutions[3]], added_solutions)
+        self.assertEqual(2, self.archive.size())
+        self.assertTrue(solutions[2] in self.archive.solution_list and solutions[3] in self.archive.solution_list)
+
 
 class CrowdingDistanceArchiveTestCases(unittest.TestCase):
 
@@ -289,6 +329,21 @@ class CrowdingDistanceArchiveTestCases(unittest.TestCase):
         self.assertEqual(1, archive.size())
         self.assertTrue(new_solution in archive.solution_list)
 
+    def test_should_add_all_truncate_the_archive_once(self):
+        archive = CrowdingDistanceArchive(3)
+
+        solutions = []
+        for objectives in [[0.0, 3.0], [1.0, 2.0], [1.1, 1.9], [2.0, 1.5], [3.0, 0.0], [4.0, 4.0]]:
+            solution = Solution(2, 2)
+            solution.objectives = objectives
+            solutions.append(solution)
+
+        added_solutions = archive.add_all(solutions)
+
+        self.assertEqual(solutions[:5], added_solutions)
+        self.assertEqual(3, archive.size())
+        self.assertTrue(solutions[0] in archive.solution_list and solutions[4] in archive.solution_list)
+
     def test_should_compute_density_estimator_work_properly_case1(self):
         """ Case 1: The archive contains one solution.
         """
@@ -0,0 +1,97 @@
+import threading
+import time
+import unittest
+from unittest import mock
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.algorithm.multiobjective.smpso import SMPSORP
+from jmetal.core.problem import FloatProblem
+from jmetal.core.solution import FloatSolution
+from jmetal.operator import SBXCrossover, PolynomialMutation
+from jmetal.util.archive import CrowdingDistanceArchiveWithReferencePoint
+from jmetal.util.asynchronous import AsynchronousEngine
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+
+class MockedProblem(FloatProblem):
+
+    def __init__(self, number_of_variables: int = 3):
+        super(MockedProblem, self).__init__()
+        self.number_of_objectives = 2
+        self.number_of_variables = number_of_variables
+        self.number_of_constraints = 0
+
+        self.lower_bound = [0.0 for _ in range(number_of_variables)]
+        self.upper_bound = [1.0 for _ in range(number_of_variables)]
+
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def evaluate(self, solution: FloatSolution):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+
+        time.sleep(0.001)
+        solution.objectives[0] = solution.variables[0]
+        solution.objectives[1] = 1.0 - solution.variables[0] + sum(solution.variables[1:])
+
+        with self.lock:
+            self.running -= 1
+
+        return solution
+
+    def get_name(self) -> str:
+        return 'Mocked problem'
+
+
+class AsynchronousEngineTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedProblem()
+        self.algorithm = NSGAII(problem=self.problem,
+                                population_size=10,
+                                offspring_population_size=10,
+                                mutation=PolynomialMutation(1.0 / 3, 20),
+                                crossover=SBXCrossover(0.9, 20),
+                                termination_criterion=StoppingByEvaluations(100))
+
+    def test_should_run_the_algorithm_until_the_stopping_condition_is_met(self):
+        AsynchronousEngine(workers=4, executor='thread').run(self.algorithm)
+
+        self.assertEqual(100, self.algorithm.evaluations)
+        self.assertEqual(10, len(self.algorithm.get_result()))
+        for solution in self.algorithm.get_result():
+            self.assertEqual(solution.variables[0], solution.objectives[0])
+
+    def test_should_keep_all_the_workers_busy(self):
+        AsynchronousEngine(workers=4, executor='thread').run(self.algorithm)
+
+        self.assertEqual(4, self.problem.max_running)
+
+    def test_should_run_smpsorp_updating_all_its_archives(self):
+        reference_points = [[0.2, 0.8], [0.8, 0.2]]
+
+        # The thread reading new reference points from the keyboard returns at once
+        with mock.patch('jmetal.algorithm.multiobjective.smpso._change_reference_point'):
+            algorithm = SMPSORP(problem=self.problem,
+                                swarm_size=10,
+                                mutation=PolynomialMutation(1.0 / 3, 20),
+                                reference_points=reference_points,
+                                leaders=[CrowdingDistanceArchiveWithReferencePoint(10, point)
+                                         for point in reference_points],
+                                termination_criterion=StoppingByEvaluations(100))
+
+        AsynchronousEngine(workers=4, executor='thread').run(algorithm)
+
+        self.assertEqual(100, algorithm.evaluations)
+        self.assertTrue(len(algorithm.get_result()) > 0)
+
+    def test_should_raise_an_exception_if_the_executor_is_unknown(self):
+        with self.assertRaises(Exception):
+            AsynchronousEngine(executor='socket')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,262 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+from scipy.integrate import odeint
+from scipy.optimize import brentq
+
+from jmetal.util import chaosGen as cg
+
+
+class LimitsCacheTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.environment = mock.patch.dict(os.environ, {'CHAOSGEN_CACHE_DIR': self.directory.name})
+        self.environment.start()
+
+    def tearDown(self):
+        self.environment.stop()
+        self.directory.cleanup()
+
+    def test_should_cache_path_be_in_the_configured_directory(self):
+        self.assertEqual(os.path.join(self.directory.name, 'limits.json'), cg.cachePath())
+
+    def test_should_limits_key_not_depend_on_the_number_types(self):
+        self.assertEqual('(10.0, 28.0, 2.5)', cg.limitsKey((10, 28.0, np.float32(2.5))))
+        self.assertEqual(cg.limitsKey([1, 2]), cg.limitsKey(np.array([1.0, 2.0])))
+
+    def test_should_saved_limits_be_loaded_back(self):
+        limits = np.array([[-20.0, 20.0], [-30.0, 30.0]])
+
+        cg.saveLimits('lorenz', (10, 28, 8 / 3), limits)
+        cg.saveLimits('henon', (1.4, 0.3), [[-1.5, 1.5]])
+
+        self.assertTrue(np.array_equal(limits, cg.loadLimits('lorenz', (10, 28, 8 / 3))))
+        self.assertTrue(np.array_equal([[-1.5, 1.5]], cg.loadLimits('henon', (1.4, 0.3))))
+        self.assertIsNone(cg.loadLimits('lorenz', (10, 28, 3)))
+        self.assertIsNone(cg.loadLimits('baker', ()))
+
+    def test_should_a_corrupt_cache_file_be_ignored_and_replaced(self):
+        with open(cg.cachePath(), 'w') as f:
+            f.write('{"lorenz": ')
+
+        self.assertIsNone(cg.loadLimits('lorenz', (10, 28, 8 / 3)))
+
+        cg.saveLimits('lorenz', (10, 28, 8 / 3), [[0.0, 1.0]])
+
+        with open(cg.cachePath()) as f:
+            self.assertEqual({'lorenz': {cg.limitsKey((10, 28, 8 / 3)): [[0.0, 1.0]]}}, json.load(f))
+
+    def test_should_a_failed_save_leave_no_temporary_file(self):
+        cg.saveLimits('lorenz', (10, 28, 8 / 3), [[0.0, 1.0]])
+
+        # The limits are not serializable
+        cg.saveLimits('henon', (1.4, 0.3), [object()])
+
+        self.assertEqual(['limits.json'], os.listdir(self.directory.name))
+        self.assertTrue(np.array_equal([[0.0, 1.0]], cg.loadLimits('lorenz', (10, 28, 8 / 3))))
+
+
+
+class ChaoticRandomSourceTestCases(unittest.TestCase):
+
+    def test_should_draw_numbers_in_the_unit_interval_with_the_requested_shape(self):
+        source = cg.ChaoticRandomSource('log', streams=16, block=8)
+
+        for shape in [(10, 3), (7,), (1, 1), (40, 30)]:
+            numbers = source.chaosPoints(shape, 1)
+
+            self.assertEqual(shape, numbers.shape)
+            self.assertTrue(((numbers >= 0) & (numbers <= 1)).all())
+
+    def test_should_draws_be_deterministic_under_a_seed(self):
+        np.random.seed(3)
+        first = cg.ChaoticRandomSource('tent', streams=8, block=4)
+        np.random.seed(3)
+        second = cg.ChaoticRandomSource('tent', streams=8, block=4)
+
+        self.assertTrue(np.array_equal(first.chaosPoints((5, 4), 1), second.chaosPoints((5, 4), 1)))
+        self.assertTrue(np.array_equal(first.chaosPoints((5, 4), 2), second.chaosPoints((5, 4), 2)))
+
+    def test_should_neighbouring_numbers_come_from_different_streams(self):
+        np.random.seed(5)
+        source = cg.ChaoticRandomSource('tent', streams=8, block=4)
+        np.random.seed(5)
+        generator = cg.Tent((8,), cascade=False)
+
+        numbers = source.chaosPoints((4, 8), 1)
+
+        # Row t holds the t-th iterate of the 8 streams
+        self.assertTrue(np.array_equal(np.array([generator.evolve(0) for _ in range(4)]), numbers))
+
+    def test_should_draws_across_block_boundaries_continue_the_sequence(self):
+        np.random.seed(7)
+        whole = cg.ChaoticRandomSource('henon', streams=6, block=5).chaosPoints((100,), 1)
+        np.random.seed(7)
+        source = cg.ChaoticRandomSource('henon', streams=6, block=5)
+
+        parts = [source.chaosPoints((size,), 1) for size in (1, 29, 30, 4, 36)]
+
+        self.assertTrue(np.array_equal(whole, np.concatenate(parts)))
+        self.assertEqual(10, source.offsets[0])
+
+    def test_should_generators_be_independent(self):
+        np.random.seed(11)
+        source = cg.ChaoticRandomSource('tent', streams=8, block=4)
+        first = source.chaosPoints((4, 8), 1)
+
+        np.random.seed(11)
+        other = cg.ChaoticRandomSource('tent', streams=8, block=4)
+        other.chaosPoints((4, 8), 2)
+
+        self.assertTrue(np.array_equal(first, other.chaosPoints((4, 8), 1)))
+
+    def test_should_raise_an_exception_if_the_map_is_unknown(self):
+        with self.assertRaises(Exception):
+            cg.ChaoticRandomSource('beach')
+
+
+
+class LorenzTestCases(unittest.TestCase):
+
+    def test_should_batched_rk4_follow_the_odeint_integration(self):
+        np.random.seed(1)
+        generator = cg.Lorenz((3, 2), cascade=False, gens=1)
+        states = generator.getCgens()[0]
+
+        generator.evolveT(0, 20)
+
+        # Previous implementation: every (particle, dimension) cell integrated on its own with odeint
+        for _ in range(20):
+            for index in np.ndindex(states.shape[:-1]):
+                states[index] = odeint(cg.Lorenz.lorenz, states[index], [0, generator.h], args=generator.params)[-1]
+
+        # The fixed-step RK4 error is small compared with the extent of the attractor (about 50)
+        self.assertTrue(np.allclose(states, generator.cgens[0], rtol=1e-4, atol=1e-2))
+
+    def test_should_prerolled_generators_move_along_the_shared_trajectory(self):
+        np.random.seed(2)
+        generator = cg.Lorenz((4, 3), cascade=False, preroll=500)
+
+        self.assertNotIn('trajectory', vars(generator))
+        self.assertEqual((500, 3), generator.prerolled.shape)
+        self.assertEqual((2, 4, 3, 3), generator.cgens.shape)
+
+        positions = np.copy(generator.positions)
+        for _ in range(3):
+            numbers = generator.chaosPoints(1)
+
+            self.assertEqual((4, 3), numbers.shape)
+            self.assertTrue(((numbers > 0) & (numbers < 1)).all())
+
+        self.assertTrue(np.array_equal((positions[0] + 3) % 500, generator.positions[0]))
+        self.assertTrue(np.array_equal(positions[1], generator.positions[1]))
+        self.assertTrue(np.array_equal(generator.prerolled[generator.positions], generator.cgens))
+
+
+
+def previous_inverse_le_parameters(le: float, eps: float = 1e-4) -> tuple:
+    """ Number of branches and parameters p found with brentq, as InverseLE did before solving them in batch. """
+    if le < np.log(2):
+        n = 2
+        lep = lambda p: le + p * np.log(p) + (1 - p) * np.log(1 - p)
+    else:
+        n = int(np.ceil(np.exp(le)))
+        lep = lambda p: le - (n - 2) / n * np.log(n) + p * np.log(p) + (2 / n - p) * np.log(2 / n - p)
+
+    return n, [brentq(lep, eps, 1 / n - eps), brentq(lep, 1 / n + eps, 2 / n - eps)]
+
+
+def previous_branch_map(x: float, n: int, p: float) -> float:
+    """ Map of InverseLE evaluated on a scalar, as before it was evaluated over arrays. """
+    if n == 2:
+        return x / p if x <= p else (1 - x) / (1 - p)
+
+    nx = n * x
+    nums = np.arange(0, n - 2)
+    sub = nums[np.argmin(np.where(nx - nums > 0, nx - nums, n))]
+
+    if sub < n - 3 or nx < n - 2:
+        return nx - sub
+    elif nx < n - 2 + p * n:
+        return (nx - (sub + 1)) / (n * p)
+    else:
+        return (nx - (sub + 1) - n * p) / (2 - n * p)
+
+
+class InverseLETestCases(unittest.TestCase):
+
+    def test_should_solve_find_the_parameters_of_the_previous_root_finder(self):
+        les = [0.3, 0.6, 0.9, 1.28991999999, np.log(3), 2.0, 3.2]
+
+        n, plist = cg.InverseLE.solve(les)
+
+        for index, le in enumerate(les):
+            expected_n, expected_p = previous_inverse_le_parameters(le)
+
+            self.assertEqual(expected_n, n[index])
+            self.assertTrue(np.allclose(expected_p, plist[index], rtol=0, atol=1e-9))
+
+    def test_should_solve_return_the_tangent_solution_if_the_exponent_is_the_log_of_an_integer(self):
+        # brentq failed for these exponents, as the root 1/n is not bracketed
+        for le, n in [(np.log(2), 2), (np.log(4), 4), (np.log(5), 5)]:
+            solved_n, plist = cg.InverseLE.solve(le)
+
+            self.assertEqual(n, solved_n)
+            self.assertTrue(np.allclose([1 / n - 1e-4, 1 / n + 1e-4], plist))
+
+    def test_should_branch_map_be_the_previous_map(self):
+        grid = np.linspace(0, 1, 1001)
+
+        for le in [0.3, 0.9, 1.28991999999, 2.0, 3.2]:
+            n, plist = previous_inverse_le_parameters(le)
+            for p in plist:
+                expected = [previous_branch_map(x, n, p) for x in grid]
+
+                self.assertTrue(np.allclose(expected, cg.InverseLE.branchMap(grid, n, p), rtol=0, atol=1e-12))
+
+    def test_should_generator_use_the_tent_map_if_the_exponent_is_log_2(self):
+        np.random.seed(4)
+        generator = cg.InverseLE((5, 3), le=np.log(2))
+        x = generator.getCgens()[0]
+
+        generator.evolve(0)
+
+        self.assertTrue(np.allclose(np.where(x <= 0.49999, x / 0.49999, (1 - x) / (1 - 0.49999)), generator.cgens[0]))
+
+
+
+def previous_chaos_points(generator: cg.ChaosGenerator, gno: int) -> np.ndarray:
+    """ Numbers of ChaosGenerator.chaosPoints as computed before they were generated ahead into a buffer. """
+    if gno == 0:
+        return np.array([previous_chaos_points(generator, i + 1) for i in range(generator.gens)])
+    if generator.cascade:
+        return np.array([generator.evolve(gno - 1) for _ in range(generator.oshape[0])])
+
+    return generator.evolve(gno - 1)
+
+
+class ChaosGeneratorTestCases(unittest.TestCase):
+
+    def test_should_every_map_return_the_same_sequence_as_before(self):
+        requests = [1, 2, 1, 0, 1, 1, 2, 2, 2, 0, 1, 2, 0, 0, 1, 2, 1, 2, 1, 2]
+
+        for name in ['log', 'lorenz', 'tent', 'henon', 'baker', 'inverse']:
+            for cascade in [True, False]:
+                np.random.seed(6)
+                generator = cg.cgen[name]((5, 3), cascade=cascade, ahead=2)
+                np.random.seed(6)
+                reference = cg.cgen[name]((5, 3), cascade=cascade, ahead=2)
+
+                for gno in requests:
+                    with self.subTest(map=name, cascade=cascade, gno=gno):
+                        self.assertTrue(np.array_equal(previous_chaos_points(reference, gno),
+                                                       generator.chaosPoints(gno)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,22 @@
 import unittest
 from math import sqrt
 
+import numpy as np
+
+from jmetal.core.population import Population
 from jmetal.core.solution import Solution
-from jmetal.util.density_estimator import CrowdingDistance, KNearestNeighborDensityEstimator
+from jmetal.util.density_estimator import CrowdingDistance, KNearestNeighborDensityEstimator, crowding_distances, \
+    k_nearest_neighbor_distances, IncrementalCrowdingDistance
+
+
+def create_solutions(points):
+    solutions = []
+    for point in points:
+        solution = Solution(2, len(point))
+        solution.objectives = list(point)
+        solutions.append(solution)
+
+    return solutions
 
 
 class CrowdingDistanceTestCases(unittest.TestCase):
@@ -88,6 +102,70 @@ class CrowdingDistanceTestCases(unittest.TestCase):
         self.assertGreater(value_from_solution3, value_from_solution4)
 
 
+    def test_should_crowding_distances_return_the_array_of_distances(self):
+        points = [[0.0, 4.0], [1.0, 2.0], [3.0, 1.0], [4.0, 0.0]]
+
+        distances = crowding_distances(points)
+
+        self.assertEqual([float('inf'), 1.5, 1.25, float('inf')], distances.tolist())
+
+    def test_should_the_crowding_distance_be_set_in_the_columns_of_a_population(self):
+        population = Population([0.0], [1.0], 2, size=4)
+        population.objectives[:] = [[0.0, 4.0], [1.0, 2.0], [3.0, 1.0], [4.0, 0.0]]
+
+        self.crowding.compute_density_estimator(population)
+
+        self.assertEqual([float('inf'), 1.5, 1.25, float('inf')], population.columns['crowding_distance'].tolist())
+
+    def test_should_remove_update_the_crowding_distance_of_the_remaining_solutions(self):
+        points = np.random.default_rng(0).random((20, 3))
+        solution_list = create_solutions(points)
+
+        self.crowding.compute_density_estimator(solution_list)
+        self.crowding.remove(solution_list, 4)
+        distances = self.crowding.remove(solution_list, 0)
+
+        expected = crowding_distances(np.delete(points, [0, 4], axis=0))
+        self.assertEqual(18, len(solution_list))
+        self.assertEqual(expected.tolist(), distances.tolist())
+        self.assertEqual(expected.tolist(), [solution.attributes['crowding_distance'] for solution in solution_list])
+
+
+class IncrementalCrowdingDistanceTestCases(unittest.TestCase):
+
+    def test_should_distances_be_the_crowding_distances_of_the_current_solutions(self):
+        random = np.random.default_rng(0)
+
+        for number_of_objectives in range(1, 4):
+            crowding_distance = IncrementalCrowdingDistance()
+            solutions = []
+            for point in random.random((60, number_of_objectives)):
+                solution = create_solutions([point])[0]
+                crowding_distance.add(solution)
+                solutions.append(solution)
+
+                if random.random() < 0.4 and len(solutions) > 1:
+                    crowding_distance.remove(solutions.pop(int(random.integers(len(solutions)))))
+
+                crowding_distance.assign()
+                expected = crowding_distances([solution.objectives for solution in solutions])
+
+                self.assertEqual(expected.tolist(),
+                                 [solution.attributes['crowding_distance'] for solution in solutions])
+                self.assertTrue(crowding_distance.most_crowded() is solutions[int(np.argmin(expected))])
+
+    def test_should_synchronize_add_and_remove_the_changed_solutions(self):
+        solutions = create_solutions([[0.0, 3.0], [1.0, 2.0], [2.0, 1.5], [3.0, 0.0]])
+        crowding_distance = IncrementalCrowdingDistance()
+        crowding_distance.synchronize(solutions[:3])
+
+        crowding_distance.synchronize(solutions[1:])
+
+        self.assertEqual(3, len(crowding_distance))
+        self.assertFalse(crowding_distance.remove(solutions[0]))
+        self.assertTrue(crowding_distance.most_crowded() is solutions[2])
+
+
 class KNearestNeighborDensityEstimatorTest(unittest.TestCase):
 
     def setUp(self):
@@ -122,6 +200,23 @@ class KNearestNeighborDensityEstimatorTest(unittest.TestCase):
 
         # self.knn.sort(solution_list)
 
+    def test_should_the_density_estimator_return_the_distances(self):
+        solution_list = create_solutions([[1, 5], [2, 4], [3, 3], [5, 1]])
+
+        densities = self.knn.compute_density_estimator(solution_list)
+
+        self.assertEqual([sqrt(2), sqrt(2), sqrt(2), sqrt(8)], densities.tolist())
+
+    def test_should_the_density_estimator_of_k_solutions_be_infinity_and_release_the_previous_ones(self):
+        self.knn.compute_density_estimator(create_solutions([[1, 5], [2, 4], [3, 3]]))
+        solution_list = create_solutions([[1, 5]])
+
+        densities = self.knn.compute_density_estimator(solution_list)
+
+        self.assertEqual([float('inf')], densities.tolist())
+        self.assertNotIn('knn_density', solution_list[0].attributes)
+        self.assertEqual([], self.knn.solutions)
+
     def test_should_the_density_estimator_sort_the_solution_list(self):
         """
          5 1
@@ -211,6 +306,36 @@ class KNearestNeighborDensityEstimatorTest(unittest.TestCase):
 
         self.assertEqual([0.1028341459863098, 4.9409270526888935], population[4].objectives)
 
+    def test_should_the_kd_tree_and_the_distance_matrix_give_the_same_densities(self):
+        points = np.random.default_rng(0).random((KNearestNeighborDensityEstimator.KD_TREE_SIZE + 1, 3))
+
+        densities = k_nearest_neighbor_distances(points, 2)
+
+        distances = np.sqrt(((points[:, None, :] - points[None, :, :]) ** 2).sum(axis=2))
+        self.assertTrue(np.allclose(np.sort(distances, axis=1)[:, 2], densities))
+
+    def test_should_remove_give_the_same_densities_and_order_as_computing_them_again(self):
+        points = np.random.default_rng(0).integers(0, 4, (30, 2))
+        solution_list = create_solutions(points)
+        expected_list = create_solutions(points)
+        knn = KNearestNeighborDensityEstimator(2)
+        incremental_knn = KNearestNeighborDensityEstimator(2)
+
+        knn.compute_density_estimator(expected_list)
+        incremental_knn.compute_density_estimator(solution_list)
+        while len(solution_list) > 10:
+            knn.sort(expected_list)
+            del expected_list[-1]
+            knn.compute_density_estimator(expected_list)
+
+            incremental_knn.sort(solution_list)
+            incremental_knn.remove(solution_list, len(solution_list) - 1)
+
+            self.assertEqual([solution.objectives for solution in expected_list],
+                             [solution.objectives for solution in solution_list])
+            self.assertEqual([solution.attributes['knn_density'] for solution in expected_list],
+                             [solution.attributes['knn_density'] for solution in solution_list])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,14 @@
+import os
+import tempfile
 import unittest
 
+import numpy as np
+
 from jmetal.core.problem import FloatProblem
 from jmetal.core.solution import FloatSolution
-from jmetal.util.evaluator import SequentialEvaluator, MapEvaluator
+from jmetal.problem import ZDT1, ZDT2, DTLZ1
+from jmetal.problem.singleobjective.knapsack import Knapsack
+from jmetal.util.evaluator import SequentialEvaluator, MapEvaluator, MultiprocessEvaluator, CachingEvaluator
 
 
 class MockedProblem(FloatProblem):
@@ -29,6 +35,18 @@ class MockedProblem(FloatProblem):
         pass
 
 
+class MockedBatchProblem(MockedProblem):
+
+    def __init__(self, number_of_variables: int = 3):
+        super(MockedBatchProblem, self).__init__(number_of_variables)
+        self.number_of_batch_calls = 0
+
+    def evaluate_batch(self, x: np.ndarray):
+        self.number_of_batch_calls += 1
+
+        return np.column_stack((x.sum(axis=1), x[:, 0])), None
+
+
 class SequentialEvaluatorTestCases(unittest.TestCase):
 
     def setUp(self):
@@ -55,6 +73,16 @@ class SequentialEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(1.2, problem_list[i].objectives[0])
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
+    def test_should_evaluate_a_list_with_a_single_batch_call_if_the_problem_supports_it(self):
+        problem = MockedBatchProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        self.evaluator.evaluate(problem_list, problem)
+
+        self.assertEqual(1, problem.number_of_batch_calls)
+        for solution in problem_list:
+            self.assertEqual([sum(solution.variables), solution.variables[0]], solution.objectives)
+
 
 class ParallelEvaluatorTestCases(unittest.TestCase):
 
@@ -82,6 +110,176 @@ class ParallelEvaluatorTestCases(unittest.TestCase):
             self.assertEqual(1.2, problem_list[i].objectives[0])
             self.assertEqual(2.3, problem_list[i].objectives[1])
 
+    def test_should_map_chunked_return_the_results_in_order(self):
+        results = self.evaluator.map_chunked(abs, range(-50, 50), chunk_size=7)
+
+        self.assertEqual([abs(x) for x in range(-50, 50)], results)
+
+    def test_should_the_chunk_size_follow_the_measured_latency(self):
+        evaluator = MapEvaluator(processes=2, target_chunk_time=0.01)
+
+        self.assertEqual(13, evaluator.get_chunk_size(100))
+
+        evaluator.record_latency(1.0, 1000)
+        self.assertEqual(10, evaluator.get_chunk_size(100))
+
+        evaluator.map_chunked(abs, range(100))
+        self.assertIsNotNone(evaluator.latency)
+        evaluator.close()
+
+    def test_should_the_context_manager_close_the_evaluator(self):
+        with MapEvaluator(processes=2) as evaluator:
+            evaluator.evaluate([self.problem.create_solution()], self.problem)
+
+        with self.assertRaises(RuntimeError):
+            evaluator.map_chunked(abs, range(10))
+
+
+class MockedSumProblem(MockedProblem):
+
+    def evaluate(self, solution: FloatSolution):
+        solution.objectives[0] = sum(solution.variables)
+        solution.objectives[1] = solution.variables[0]
+
+        return solution
+
+
+class MultiprocessEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.evaluator = MultiprocessEvaluator(processes=2, chunk_size=3)
+
+    def tearDown(self):
+        self.evaluator.close()
+
+    def test_should_evaluate_the_solutions_in_place(self):
+        problem = MockedSumProblem()
+        problem_list = [problem.create_solution() for _ in range(10)]
+
+        evaluated_list = self.evaluator.evaluate(problem_list, problem)
+
+        self.assertIs(problem_list, evaluated_list)
+        for solution in problem_list:
+            self.assertAlmostEqual(sum(solution.variables), solution.objectives[0])
+            self.assertEqual(solution.variables[0], solution.objectives[1])
+
+    def test_should_evaluate_a_population_in_batch(self):
+        problem = MockedBatchProblem()
+        population = problem.create_population(10)
+
+        self.evaluator.evaluate(population, problem)
+        self.evaluator.evaluate(population, problem)
+
+        self.assertTrue(np.allclose(population.variables.sum(axis=1), population.objectives[:, 0]))
+        self.assertTrue(np.array_equal(population.variables[:, 0], population.objectives[:, 1]))
+
+
+class MockedCountingProblem(MockedSumProblem):
+
+    def __init__(self, number_of_variables: int = 3):
+        super(MockedCountingProblem, self).__init__(number_of_variables)
+        self.number_of_evaluations = 0
+
+    def evaluate(self, solution: FloatSolution):
+        self.number_of_evaluations += 1
+
+        return super(MockedCountingProblem, self).evaluate(solution)
+
+    def get_name(self) -> str:
+        return 'Mocked counting problem'
+
+
+class CachingEvaluatorTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.problem = MockedCountingProblem()
+        self.evaluator = CachingEvaluator(decimals=6)
+
+    def test_should_not_evaluate_again_the_same_variables(self):
+        solution = self.problem.create_solution()
+        duplicate = self.problem.create_solution()
+        duplicate.variables = [value + 1e-9 for value in solution.variables]
+
+        self.evaluator.evaluate([solution, duplicate], self.problem)
+        evaluated_list = self.evaluator.evaluate([duplicate.__copy__()], self.problem)
+
+        self.assertEqual(1, self.problem.number_of_evaluations)
+        self.assertEqual(solution.objectives, evaluated_list[0].objectives)
+        self.assertEqual(2, self.evaluator.hits)
+        self.assertEqual(1, self.evaluator.misses)
+        self.assertAlmostEqual(2 / 3, self.evaluator.hit_rate)
+
+    def test_should_evict_the_least_recently_used_entries(self):
+        evaluator = CachingEvaluator(max_size=2)
+        first, second, third = [self.problem.create_solution() for _ in range(3)]
+
+        evaluator.evaluate([first, second], self.problem)
+        evaluator.evaluate([first, third], self.problem)
+        evaluator.evaluate([second], self.problem)
+
+        self.assertEqual(4, self.problem.number_of_evaluations)
+
+    def test_should_evaluate_a_population_with_duplicates(self):
+        population = self.problem.create_population(4)
+        population.variables[2] = population.variables[0]
+
+        self.evaluator.evaluate(population, self.problem)
+
+        self.assertEqual(3, self.problem.number_of_evaluations)
+        self.assertTrue(np.allclose(population.variables.sum(axis=1), population.objectives[:, 0]))
+
+    def test_should_not_share_the_entries_between_problems(self):
+        zdt1, zdt2 = ZDT1(), ZDT2()
+        solution = zdt1.create_solution()
+        expected = zdt2.evaluate(solution.__copy__()).objectives
+
+        self.evaluator.evaluate([solution.__copy__()], zdt1)
+        evaluated_list = self.evaluator.evaluate([solution.__copy__()], zdt2)
+
+        self.assertEqual(0, self.evaluator.hits)
+        self.assertTrue(np.allclose(expected, evaluated_list[0].objectives))
+        self.assertNotEqual(self.evaluator.get_problem_key(DTLZ1(number_of_objectives=2)),
+                            self.evaluator.get_problem_key(DTLZ1(number_of_objectives=3)))
+
+    def test_should_not_share_the_entries_between_instances_with_different_parameters(self):
+        weights = [1, 2, 3, 4, 5]
+
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, 'cache.db')
+            first = Knapsack(number_of_items=5, capacity=10, weights=weights, profits=[1, 2, 3, 4, 5])
+            second = Knapsack(number_of_items=5, capacity=10, weights=weights, profits=[10, 20, 30, 40, 50])
+            solution = first.create_solution()
+            solution.variables[0] = [True, True, True, False, False]
+
+            with CachingEvaluator(database=database) as evaluator:
+                self.assertEqual([-6.0], evaluator.evaluate([solution.__copy__()], first)[0].objectives)
+                self.assertEqual([-60.0], evaluator.evaluate([solution.__copy__()], second)[0].objectives)
+
+            with CachingEvaluator(database=database) as evaluator:
+                second = Knapsack(number_of_items=5, capacity=10, weights=weights, profits=[10, 20, 30, 40, 50])
+                self.assertEqual([-60.0], evaluator.evaluate([solution.__copy__()], second)[0].objectives)
+                self.assertEqual(1, evaluator.disk_hits)
+
+    def test_should_keep_the_entries_in_the_database(self):
+        solutions = [self.problem.create_solution() for _ in range(3)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            database = os.path.join(directory, 'cache.db')
+            with CachingEvaluator(database=database) as evaluator:
+                evaluator.evaluate(solutions, self.problem)
+
+            # The problem of the next run is a new instance, with the same parameters
+            problem = MockedCountingProblem()
+            with CachingEvaluator(database=database) as evaluator:
+                evaluated_list = evaluator.evaluate([solution.__copy__() for solution in solutions], problem)
+
+                self.assertEqual(3, evaluator.disk_hits)
+
+        self.assertEqual(3, self.problem.number_of_evaluations)
+        self.assertEqual(0, problem.number_of_evaluations)
+        for solution, evaluated in zip(solutions, evaluated_list):
+            self.assertEqual(solution.objectives, evaluated.objectives)
+
 
 if __name__ == "__main__":
     unittest.main()
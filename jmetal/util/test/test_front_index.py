@@ -0,0 +1,79 @@
+import unittest
+
+import numpy as np
+
+from jmetal.util.front_index import create_front_index, non_dominated_indices, NDTreeFrontIndex, \
+    TwoObjectiveFrontIndex
+
+
+def brute_force_non_dominated_indices(points) -> list:
+    """ Non-dominated rows, keeping the first one of repeated rows. """
+    indices = []
+    for i in range(len(points)):
+        if not any(np.all(points[j] <= points[i]) and (np.any(points[j] < points[i]) or j < i)
+                   for j in range(len(points)) if j != i):
+            indices.append(i)
+
+    return indices
+
+
+class FrontIndexTestCases(unittest.TestCase):
+
+    def test_should_create_a_skyline_for_two_objectives_and_an_nd_tree_otherwise(self):
+        self.assertTrue(isinstance(create_front_index(2), TwoObjectiveFrontIndex))
+        self.assertTrue(isinstance(create_front_index(3), NDTreeFrontIndex))
+
+    def test_should_update_reject_dominated_and_repeated_points(self):
+        for number_of_objectives in range(2, 5):
+            index = create_front_index(number_of_objectives)
+            first, second = object(), object()
+
+            self.assertEqual([], index.update(np.ones(number_of_objectives), first))
+            self.assertIsNone(index.update(np.ones(number_of_objectives), second))
+            self.assertIsNone(index.update(np.full(number_of_objectives, 2.0), second))
+            self.assertEqual([first], index.update(np.zeros(number_of_objectives), second))
+            self.assertEqual([second], index.items())
+
+    def test_should_keep_the_non_dominated_points_of_a_sequence(self):
+        random = np.random.default_rng(0)
+
+        for number_of_objectives in range(1, 6):
+            # Integer points close to a hyperplane, so that there are repeated points and values and most of them are
+            # non-dominated (the leaves of the tree are split)
+            points = random.integers(0, 8, (300, number_of_objectives)).astype(float)
+            points[:, -1] = 8 * (number_of_objectives - 1) - points[:, :-1].sum(axis=1) + random.integers(0, 3, 300)
+            items = list(range(len(points)))
+            index = create_front_index(number_of_objectives)
+            for point, item in zip(points, items):
+                index.update(point, item)
+
+            self.assertEqual(brute_force_non_dominated_indices(points), sorted(index.items()))
+            self.assertEqual(len(index.items()), len(index))
+
+            for point in random.integers(0, 8, (30, number_of_objectives)):
+                self.assertEqual(bool(np.any(np.all(points <= point, axis=1))), index.is_weakly_dominated(point))
+
+    def test_should_remove_delete_only_the_given_item(self):
+        for number_of_objectives in range(2, 5):
+            points = np.random.default_rng(1).random((200, number_of_objectives))
+            points /= np.linalg.norm(points, axis=1)[:, None]
+            index = create_front_index(number_of_objectives)
+            for item, point in enumerate(points):
+                index.update(point, item)
+
+            items = index.items()
+            self.assertTrue(index.remove(items[0]))
+            self.assertFalse(index.remove(items[0]))
+            self.assertEqual(sorted(items[1:]), sorted(index.items()))
+
+    def test_should_non_dominated_indices_keep_the_first_of_repeated_rows(self):
+        random = np.random.default_rng(2)
+
+        for number_of_objectives in range(1, 6):
+            points = random.integers(0, 6, (700, number_of_objectives)).astype(float)
+
+            self.assertEqual(brute_force_non_dominated_indices(points), non_dominated_indices(points).tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
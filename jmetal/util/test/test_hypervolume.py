@@ -0,0 +1,80 @@
+import itertools
+import unittest
+
+import numpy as np
+
+from jmetal.core.quality_indicator import HyperVolume
+from jmetal.util.hypervolume import hypervolume, hypervolume_contributions, monte_carlo_hypervolume
+
+
+def inclusion_exclusion_hypervolume(points, reference_point) -> float:
+    points = [point for point in points if np.all(point < reference_point)]
+
+    volume = 0.0
+    for size in range(1, len(points) + 1):
+        for subset in itertools.combinations(points, size):
+            volume += (-1) ** (size + 1) * np.prod(reference_point - np.max(subset, axis=0))
+
+    return volume
+
+
+class HypervolumeTestCases(unittest.TestCase):
+
+    def test_should_hypervolume_of_an_empty_set_be_zero(self):
+        self.assertEqual(0.0, hypervolume(np.zeros((0, 3)), [1.0, 1.0, 1.0]))
+
+    def test_should_hypervolume_ignore_the_points_not_dominating_the_reference_point(self):
+        points = [[0.5, 0.5], [1.0, 0.0], [2.0, 0.2]]
+
+        self.assertEqual(0.25, hypervolume(points, [1.0, 1.0]))
+
+    def test_should_hypervolume_return_the_right_value_with_two_objectives(self):
+        points = [[1.0, 3.0], [2.0, 2.0], [3.0, 1.0], [2.5, 2.5]]
+
+        self.assertEqual(6.0, hypervolume(points, [4.0, 4.0]))
+
+    def test_should_the_exact_hypervolume_be_right_for_several_numbers_of_objectives(self):
+        random = np.random.default_rng(0)
+
+        for number_of_objectives in range(1, 6):
+            for _ in range(10):
+                # Integer points, so that there are repeated points and values
+                points = random.integers(0, 4, (8, number_of_objectives)).astype(float)
+                reference_point = np.full(number_of_objectives, 3.5)
+
+                self.assertAlmostEqual(inclusion_exclusion_hypervolume(points, reference_point),
+                                       hypervolume(points, reference_point, 'exact'))
+
+    def test_should_contributions_be_the_hypervolume_lost_when_removing_each_point(self):
+        random = np.random.default_rng(1)
+
+        for number_of_objectives in range(2, 5):
+            points = random.integers(0, 4, (8, number_of_objectives)).astype(float)
+            reference_point = np.full(number_of_objectives, 3.5)
+
+            total = hypervolume(points, reference_point)
+            expected = [total - hypervolume(np.delete(points, i, axis=0), reference_point) for i in range(len(points))]
+
+            self.assertTrue(np.allclose(expected, hypervolume_contributions(points, reference_point)))
+
+    def test_should_monte_carlo_estimation_be_close_to_the_exact_hypervolume(self):
+        points = np.random.default_rng(2).random((20, 4))
+        reference_point = np.ones(4)
+
+        value, error = monte_carlo_hypervolume(points, reference_point, samples=200000, seed=1)
+
+        self.assertTrue(error > 0)
+        self.assertTrue(abs(value - hypervolume(points, reference_point, 'exact')) < 5 * error)
+
+    def test_should_the_indicator_estimate_the_hypervolume_with_many_objectives(self):
+        points = np.random.default_rng(3).random((20, 9))
+        indicator = HyperVolume(np.ones(9).tolist(), seed=1)
+
+        value = indicator.compute(points)
+
+        self.assertTrue(indicator.error > 0)
+        self.assertEqual(value, HyperVolume(np.ones(9).tolist(), seed=1).compute(points))
+
+
+if __name__ == '__main__':
+    unittest.main()
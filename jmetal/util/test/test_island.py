@@ -0,0 +1,71 @@
+import os
+import unittest
+
+from jmetal.algorithm.multiobjective.nsgaii import NSGAII
+from jmetal.operator import SBXCrossover, PolynomialMutation
+from jmetal.problem import ZDT1
+from jmetal.util.island import IslandModel, neighbours
+from jmetal.util.solution import get_non_dominated_solutions
+from jmetal.util.termination_criterion import StoppingByEvaluations
+
+
+def create_island(index: int) -> NSGAII:
+    return NSGAII(problem=ZDT1(number_of_variables=5),
+                  population_size=10,
+                  offspring_population_size=10,
+                  mutation=PolynomialMutation(1.0 / 5, 20),
+                  crossover=SBXCrossover(0.9, 20),
+                  termination_criterion=StoppingByEvaluations(200))
+
+
+def create_dying_island(index: int) -> NSGAII:
+    if index == 1:
+        # As if the process was killed: it exits without a result
+        os._exit(9)
+
+    return create_island(index)
+
+
+class IslandModelTestCases(unittest.TestCase):
+
+    def test_should_neighbours_follow_the_topology(self):
+        self.assertEqual([1], neighbours('ring', 0, 3))
+        self.assertEqual([0], neighbours('ring', 2, 3))
+        self.assertEqual([1, 2], neighbours('star', 0, 3))
+        self.assertEqual([0], neighbours('star', 2, 3))
+        self.assertIn(neighbours('random', 1, 3)[0], [0, 2])
+        self.assertEqual([], neighbours('ring', 0, 1))
+
+    def test_should_raise_an_exception_if_the_topology_is_unknown(self):
+        with self.assertRaises(Exception):
+            IslandModel(create_island, topology='mesh')
+
+    def test_should_merge_the_non_dominated_solutions_of_the_islands(self):
+        islands = IslandModel(create_island, number_of_islands=2, migration_interval=2, seed=1)
+        islands.run()
+
+        self.assertEqual(400, islands.evaluations)
+        self.assertEqual(2, len(islands.island_solutions))
+        self.assertTrue(len(islands.get_result()) > 0)
+        self.assertEqual(len(islands.get_result()), len(get_non_dominated_solutions(islands.get_result())))
+
+    def test_should_run_again_without_accumulating_the_previous_run(self):
+        islands = IslandModel(create_island, number_of_islands=2, migration_interval=2, seed=1)
+        islands.run()
+        islands.run()
+
+        self.assertEqual(400, islands.evaluations)
+        self.assertEqual(2, len(islands.island_solutions))
+
+    def test_should_raise_an_exception_if_an_island_dies_without_a_result(self):
+        islands = IslandModel(create_dying_island, number_of_islands=2)
+        islands.poll_interval = 0.1
+
+        with self.assertRaises(Exception) as context:
+            islands.run()
+
+        self.assertIn('Island 1 exited with code 9', str(context.exception))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import random
+import unittest
+
+import numpy as np
+
+from jmetal.core.solution import Solution
+from jmetal.util.comparator import DominanceComparator
+from jmetal.util.non_dominated_sorting import non_dominated_sort
+from jmetal.util.ranking import FastNonDominatedRanking
+
+ALGORITHMS = ['ens-ss', 'ens-bs', 'jensen-fortin']
+
+
+def pairwise_ranks(objectives: np.ndarray) -> np.ndarray:
+    dominates = np.all(objectives[:, None, :] <= objectives[None, :, :], axis=2) & \
+                np.any(objectives[:, None, :] < objectives[None, :, :], axis=2)
+
+    ranks = np.full(len(objectives), -1)
+    dominating_counter = dominates.sum(axis=0)
+    rank = 0
+    while (ranks < 0).any():
+        front = (ranks < 0) & (dominating_counter == 0)
+        ranks[front] = rank
+        dominating_counter -= dominates[front].sum(axis=0)
+        dominating_counter[front] = -1
+        rank += 1
+
+    return ranks
+
+
+class NonDominatedSortTestCases(unittest.TestCase):
+
+    def setUp(self):
+        self.random_generator = np.random.RandomState(1)
+
+    def test_should_sort_an_empty_matrix_return_an_empty_array(self):
+        self.assertEqual(0, len(non_dominated_sort(np.zeros((0, 3)))))
+
+    def test_should_raise_an_exception_if_the_algorithm_is_unknown(self):
+        with self.assertRaises(Exception):
+            non_dominated_sort(np.zeros((2, 2)), algorithm='unknown')
+
+    def test_should_all_the_algorithms_agree_with_the_pairwise_ranking(self):
+        for number_of_objectives in [2, 3, 5]:
+            for objectives in [self.random_generator.rand(300, number_of_objectives),
+                               self.random_generator.randint(0, 4, (300, number_of_objectives)).astype(float)]:
+                expected = pairwise_ranks(objectives)
+
+                for algorithm in ALGORITHMS + ['auto']:
+                    self.assertEqual(expected.tolist(), non_dominated_sort(objectives, algorithm=algorithm).tolist())
+
+    def test_should_two_objective_sorting_agree_with_the_pairwise_ranking(self):
+        objectives = self.random_generator.randint(0, 10, (500, 2)).astype(float)
+
+        self.assertEqual(pairwise_ranks(objectives).tolist(),
+                         non_dominated_sort(objectives, algorithm='two-objective').tolist())
+
+    def test_should_duplicated_rows_share_their_front(self):
+        objectives = np.array([[1.0, 2.0], [1.0, 2.0], [2.0, 3.0]])
+
+        self.assertEqual([0, 0, 1], non_dominated_sort(objectives).tolist())
+
+    def test_should_sorting_stop_once_k_rows_are_ranked(self):
+        objectives = self.random_generator.rand(200, 3)
+        expected = pairwise_ranks(objectives)
+        last_front = np.searchsorted(np.cumsum(np.bincount(expected)), 50)
+
+        for algorithm in ALGORITHMS:
+            ranks = non_dominated_sort(objectives, k=50, algorithm=algorithm)
+
+            self.assertEqual(np.where(expected > last_front, -1, expected).tolist(), ranks.tolist())
+
+    def test_should_constraint_violation_be_considered_before_dominance(self):
+        objectives = np.array([[1.0, 1.0], [0.0, 0.0], [0.0, 0.5], [2.0, 2.0]])
+        constraint_violation = np.array([0.0, -1.0, -0.5, 0.0])
+
+        self.assertEqual([0, 3, 2, 1], non_dominated_sort(objectives, constraint_violation=constraint_violation).tolist())
+
+
+class FastNonDominatedRankingWithSortingEngineTestCases(unittest.TestCase):
+
+    def test_should_ranking_agree_with_the_pairwise_comparator(self):
+        random.seed(1)
+        solutions = []
+        for _ in range(100):
+            solution = Solution(2, 3, 1)
+            solution.objectives = [random.randint(0, 5) for _ in range(3)]
+            solution.constraints = [random.choice([0.0, 0.0, -1.0])]
+            solutions.append(solution)
+
+        class PairwiseDominanceComparator(DominanceComparator):
+            pass
+
+        expected = FastNonDominatedRanking(PairwiseDominanceComparator())
+        expected.compute_ranking(solutions)
+        expected_ranks = [solution.attributes['dominance_ranking'] for solution in solutions]
+
+        for algorithm in ALGORITHMS:
+            ranking = FastNonDominatedRanking(algorithm=algorithm)
+            ranking.compute_ranking(solutions)
+
+            self.assertEqual(expected_ranks, [solution.attributes['dominance_ranking'] for solution in solutions])
+            self.assertEqual(expected.get_number_of_subfronts(), ranking.get_number_of_subfronts())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -159,6 +159,22 @@ class FastNonDominatedRankingTestCases(unittest.TestCase):
         self.assertEqual(solution, ranking[0][0])
         self.assertEqual(solution2, ranking[1][0])
 
+    def test_should_truncated_ranking_rank_the_solutions_left_out_after_the_computed_fronts(self):
+        solution1 = Solution(2, 2)
+        solution1.objectives = [1, 1]
+        solution2 = Solution(2, 2)
+        solution2.objectives = [2, 2]
+        solution3 = Solution(2, 2)
+        solution3.objectives = [3, 3]
+        solution3.attributes['dominance_ranking'] = 0
+
+        ranking = self.ranking.compute_ranking([solution1, solution2, solution3], k=1)
+
+        self.assertEqual(1, len(ranking))
+        self.assertEqual(0, solution1.attributes['dominance_ranking'])
+        self.assertEqual(1, solution2.attributes['dominance_ranking'])
+        self.assertEqual(1, solution3.attributes['dominance_ranking'])
+
 
 class StrengthRankingTestCases(unittest.TestCase):
 
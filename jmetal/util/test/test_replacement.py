@@ -1,9 +1,11 @@
 import unittest
 
+import numpy as np
+
 from jmetal.core.solution import Solution
 from jmetal.util.density_estimator import KNearestNeighborDensityEstimator
 from jmetal.util.ranking import StrengthRanking, FastNonDominatedRanking
-from jmetal.util.replacement import RankingAndDensityEstimatorReplacement
+from jmetal.util.replacement import RankingAndDensityEstimatorReplacement, RemovalPolicyType
 
 
 class RankingAndDensityEstimatorReplacementTestCases(unittest.TestCase):
@@ -167,7 +169,33 @@ class RankingAndDensityEstimatorReplacementTestCases(unittest.TestCase):
         for solution in result_list[5:9]:
             self.assertEqual(1, solution.attributes['dominance_ranking'])
 
+    def test_should_sequential_truncation_give_the_same_result_as_computing_the_densities_again(self):
+        class SmallHeadsDensityEstimator(KNearestNeighborDensityEstimator):
+            HEAD_SIZE = 2
+
+        # Non-dominated points with repeated distances
+        solution_list = []
+        for value in np.random.default_rng(0).integers(0, 20, 40).tolist():
+            solution = Solution(2, 2)
+            solution.objectives = [value, 20 - value]
+            solution_list.append(solution)
 
+        ranking = StrengthRanking()
+        ranking.compute_ranking(solution_list)
+        replacement = RankingAndDensityEstimatorReplacement(ranking, SmallHeadsDensityEstimator(1),
+                                                            RemovalPolicyType.SEQUENTIAL)
+        result_list = replacement.sequential_truncation(0, 10)
+
+        expected_list = list(ranking.get_subfront(0))
+        while len(expected_list) > 10:
+            density_estimator = KNearestNeighborDensityEstimator(1)
+            density_estimator.compute_density_estimator(expected_list)
+            density_estimator.sort(expected_list)
+            del expected_list[-1]
+
+        self.assertEqual(10, len(result_list))
+        self.assertEqual([solution.objectives for solution in expected_list],
+                         [solution.objectives for solution in result_list])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,54 @@
+import unittest
+from math import sqrt
+
+import numpy as np
+
+from jmetal.util.swarm import constriction_coefficient, momentum_constriction_coefficient, momentum_velocity, \
+    bounce_back
+
+
+class SwarmTestCases(unittest.TestCase):
+
+    def test_should_constriction_coefficients_be_those_of_each_particle(self):
+        def smpso_coefficient(c1, c2):
+            rho = c1 + c2
+            return 1.0 if rho <= 4 else 2.0 / (2.0 - rho - sqrt(pow(rho, 2.0) - 4.0 * rho))
+
+        def empso_coefficient(c1, c2, beta):
+            phi = c1 + c2
+            delta = pow(phi, 2) - 4 * (1 - beta) * phi
+            if delta < 0:
+                return 1
+            eigenvalue = (abs(phi - 2) + sqrt(delta)) / 2
+            return 1 if eigenvalue <= 1 else -1 / eigenvalue
+
+        values = np.round(np.linspace(0.5, 2.5, 21), 1)
+        c1, c2, beta = (grid.ravel() for grid in np.meshgrid(values, values, values / 2.5))
+
+        self.assertTrue(np.allclose([smpso_coefficient(*args) for args in zip(c1, c2)],
+                                    constriction_coefficient(c1, c2)))
+        self.assertTrue(np.allclose([empso_coefficient(*args) for args in zip(c1, c2, beta)],
+                                    momentum_constriction_coefficient(c1, c2, beta)))
+
+    def test_should_momentum_velocity_update_the_momentum_and_clip_the_velocity(self):
+        speed = np.array([[1.0, -1.0]])
+        momentum = np.array([[0.0, 0.0]])
+
+        new_speed = momentum_velocity(speed, momentum, np.array([[0.5, -0.5]]), 0.5, 1.0,
+                                      np.array([-0.8, -0.8]), np.array([0.8, 0.8]))
+
+        self.assertEqual([[0.5, -0.5]], momentum.tolist())
+        self.assertEqual([[0.8, -0.8]], new_speed.tolist())
+
+    def test_should_bounce_back_move_the_variables_to_the_bounds_and_change_their_velocity(self):
+        positions = np.array([[-2.0, 0.5, 3.0], [0.0, 1.5, 0.2]])
+        speed = np.array([[-1.0, 0.2, 2.0], [0.1, 1.0, 0.3]])
+
+        bounce_back(positions, speed, np.array([-1.0, 0.0, 0.0]), np.array([1.0, 1.0, 1.0]), -1, -0.5)
+
+        self.assertEqual([[-1.0, 0.5, 1.0], [0.0, 1.0, 0.2]], positions.tolist())
+        self.assertEqual([[1.0, 0.2, -1.0], [0.1, -0.5, 0.3]], speed.tolist())
+
+
+if __name__ == '__main__':
+    unittest.main()
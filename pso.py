@@ -9,9 +9,12 @@ def vclip (velocity, vmax) :
     #   for dim in dimensions :
     #       ratio = max (ratio, v[particle][dim]/vmax[dim])
     #   v[particle] /= ratio
+    #
+    # The dimensions are the last axis, so stacked swarms (R, Np, D) are
+    # clipped as well
     ######################################################################
     velocity /= (lambda x:np.where(x < 1, 1, x))\
-                (np.max(np.abs(velocity)/(vmax), axis=1, keepdims=True))
+                (np.max(np.abs(velocity)/(vmax), axis=-1, keepdims=True))
 
     return velocity
 
@@ -58,6 +61,20 @@ def ipcd (particles, velocity, llim, rlim, alpha=1.2) :
 
     return part, velocity
 
+def optPack (gbest, grad, tol, iters, particles, conv_curve, evals) :
+    """ Packs the results of an optimization as returned by the optimizers """
+
+    return {
+        'rets'      : (gbest, grad),
+        'kwrets'    : {
+            'iters'         : iters,
+            'no_conv'       : np.sum((np.abs(particles - gbest) < tol).all(axis=1)),
+            'particles'     : np.copy(particles),
+            'conv_curve'    : np.array(conv_curve),
+            'evals'         : evals
+        }
+    }
+
 class PSO () :
     """ Base class for a variety of PSO optimizers """
 
@@ -81,6 +98,12 @@ class PSO () :
         self.vmax = vrat*(rlim - llim).reshape(1,-1)              # Maximum velocity for velocity clipping
         self.conv_curve = []
 
+        # Cached fitness of the current positions and of pbest, and the number
+        # of objective function evaluations of the last optimization
+        self.pfit = None
+        self.pbest_fit = None
+        self.evals = 0
+
     def __str__ (self) :
         """ Optimizer descriptor """
         return "Vanilla PSO"
@@ -114,15 +137,39 @@ class PSO () :
             rand_points, self.velocities = self._initp(self.Np - legit_rad, self.Np)
             self.particles = np.concatenate([rad_points, rand_points], axis=0)
 
+    def fitness (self, X) :
+        """ Objective function values of the rows of X, counting the evaluations """
+
+        self.evals += len(X)
+        return self.obj(X)
+
+    def updateBests (self, pbest) :
+        """
+        Evaluates the current positions once and updates pbest and the cached
+        fitnesses with them. Returns the index of gbest in pbest
+        """
+
+        self.pfit = self.fitness(self.particles)
+        less = self.pfit < self.pbest_fit
+        pbest[less] = self.particles[less]
+        self.pbest_fit[less] = self.pfit[less]
+
+        return np.argmin(self.pbest_fit)
+
     def _optim_init (self) :
         """ Initialiser of certain state variables before the optimization loop """
 
         # Initialises swarm position and velocity
         self.initParticles()
+        self.evals = 0
+        self.pfit = self.fitness(self.particles)
+        self.pbest_fit = np.copy(self.pfit)
         pbest = np.copy(self.particles)
-        gbest = np.copy(min(pbest, key = self.objkey))
 
-        self.conv_curve = [self.objkey(gbest)]
+        gbest_ind = np.argmin(self.pbest_fit)
+        gbest = np.copy(pbest[gbest_ind])
+
+        self.conv_curve = [self.pbest_fit[gbest_ind]]
         return pbest, gbest
 
     def optimize (self, w=0.7, c1=1.7, c2=1.7, alpha=1.2,
@@ -148,10 +195,9 @@ class PSO () :
             self.particles, self.velocity = ipcd(self.particles, self.velocity, self.llim, self.rlim, alpha)
 
             # pbest, gbest update
-            less = self.obj(self.particles) < self.obj(pbest)
-            pbest[less] = np.copy(self.particles[less])
-            gbest = min(pbest , key=self.objkey)
-            self.conv_curve.append(self.objkey(gbest))
+            gbest_ind = self.updateBests(pbest)
+            gbest = pbest[gbest_ind]
+            self.conv_curve.append(self.pbest_fit[gbest_ind])
 
             i += 1
             if print_iters : print("\r{}".format(i), end="")
@@ -170,12 +216,90 @@ class PSO () :
         after completition of optimization loop
         """
 
-        return {
-            'rets'      : (gbest, grad),
-            'kwrets'    : {
-                'iters'         : iters,
-                'no_conv'       : np.sum((np.abs(self.particles - gbest) < tol).all(axis=1)),
-                'particles'     : np.copy(self.particles),
-                'conv_curve'    : np.array(self.conv_curve)
-            }
-        }
+        return optPack(gbest, grad, tol, iters, self.particles, self.conv_curve, self.evals)
+
+
+class StackedPSO (PSO) :
+    """
+    R independent swarms of plain PSO held in (R, Np, D) tensors and stepped
+    together. Every swarm checks its own stopping criteria and is dropped from
+    the tensors once it stops, so many small runs become one vectorized run
+    """
+
+    def __init__ (self, obj, llim, rlim, Np, R, vrat=0.1) :
+        """
+        Constructor of the stacked PSO optimizer -
+            R           - Number of independent swarms
+            The rest are defined in the base class PSO()
+        """
+
+        super().__init__(obj, llim, rlim, Np, vrat)
+        self.R = R
+
+    def __str__ (self) :
+        """ Optimizer descriptor """
+        return "Stacked PSO"
+
+    def optimize (self, w=0.7, c1=1.7, c2=1.7, alpha=1.2,
+                max_iters=10000, tol=1e-2,
+                print_iters=False) :
+        """
+        Optimization loop of plain PSO for all the swarms. Returns the list
+        of what PSO.optimize() returns for every swarm
+        """
+
+        R, Np, D = self.R, self.Np, self.D
+        fitness = lambda X : self.fitness(X.reshape(-1, D)).reshape(X.shape[:-1])
+        self.evals = 0
+
+        # Every swarm is initialised as in PSO._initp()
+        particles = self.llim + (self.rlim - self.llim)*np.random.rand(R, Np, D)
+        velocity = self.vrat*(self.rlim - self.llim)*(2*np.random.rand(R, Np, D) - 1)
+        pbest = np.copy(particles)
+
+        pbest_fit = fitness(pbest)
+        best = np.argmin(pbest_fit, axis=1)
+        gbest = pbest[np.arange(R), best]
+
+        # Swarms still running, and what is needed to pack their results
+        runs = np.arange(R)
+        conv_curves = [[f] for f in pbest_fit[np.arange(R), best]]
+        packs = [None]*R
+
+        i = 0
+        while len(runs) :
+            # Velocity update
+            r1, r2 = np.random.rand(*particles.shape), np.random.rand(*particles.shape)
+            velocity = w*velocity + c1*r1*(pbest - particles) + c2*r2*(gbest[:,None] - particles)
+
+            # Velocity clipping and boundary handling of all the particles at once
+            velocity = vclip(velocity, self.vmax)
+            particles, velocity = ipcd(particles.reshape(-1, D), velocity.reshape(-1, D), self.llim, self.rlim, alpha)
+            particles, velocity = particles.reshape(-1, Np, D), velocity.reshape(-1, Np, D)
+
+            # pbest, gbest update, evaluating every particle once
+            pfit = fitness(particles)
+            less = pfit < pbest_fit
+            pbest[less] = particles[less]
+            pbest_fit[less] = pfit[less]
+            best = np.argmin(pbest_fit, axis=1)
+            gbest = pbest[np.arange(len(runs)), best]
+            for run, f in zip(runs, pbest_fit[np.arange(len(runs)), best]) :
+                conv_curves[run].append(f)
+
+            i += 1
+            if print_iters : print("\r{}".format(i), end="")
+
+            # Stopping criteria of every swarm
+            stop = (np.abs(particles - gbest[:,None]) < tol).all(axis=(1, 2)) | (i == max_iters)
+            for k in np.flatnonzero(stop) :
+                grad = (lambda g, rs : lambda x : -(c1*np.sum(rs[0]) + c2*np.sum(rs[1]))*(x - g)/(Np*w))\
+                       (gbest[k], (r1[k], r2[k]))
+                packs[runs[k]] = optPack(gbest[k], grad, tol, i, particles[k], conv_curves[runs[k]], Np*(i + 1))
+
+            keep = np.invert(stop)
+            runs, particles, velocity, pbest, pbest_fit, gbest = \
+                runs[keep], particles[keep], velocity[keep], pbest[keep], pbest_fit[keep], gbest[keep]
+
+        if print_iters : print("\n", end="")
+        return packs